@@ -0,0 +1,114 @@
+"""
+도착 예정 프로세스 큐 (Arrival source)
+
+시뮬레이터는 (도착 시각, PID, 프로세스) 순서로 프로세스를 꺼내 Ready 큐에 넣습니다.
+(도착 시각이 같으면 PID 순서, 기존 heapq 방식과 같은 순서)
+
+    - 도착 순으로 정렬된 리스트: 힙 없이 앞에서부터 꺼냄 (deque)
+    - 정렬되지 않은 리스트: 힙으로 만들어 꺼냄
+    - 반복자/제너레이터 (e.g., process.iter_input_file): 도착 순이라고 보고, 시뮬레이션 시각이 다음 도착 시각에
+      이를 때마다 같은 시각에 도착하는 프로세스들만 읽어 옴. 아직 도착하지 않은 PCB를 미리 만들지 않으므로
+      입력이 수백만 줄이어도 메모리는 현재 살아 있는 프로세스 수에 비례합니다.
+      (순서가 어긋난 프로세스는 경고 후 힙에 넣으며, 도착 시각이 이미 지났으면 읽은 시각에 도착 처리)
+    - 실행 중 push()된 항목 (RM/EDF의 다음 주기 작업)은 힙에 들어갑니다.
+"""
+import collections
+import heapq
+
+from tracer import get_tracer, WARN
+
+INF = float('inf')
+
+
+class ArrivalQueue:
+    """
+    도착 시각 순으로 (도착 시각, PID, 프로세스)를 내주는 큐
+
+    :param tracer: 입력 순서 경고를 남길 Tracer (None이면 기본 Tracer)
+    """
+    def __init__(self, processes=(), tracer=None):
+        self.tracer = tracer if tracer is not None else get_tracer()
+        self.heap = []                        # 정렬되지 않은 항목 + push()된 항목 (최소 힙)
+        self.sorted = collections.deque()     # 도착 순으로 정렬된 항목
+        self.stream = None                    # 아직 읽지 않은 입력 (반복자, 다 읽으면 None)
+        self.lookahead = None                 # 스트림에서 미리 읽은 다음 시각의 첫 항목
+        self.last_arrival = -INF              # 스트림에서 마지막으로 읽은 도착 시각
+        self.warned = False
+
+        if isinstance(processes, (list, tuple)):
+            entries = [(proc.arrival_time, proc.pid, proc) for proc in processes]
+            if all(a[:2] <= b[:2] for a, b in zip(entries, entries[1:])):
+                self.sorted.extend(entries)
+            else:
+                self.heap = entries
+                heapq.heapify(self.heap)
+        else:
+            self.stream = iter(processes)
+        self.streaming = self.stream is not None  # 스트림 입력인지 (다 읽은 뒤에도 True)
+
+    def __bool__(self):
+        return self.next_time() != INF
+
+    def __iter__(self):
+        """
+        남은 항목들 (순서 보장 없음, 스트림에서 아직 읽지 않은 항목은 포함하지 않음)
+        """
+        yield from self.heap
+        yield from self.sorted
+
+    def next_time(self):
+        """다음 도착 시각 (없으면 inf)"""
+        if not self.sorted and self.stream is not None:
+            self._refill()
+        next_time = self.sorted[0][0] if self.sorted else INF
+        if self.heap and self.heap[0][0] < next_time:
+            next_time = self.heap[0][0]
+        return next_time
+
+    def pop(self):
+        """다음 도착 항목을 꺼냅니다. (next_time()으로 항목이 있는지 먼저 확인)"""
+        heap, ordered = self.heap, self.sorted
+        if heap and (not ordered or heap[0][:2] < ordered[0][:2]):
+            return heapq.heappop(heap)
+        return ordered.popleft()
+
+    def push(self, entry):
+        """(도착 시각, PID, 프로세스) 항목을 추가합니다."""
+        heapq.heappush(self.heap, entry)
+
+    def shift(self, delta):
+        """남은 항목의 도착 시각을 모두 delta만큼 옮깁니다. (순서는 그대로)"""
+        self.heap = [(arrival + delta, pid, proc) for arrival, pid, proc in self.heap]
+        self.sorted = collections.deque((arrival + delta, pid, proc) for arrival, pid, proc in self.sorted)
+
+    def _read(self):
+        """스트림에서 순서가 맞는 다음 항목을 읽습니다. (순서가 어긋난 항목은 힙으로, 끝나면 None)"""
+        for proc in self.stream:
+            entry = (proc.arrival_time, proc.pid, proc)
+            if entry[0] < self.last_arrival:
+                if not self.warned:
+                    self.tracer.emit(WARN, None, 'unsorted_arrivals',
+                                     "경고: 입력이 도착 시각 순으로 정렬되어 있지 않습니다. (P{pid}) "
+                                     "순서가 어긋난 프로세스는 늦게 도착 처리될 수 있습니다.", pid=proc.pid)
+                    self.warned = True
+                heapq.heappush(self.heap, entry)
+                continue
+            self.last_arrival = entry[0]
+            return entry
+        return None
+
+    def _refill(self):
+        """스트림에서 다음 도착 시각의 프로세스들을 PID 순으로 읽어 옵니다."""
+        entry = self.lookahead if self.lookahead is not None else self._read()
+        self.lookahead = None
+        batch = []
+        while entry is not None:
+            if batch and entry[0] != batch[0][0]:
+                self.lookahead = entry
+                break
+            batch.append(entry)
+            entry = self._read()
+        if self.lookahead is None:
+            self.stream = None  # 다 읽음
+        batch.sort(key=lambda e: e[1])
+        self.sorted.extend(batch)
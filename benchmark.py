@@ -0,0 +1,351 @@
+"""
+스케줄러 벤치마크
+
+8개 시뮬레이터를 시드가 고정된 워크로드에서 실행하고, run()의 실행 속도를 측정합니다.
+(run()을 고친 뒤 시뮬레이터가 빨라졌는지/느려졌는지 기준 결과와 비교하는 용도)
+
+워크로드:
+    - random-<N>   : 일반 프로세스 N개 (generate_vectorized_workload, BENCHMARK_WORKLOAD) -> FCFS, RR, SJF, Priority, MLFQ
+    - periodic-<N> : 실시간 프로세스 5개(monte_carlo.REALTIME_WORKLOAD), 시뮬레이션 시간 N x 10ms -> RM, EDF
+                     (작업 수를 늘리면 과부하가 되므로, 실시간은 시뮬레이션 시간으로 규모를 키움)
+    - sync-<이름>  : SYNC 시나리오 파일 (자원/교착상태 전략 포함) -> 일반 시뮬레이터 6개
+
+측정 항목 (시뮬레이터마다 새 Process로 실행, NULL_TRACER):
+    wall_s            : run() 실행 시간 (repeat회 중 최소)
+    ticks_per_s       : 초당 시뮬레이션 시각 (current_time / wall_s)
+    events_per_s      : 초당 상태 전이 수 (상태 타임라인 구간 수 / wall_s)
+    peak_kb           : 프로세스 생성 + run() 동안의 최대 메모리 (tracemalloc, 시간 측정과 별도 실행)
+    net_blocks        : run() 전후 할당된 메모리 블록 수의 차이 (sys.getallocatedblocks, 할당 횟수가 아닌 순증가분)
+    perf_counters     : --profile일 때만, 단계별 시간/호출 횟수와 큐 연산 횟수 (perf_counters, 별도 실행)
+
+사용법:
+    python benchmark.py run -o baseline.json                 # 기본 규모 (10, 1000, 100000)
+    python benchmark.py run --scales 10 1000 -o current.json --compare baseline.json
+    python benchmark.py compare baseline.json current.json --threshold 0.1
+    (compare는 느려진 항목이 있으면 종료 코드 1)
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from process import Workload, parse_input_file
+from simulator_fcfs import SimulatorFCFS
+from simulator_rr import SimulatorRR
+from simulator_sjf import SimulatorSJF
+from simulator_priority_static import SimulatorPriorityStatic
+from simulator_priority_dynamic import SimulatorPriorityDynamic
+from simulator_mlfq import SimulatorMLFQ
+from simulator_rm import SimulatorRM
+from simulator_edf import SimulatorEDF
+from generator import seed_generators, generate_vectorized_workload, generate_random_realtime_processes
+from monte_carlo import REALTIME_WORKLOAD
+from sync import ResourceManager
+from tracer import NULL_TRACER
+
+RESULT_VERSION = 1
+DEFAULT_SCALES = (10, 1_000, 100_000)
+DEFAULT_SEED = 20240601
+DEFAULT_REPEAT = 3
+RT_TICKS_PER_SCALE = 10  # periodic-<N>의 시뮬레이션 시간 = N x 10ms
+
+# random-<N> 워크로드 파라미터 (monte_carlo.NORMAL_WORKLOAD와 같되 도착 간격만 늘림)
+# 프로세스당 CPU 요구량이 평균 약 20ms이므로 25ms 간격이면 CPU 이용률이 약 80%로 유지됩니다.
+# (3ms 간격 그대로면 Ready 큐가 프로세스 수만큼 쌓여, 이벤트 처리 속도 대신 큐 길이에 따른 비용을 재게 됨)
+BENCHMARK_WORKLOAD = {
+    'arrival_lambda': 0.04,
+    'max_cpu_burst': 20,
+    'max_io_burst': 30,
+    'workload_distribution': {'cpu_bound': 0.3, 'io_bound': 0.4, 'mixed': 0.3},
+}
+
+REGRESSION_THRESHOLD = 0.10  # 10% 이상 느려지거나 메모리가 늘면 회귀
+MIN_WALL_DELTA = 0.002       # 이보다 작은 시간 차이는 측정 오차로 보고 무시 (초)
+
+# 일반 시뮬레이터 (이름 -> 생성 함수)
+NORMAL_SIMULATORS = {
+    'FCFS': lambda procs, res: SimulatorFCFS(procs, tracer=NULL_TRACER, resources=res),
+    'RR(Q=4)': lambda procs, res: SimulatorRR(procs, time_quantum=4, tracer=NULL_TRACER, resources=res),
+    'SJF': lambda procs, res: SimulatorSJF(procs, tracer=NULL_TRACER, resources=res),
+    'Priority(Static)': lambda procs, res: SimulatorPriorityStatic(procs, tracer=NULL_TRACER, resources=res),
+    'Priority(Dynamic)': lambda procs, res: SimulatorPriorityDynamic(procs, aging_factor=10, tracer=NULL_TRACER,
+                                                                     resources=res),
+    'MLFQ': lambda procs, res: SimulatorMLFQ(procs, tracer=NULL_TRACER, resources=res),
+}
+# 실시간 시뮬레이터 (이름 -> 생성 함수, horizon: 시뮬레이션 시간)
+REALTIME_SIMULATORS = {
+    'RM': lambda procs, res, horizon: SimulatorRM(procs, max_simulation_time=horizon, tracer=NULL_TRACER,
+                                                  resources=res),
+    'EDF': lambda procs, res, horizon: SimulatorEDF(procs, max_simulation_time=horizon, tracer=NULL_TRACER,
+                                                    resources=res),
+}
+
+# SYNC 시나리오 (이름 -> (입력 파일, 교착상태 전략)), main.py의 SYNC 메뉴와 같은 조합
+SYNC_SCENARIOS = {
+    'priority-inversion': ("producer_consumer.txt", 'prevention'),
+    'deadlock-prevention': ("deadlock_prevention.txt", 'prevention'),
+    'deadlock-avoidance': ("deadlock_avoidance.txt", 'avoidance'),
+    'deadlock-detection': ("deadlock_detection.txt", 'detection'),
+    'deadlock-recovery': ("deadlock_recovery.txt", 'detection'),
+}
+SYNC_RESOURCES = ["R1", "R2", "Buffer", "Printer", "File"]
+SCENARIO_DIR = os.path.dirname(os.path.abspath(__file__))  # 시나리오 파일 위치 (실행 위치와 무관하게)
+
+
+def measure(make_sim, repeat=DEFAULT_REPEAT, memory=True, profile=False):
+    """
+    시뮬레이터 하나를 측정합니다.
+
+    :param make_sim: 호출할 때마다 새 Process로 시뮬레이터를 만드는 함수
+    :param repeat: 시간 측정 반복 횟수 (최소 시간 사용)
+    :param memory: True면 tracemalloc으로 한 번 더 실행해 최대 메모리 측정 (시간 측정에는 포함되지 않음)
+    :param profile: True면 enable_profiling()으로 한 번 더 실행해 단계별 카운터(perf_counters)를 함께 저장
+    :return: 측정 결과 딕셔너리
+    """
+    best = None
+    for _ in range(max(1, repeat)):
+        sim = make_sim()
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        sim.run()
+        wall = time.perf_counter() - start
+        blocks = sys.getallocatedblocks() - blocks
+        if best is None or wall < best[0]:
+            best = (wall, blocks, sim.current_time, len(sim.timelines), len(sim.completed_processes))
+        del sim
+
+    wall, blocks, ticks, events, completed = best
+    result = {
+        'wall_s': wall,
+        'ticks': ticks,
+        'ticks_per_s': ticks / wall if wall > 0 else 0.0,
+        'events': events,
+        'events_per_s': events / wall if wall > 0 else 0.0,
+        'completed': completed,
+        'net_blocks': blocks,
+        'peak_kb': None,
+    }
+
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            sim = make_sim()
+            sim.run()
+            result['peak_kb'] = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+        del sim
+
+    if profile:
+        sim = make_sim()
+        sim.enable_profiling()
+        sim.run()
+        result['perf_counters'] = sim.perf_counters
+    return result
+
+
+def benchmark_cases(scales=DEFAULT_SCALES, seed=DEFAULT_SEED, sync=True):
+    """
+    (시뮬레이터 이름, 워크로드 이름, 시뮬레이터 생성 함수)를 차례로 만듭니다.
+    워크로드는 규모마다 seed로 고정해 생성하므로 같은 인자면 항상 같은 워크로드입니다.
+    """
+    for scale in scales:
+        seed_generators(seed + scale)
+        with contextlib.redirect_stdout(io.StringIO()):
+            workload = generate_vectorized_workload(scale, **BENCHMARK_WORKLOAD).to_workload()
+        for name, factory in NORMAL_SIMULATORS.items():
+            yield name, f"random-{scale}", (
+                lambda factory=factory, workload=workload: factory(workload.instantiate(realtime=False),
+                                                                   ResourceManager(tracer=NULL_TRACER)))
+
+    for scale in scales:
+        seed_generators(seed + scale)
+        with contextlib.redirect_stdout(io.StringIO()):
+            workload = Workload.from_processes(generate_random_realtime_processes(**REALTIME_WORKLOAD))
+        horizon = scale * RT_TICKS_PER_SCALE
+        for name, factory in REALTIME_SIMULATORS.items():
+            yield name, f"periodic-{scale}", (
+                lambda factory=factory, workload=workload, horizon=horizon: factory(
+                    workload.instantiate(), ResourceManager(tracer=NULL_TRACER), horizon))
+
+    if not sync:
+        return
+    for scenario, (filename, strategy) in SYNC_SCENARIOS.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            processes = parse_input_file(os.path.join(SCENARIO_DIR, filename))
+        if not processes:
+            print(f"경고: SYNC 시나리오 파일 '{filename}'을(를) 읽을 수 없어 건너뜁니다.")
+            continue
+        workload = Workload.from_processes(processes)
+        for name, factory in NORMAL_SIMULATORS.items():
+            yield name, f"sync-{scenario}", (
+                lambda factory=factory, workload=workload, strategy=strategy: factory(
+                    workload.instantiate(realtime=False),
+                    ResourceManager(SYNC_RESOURCES, strategy=strategy, tracer=NULL_TRACER)))
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(scales=DEFAULT_SCALES, seed=DEFAULT_SEED, repeat=DEFAULT_REPEAT, memory=True, sync=True,
+                   only=None, profile=False):
+    """
+    벤치마크를 실행하고 결과 딕셔너리를 반환합니다. (진행 상황은 항목마다 한 줄씩 출력)
+
+    :param only: 시뮬레이터 이름 목록 (None이면 전부)
+    """
+    results = []
+    print(f"{'simulator':<18} {'workload':<28} {'wall(ms)':>10} {'ticks/s':>12} {'events/s':>12} {'peak(KB)':>10}")
+    for name, workload, make_sim in benchmark_cases(scales, seed, sync):
+        if only and name not in only:
+            continue
+        result = {'simulator': name, 'workload': workload, **measure(make_sim, repeat, memory, profile)}
+        results.append(result)
+        peak = f"{result['peak_kb']:.0f}" if result['peak_kb'] is not None else "-"
+        print(f"{name:<18} {workload:<28} {result['wall_s'] * 1000:>10.2f} {result['ticks_per_s']:>12.0f} "
+              f"{result['events_per_s']:>12.0f} {peak:>10}")
+
+    return {
+        'version': RESULT_VERSION,
+        'meta': {
+            'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'scales': list(scales),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def save_results(report, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"[벤치마크] 결과 {len(report['results'])}개를 '{path}'에 저장했습니다.")
+
+
+def load_results(path):
+    """
+    저장된 벤치마크 결과를 읽습니다. (파일이 없거나 형식이 다르면 오류 메시지 후 None)
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            report = json.load(f)
+    except FileNotFoundError:
+        print(f"오류: '{path}' 벤치마크 결과를 찾을 수 없습니다!")
+        return None
+    except (OSError, ValueError) as e:
+        print(f"오류: '{path}' 벤치마크 결과를 읽을 수 없습니다. ({e})")
+        return None
+    if not isinstance(report, dict) or report.get('version') != RESULT_VERSION:
+        print(f"오류: '{path}'은(는) 지원하지 않는 벤치마크 결과 형식입니다.")
+        return None
+    return report
+
+
+def compare_results(baseline, current, threshold=REGRESSION_THRESHOLD):
+    """
+    두 벤치마크 결과를 (시뮬레이터, 워크로드)별로 비교해 표로 출력합니다.
+
+    - 시간: current가 baseline보다 threshold 비율 이상, 그리고 MIN_WALL_DELTA 이상 느리면 회귀
+    - 메모리: 최대 메모리가 threshold 비율 이상 늘면 회귀 (두 결과 모두 측정했을 때만)
+    - 시뮬레이션 시각(ticks)이 다르면 스케줄링 결과가 바뀐 것이므로 따로 표시 (속도 비교는 그대로 함)
+
+    :return: 회귀 항목 리스트 [(시뮬레이터, 워크로드, 사유)]
+    """
+    base = {(r['simulator'], r['workload']): r for r in baseline['results']}
+    regressions = []
+    print(f"{'simulator':<18} {'workload':<28} {'base(ms)':>10} {'cur(ms)':>10} {'time':>8} {'memory':>8}")
+    for cur in current['results']:
+        key = (cur['simulator'], cur['workload'])
+        old = base.pop(key, None)
+        if old is None:
+            print(f"{key[0]:<18} {key[1]:<28} {'-':>10} {cur['wall_s'] * 1000:>10.2f}   (기준 없음)")
+            continue
+
+        notes = []
+        time_ratio = cur['wall_s'] / old['wall_s'] if old['wall_s'] > 0 else 1.0
+        if time_ratio > 1 + threshold and cur['wall_s'] - old['wall_s'] > MIN_WALL_DELTA:
+            notes.append('느려짐')
+            regressions.append((*key, f"시간 {time_ratio:.2f}배"))
+        memory = "-"
+        if old.get('peak_kb') and cur.get('peak_kb') is not None:
+            memory_ratio = cur['peak_kb'] / old['peak_kb']
+            memory = f"{memory_ratio:.2f}x"
+            if memory_ratio > 1 + threshold:
+                notes.append('메모리 증가')
+                regressions.append((*key, f"메모리 {memory_ratio:.2f}배"))
+        if cur['ticks'] != old['ticks']:
+            notes.append(f"결과 변경 (ticks {old['ticks']} -> {cur['ticks']})")
+
+        print(f"{key[0]:<18} {key[1]:<28} {old['wall_s'] * 1000:>10.2f} {cur['wall_s'] * 1000:>10.2f} "
+              f"{time_ratio:>7.2f}x {memory:>8}  {', '.join(notes)}")
+
+    for simulator, workload in base:
+        print(f"{simulator:<18} {workload:<28}   (현재 결과에 없음)")
+
+    if regressions:
+        print(f"\n⚠️ 회귀 {len(regressions)}건 (기준: {threshold:.0%})")
+        for simulator, workload, reason in regressions:
+            print(f"  - {simulator} / {workload}: {reason}")
+    else:
+        print(f"\n✓ 회귀 없음 (기준: {threshold:.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스케줄러 시뮬레이터 벤치마크")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="벤치마크를 실행하고 결과를 JSON으로 저장")
+    run_parser.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES),
+                            help="워크로드 규모 (프로세스 수)")
+    run_parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    run_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="시간 측정 반복 횟수 (최소값 사용)")
+    run_parser.add_argument('--only', nargs='+', metavar='SIMULATOR', help="측정할 시뮬레이터 이름")
+    run_parser.add_argument('--no-memory', action='store_true', help="tracemalloc 메모리 측정 생략")
+    run_parser.add_argument('--no-sync', action='store_true', help="SYNC 시나리오 생략")
+    run_parser.add_argument('--profile', action='store_true', help="단계별 성능 카운터(perf_counters)도 저장")
+    run_parser.add_argument('-o', '--output', default="benchmark_results.json")
+    run_parser.add_argument('--compare', metavar='BASELINE', help="실행 후 기준 결과와 비교")
+    run_parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD)
+
+    compare_parser = commands.add_parser('compare', help="기준 결과와 현재 결과를 비교")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        report = run_benchmarks(args.scales, args.seed, args.repeat, not args.no_memory, not args.no_sync,
+                                args.only, args.profile)
+        save_results(report, args.output)
+        if not args.compare:
+            return 0
+        baseline, current = load_results(args.compare), report
+    else:
+        baseline, current = load_results(args.baseline), load_results(args.current)
+    if baseline is None or current is None:
+        return 2
+    return 1 if compare_results(baseline, current, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
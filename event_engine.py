@@ -0,0 +1,87 @@
+"""
+이벤트 기반 시간 진행 (Event-driven clock)
+
+모든 시뮬레이터는 1ms 틱 단위로 상태를 갱신하지만,
+대부분의 틱은 '남은 CPU 시간 1 감소' 또는 '오버헤드 1 감소'처럼
+아무 이벤트도 일어나지 않는 조용한(quiet) 틱입니다.
+
+advance_clock()은 한 틱의 처리가 끝난 직후 호출되어,
+다음 이벤트(도착, I/O 완료, 버스트 종료, 퀀텀 만료, 오버헤드 종료) 직전까지의
+조용한 틱들을 한 번에 건너뜁니다.
+건너뛴 틱에서는 출력/간트 차트/타임라인 변화가 없으므로 결과는 틱 루프와 동일합니다.
+"""
+from process import CPU
+
+INF = float('inf')
+
+
+def next_event_time(sim):
+    """
+    다음 외부 이벤트(신규 도착 또는 I/O 완료) 시각을 반환합니다. (없으면 inf)
+    """
+    next_time = sim.processes_to_arrive.next_time()
+    if sim.waiting_queue and sim.waiting_queue[0][0] < next_time:
+        next_time = sim.waiting_queue[0][0]
+    return next_time
+
+
+def quiet_ticks(sim, ready_empty, slice_left=INF):
+    """
+    현재 CPU가 다음 틱부터 스스로는 이벤트 없이 보낼 수 있는 틱 수를 반환합니다. (외부 이벤트는 고려하지 않음)
+
+    :return: (구간 종류, 틱 수)
+             구간 종류: 'run' (CPU 실행), 'overhead' (문맥 교환), 'idle' (CPU 유휴), None (건너뛸 수 없음)
+    """
+    if sim.overhead_remaining > 0:
+        return 'overhead', sim.overhead_remaining
+
+    proc = sim.running_process
+    if proc is None:
+        return ('idle', INF) if ready_empty else (None, 0)
+
+    # CPU 실행 중: 이미 간트 차트가 열려 있는 CPU 버스트만 건너뜀
+    burst = proc.get_current_burst()
+    if (burst and burst[0] == CPU and
+        sim.gantt_chart and
+        sim.gantt_chart[-1][0] == proc.pid and
+        len(sim.gantt_chart[-1]) == 2):
+
+        ticks = min(proc.remaining_cpu_time - 1, slice_left - 1)
+        if ticks > 0:
+            return 'run', ticks
+    return None, 0
+
+
+def advance_clock(sim, ready_empty, slice_left=INF, horizon=INF):
+    """
+    현재 틱 처리가 끝난 시뮬레이터의 시계를 다음 처리할 틱으로 이동합니다.
+
+    :param sim: 시뮬레이터 (processes_to_arrive, waiting_queue, running_process,
+                overhead_remaining, gantt_chart, current_time 속성 사용)
+    :param ready_empty: Ready 큐(들)이 모두 비어 있는지 여부
+    :param slice_left: 현재 타임 슬라이스의 남은 시간 (퀀텀이 없으면 inf)
+    :param horizon: 알고리즘 고유의 다음 이벤트 시각 (e.g., Aging 경계)
+    :return: (건너뛴 구간 종류, 건너뛴 틱 수)
+             구간 종류: 'run' (CPU 실행), 'overhead' (문맥 교환), 'idle' (CPU 유휴), None
+    """
+    limit = min(next_event_time(sim), horizon) - sim.current_time - 1
+    kind, skipped = None, 0
+
+    if limit > 0:
+        kind, ticks = quiet_ticks(sim, ready_empty, slice_left)
+        if kind == 'overhead':
+            # 오버헤드 진행 중: 남은 오버헤드만큼 (이벤트 전까지) 건너뜀
+            skipped = min(limit, ticks)
+            sim.overhead_remaining -= skipped
+        elif kind == 'idle':
+            # CPU 유휴: 다음 도착/I-O 완료 직전까지 건너뜀
+            if limit != INF:
+                skipped = limit
+            else:
+                kind = None
+        elif kind == 'run':
+            skipped = min(limit, ticks)
+            sim.running_process.remaining_cpu_time -= skipped
+
+    sim.current_time += 1 + skipped
+    return kind, skipped
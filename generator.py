@@ -1,6 +1,15 @@
 import random
 import numpy as np
-from process import Process # process.py의 Process 클래스를 가져옵니다.
+from process import Process, CPU, IO, format_input_line, io_time # process.py의 Process 클래스를 가져옵니다.
+from workload_binary import save_workload, BinaryWorkload, FORMAT_VERSION
+
+def seed_generators(seed):
+    """
+    워크로드 생성에 쓰이는 난수 생성기(random, numpy)를 seed로 초기화합니다.
+    (같은 시드 -> 같은 워크로드)
+    """
+    random.seed(seed)
+    np.random.seed(seed)
 
 def generate_random_processes(
     num_processes=10,
@@ -8,7 +17,9 @@ def generate_random_processes(
     max_cpu_burst=20,
     max_io_burst=30,
     max_priority=5,
-    workload_distribution=None
+    workload_distribution=None,
+    io_device=None,
+    disk_cylinders=200
     ):
     """
     [고도화 버전] 워크로드 타입을 구분하여 현실적인 프로세스를 생성합니다.
@@ -20,6 +31,9 @@ def generate_random_processes(
         max_io_burst: 최대 I/O 버스트 시간
         max_priority: 최대 우선순위 값
         workload_distribution: 워크로드 타입 비율 {'cpu_bound': 0.3, 'io_bound': 0.4, 'mixed': 0.3}
+        io_device: I/O를 보낼 장치 이름 (e.g., 'disk0'). 지정하면 "IO:disk0:10:57"처럼 임의 트랙의 장치 I/O를 생성
+                   (장치는 sync.initialize_devices로 등록, None이면 장치 제한 없는 "IO:10")
+        disk_cylinders: io_device 지정 시 트랙 범위 (0 ~ disk_cylinders-1)
     
     워크로드 타입:
         - CPU Bound: 긴 CPU 버스트, 적은 I/O (연산 집약적)
@@ -55,6 +69,11 @@ def generate_random_processes(
         interval = np.random.exponential(1.0 / arrival_lambda)
         arrival_times.append(int(arrival_times[-1] + interval))
     
+    def io_op(io_burst):
+        if io_device is None:
+            return f"IO:{io_burst}"
+        return f"IO:{io_device}:{io_burst}:{random.randrange(disk_cylinders)}"
+
     for i in range(num_processes):
         pid = i + 1
         arrival_time = arrival_times[i]
@@ -74,7 +93,7 @@ def generate_random_processes(
                 if random.random() < 0.1:
                     io_burst = random.randint(1, max_io_burst // 3)
                     cpu_burst = random.randint(max_cpu_burst // 2, max_cpu_burst)
-                    burst_list_str.append(f"IO:{io_burst}")
+                    burst_list_str.append(io_op(io_burst))
                     burst_list_str.append(f"CPU:{cpu_burst}")
         
         elif workload_type == 'io_bound':
@@ -87,7 +106,7 @@ def generate_random_processes(
                 if random.random() < 0.8:
                     io_burst = random.randint(max_io_burst // 2, max_io_burst)
                     cpu_burst = random.randint(1, max_cpu_burst // 3)
-                    burst_list_str.append(f"IO:{io_burst}")
+                    burst_list_str.append(io_op(io_burst))
                     burst_list_str.append(f"CPU:{cpu_burst}")
         
         else:  # mixed
@@ -100,7 +119,7 @@ def generate_random_processes(
                 if random.random() < 0.5:
                     io_burst = random.randint(max_io_burst // 3, max_io_burst // 2)
                     cpu_burst = random.randint(max_cpu_burst // 4, max_cpu_burst // 2)
-                    burst_list_str.append(f"IO:{io_burst}")
+                    burst_list_str.append(io_op(io_burst))
                     burst_list_str.append(f"CPU:{cpu_burst}")
         
         # "CPU:3,IO:10,CPU:4" 형태의 문자열로 변환
@@ -116,22 +135,125 @@ def generate_random_processes(
     print("--- 랜덤 프로세스 생성 완료 ---")
     return processes
 
-def save_processes_to_file(processes, filename="random_input.txt"):
+# 워크로드 타입별 생성 모델 (generate_random_processes의 분기와 같은 값)
+#   cpu: CPU 버스트 범위 (max_cpu_burst 기준 (분자, 분모) 비율, 1이면 1ms), io: I/O 버스트 범위 (max_io_burst 기준)
+#   trials: I/O+CPU 쌍을 추가할 시도 횟수 범위, p: 시도마다 추가할 확률
+WORKLOAD_MODEL = {
+    'cpu_bound': {'cpu': ((1, 2), (1, 1)), 'io': (None, (1, 3)), 'trials': (0, 2), 'p': 0.1},
+    'io_bound':  {'cpu': (None, (1, 3)), 'io': ((1, 2), (1, 1)), 'trials': (3, 5), 'p': 0.8},
+    'mixed':     {'cpu': ((1, 4), (1, 2)), 'io': ((1, 3), (1, 2)), 'trials': (2, 3), 'p': 0.5},
+}
+WORKLOAD_TYPES = tuple(WORKLOAD_MODEL)
+
+
+def _burst_range(bounds, max_burst):
+    """((분자, 분모) 또는 None=1) 쌍을 실제 [최소, 최대] 버스트 시간으로 바꿉니다."""
+    return tuple(1 if bound is None else max_burst * bound[0] // bound[1] for bound in bounds)
+
+
+def generate_vectorized_workload(
+    num_processes=1_000_000,
+    arrival_lambda=5.0,
+    max_cpu_burst=20,
+    max_io_burst=30,
+    max_priority=5,
+    workload_distribution=None,
+    io_device=None,
+    disk_cylinders=200
+    ):
+    """
+    generate_random_processes와 같은 워크로드 모델로, 모든 값을 NumPy 배열로 한꺼번에 생성합니다.
+    (프로세스별 출력, 버스트 문자열 생성/파싱 없음 -> 프로세스 100만 개도 수 초 안에 생성)
+
+    - 도착 간격: 지수 분포 (정수로 버림 후 누적, 첫 프로세스는 0)
+    - 워크로드 타입: 비율대로 개수를 정하고(부족분은 mixed) 무작위로 섞음
+    - 버스트: 첫 CPU 버스트 + 타입별 시도 횟수(균등) 중 확률 p로 성공한 횟수(이항 분포)만큼 (I/O, CPU) 쌍
+    같은 분포를 따르지만 난수를 뽑는 순서가 다르므로, 같은 시드라도 generate_random_processes와 같은 워크로드는 아닙니다.
+    (난수는 seed_generators가 초기화하는 np.random을 사용)
+
+    인자는 generate_random_processes와 같습니다.
+    :return: workload_binary.BinaryWorkload (반복하면 도착 순 Process 스트림, processes()로 리스트,
+             save_processes_to_file(workload, 'w.npz')로 저장)
+    """
+    if workload_distribution is None:
+        workload_distribution = {'cpu_bound': 0.3, 'io_bound': 0.4, 'mixed': 0.3}
+    n = num_processes
+
+    # --- 워크로드 타입 (0: cpu_bound, 1: io_bound, 2: mixed) ---
+    counts = [int(n * workload_distribution[name]) for name in WORKLOAD_TYPES]
+    counts[WORKLOAD_TYPES.index('mixed')] += n - sum(counts)  # 부족한 개수는 mixed로 채움
+    types = np.random.permutation(np.repeat(np.arange(len(WORKLOAD_TYPES), dtype=np.int8), counts))
+
+    # --- 도착 시각, 우선순위 ---
+    gaps = np.floor(np.random.exponential(1.0 / arrival_lambda, max(n - 1, 0))).astype(np.int64)
+    arrival = np.concatenate(([0], np.cumsum(gaps)))[:n]
+    priority = np.random.randint(1, max_priority + 1, n).astype(np.int64)
+
+    # --- 타입별 파라미터를 프로세스별 배열로 ---
+    models = [WORKLOAD_MODEL[name] for name in WORKLOAD_TYPES]
+    cpu_lo, cpu_hi = np.array([_burst_range(m['cpu'], max_cpu_burst) for m in models]).T
+    io_lo, io_hi = np.array([_burst_range(m['io'], max_io_burst) for m in models]).T
+    trials_lo, trials_hi = np.array([m['trials'] for m in models]).T
+    p = np.array([m['p'] for m in models])
+
+    # --- 프로세스별 (I/O, CPU) 쌍 수 -> 버스트 수 ---
+    trials = np.random.randint(trials_lo[types], trials_hi[types] + 1)
+    pairs = np.random.binomial(trials, p[types])
+    lengths = 1 + 2 * pairs
+    offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+
+    # --- 버스트: 프로세스 안에서 짝수 위치는 CPU, 홀수 위치는 I/O ---
+    burst_types = np.repeat(types, lengths)
+    position = np.arange(offsets[-1]) - np.repeat(offsets[:-1], lengths)
+    is_io = (position % 2).astype(bool)
+    ops = np.where(is_io, IO, CPU).astype(np.int8)
+    lo = np.where(is_io, io_lo[burst_types], cpu_lo[burst_types])
+    hi = np.where(is_io, io_hi[burst_types], cpu_hi[burst_types])
+    operands = np.random.randint(lo, hi + 1).astype(np.int64)
+
+    columns = {
+        'pid': np.arange(1, n + 1, dtype=np.int64),
+        'arrival': arrival.astype(np.int64),
+        'priority': priority,
+        'period': np.zeros(n, dtype=np.int64),
+        'deadline': np.zeros(n, dtype=np.int64),
+        'offsets': offsets,
+        'ops': ops,
+        'operands': operands,
+        'names': np.array([], dtype='<U1'),
+        'version': np.array(FORMAT_VERSION),
+    }
+    if io_device is not None:
+        columns['names'] = np.array([io_device])
+        columns['io_device'] = np.where(is_io, 0, -1).astype(np.int32)
+        columns['io_track'] = np.where(is_io, np.random.randint(0, disk_cylinders, len(ops)), -1).astype(np.int32)
+
+    type_counts = ", ".join(f"{name} {count}" for name, count in zip(WORKLOAD_TYPES, counts))
+    print(f"--- 랜덤 프로세스 {n}개 생성 완료 (벡터화, 버스트 {len(ops)}개, {type_counts}) ---")
+    return BinaryWorkload(columns)
+
+def save_processes_to_file(processes, filename="random_input.txt", binary=None):
     """
     생성된 프로세스 리스트를 입력 파일 형식으로 저장합니다.
+
+    :param processes: Process 리스트 또는 BinaryWorkload (generate_vectorized_workload)
+    :param binary: True면 바이너리 열 형식(workload_binary)으로 저장 (filename이 .npz 파일이거나 디렉터리)
+                   None이면 filename이 '.npz'로 끝날 때만 바이너리
     """
+    if binary is None:
+        binary = filename.endswith('.npz')
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write("# OS Scheduler Project - Randomly Generated Input Data\n")
-            f.write("# 형식: PID,생성시간,우선순위,실행패턴,[주기,마감시한]\n")
-            f.write("# --------------------------------------------------\n")
-            
-            for proc in processes:
-                # Process 객체에서 burst_pattern 리스트를 다시 문자열로
-                burst_str = ",".join(f"{cmd}:{val}" for cmd, val in proc.burst_pattern)
+        if binary:
+            save_workload(processes, filename)
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write("# OS Scheduler Project - Randomly Generated Input Data\n")
+                f.write("# 형식: PID,생성시간,우선순위,실행패턴,[주기,마감시한]\n")
+                f.write("# --------------------------------------------------\n")
                 
-                line = f'{proc.pid},{proc.arrival_time},{proc.static_priority},"{burst_str}",{proc.period},{proc.deadline}\n'
-                f.write(line)
+                for proc in processes:
+                    # Process 객체에서 burst_pattern 리스트를 다시 문자열로
+                    f.write(format_input_line(proc) + "\n")
         
         print(f"\n✅ 랜덤 생성된 프로세스를 '{filename}' 파일로 저장했습니다.")
         
@@ -189,7 +311,7 @@ def generate_random_realtime_processes(
 
     # 실제 총 이용률 계산
     total_utilization = sum(
-        sum(val for cmd, val in p.burst_pattern if cmd == 'CPU') / p.period 
+        sum(val for cmd, val in p.burst_pattern if cmd == CPU) / p.period 
         for p in processes
     )
     print(f"--- 실제 총 CPU 이용률: {total_utilization:.2f} ---")
@@ -222,8 +344,8 @@ if __name__ == "__main__":
     
     # 통계 출력
     print("\n=== 생성된 워크로드 통계 ===")
-    total_cpu = sum(sum(val for cmd, val in p.burst_pattern if cmd == 'CPU') for p in test_processes)
-    total_io = sum(sum(val for cmd, val in p.burst_pattern if cmd == 'IO') for p in test_processes)
+    total_cpu = sum(sum(val for cmd, val in p.burst_pattern if cmd == CPU) for p in test_processes)
+    total_io = sum(sum(io_time(val) for cmd, val in p.burst_pattern if cmd == IO) for p in test_processes)
     print(f"총 CPU 버스트 시간: {total_cpu}ms")
     print(f"총 I/O 버스트 시간: {total_io}ms")
     print(f"CPU/IO 비율: {total_cpu/(total_io+1):.2f}")
\ No newline at end of file
@@ -210,7 +210,7 @@ class SimulationSelector:
         self.iteration_var = tk.IntVar(value=1)
         self.iteration_spinbox = ttk.Spinbox(
             iter_inner_frame,
-            from_=1,
+            from_=0,
             to=20,
             textvariable=self.iteration_var,
             width=10,
@@ -220,7 +220,7 @@ class SimulationSelector:
         
         tk.Label(
             iter_inner_frame,
-            text="회  (1~20회, 여러 번 실행하여 평균 성능 측정)",
+            text="회  (1~20회, 여러 번 실행하여 평균 성능 측정 / 0: 신뢰구간이 좁아질 때까지 자동 반복)",
             font=("맑은 고딕", 9),
             bg=self.colors['card_bg'],
             fg=self.colors['text_light']
@@ -287,8 +287,8 @@ class SimulationSelector:
             }
         elif mode == "SCHEDULING":
             iterations = self.iteration_var.get()
-            if iterations < 1 or iterations > 20:
-                messagebox.showerror("오류", "반복 횟수는 1~20 사이여야 합니다.")
+            if iterations < 0 or iterations > 20:
+                messagebox.showerror("오류", "반복 횟수는 0(자동) 또는 1~20 사이여야 합니다.")
                 return
             self.result = {
                 'mode': mode,
@@ -320,7 +320,7 @@ def get_user_selection():
         dict: {
             'mode': str,  # 'SCHEDULING', 'SYNC', 'MEMORY'
             'scenario': str or None,  # 동기화 시나리오 번호 (SYNC 모드일 때만)
-            'iterations': int  # 반복 횟수
+            'iterations': int  # 반복 횟수 (0: 자동)
         }
         또는 None (사용자가 종료를 선택한 경우)
     """
@@ -0,0 +1,131 @@
+"""
+I/O 장치 모델 (채널 수 제한 + 장치별 대기 큐 + 디스크 스케줄링)
+
+"IO:10"처럼 장치를 지정하지 않은 I/O는 기존과 같이 요청 즉시 처리됩니다. (병렬 처리 무제한)
+"IO:disk0:10:57"처럼 장치를 지정하면 해당 IODevice가 요청을 처리합니다.
+    - 동시에 처리하는 요청은 채널 수(channels)까지이고, 나머지는 장치 큐에서 기다립니다.
+    - 채널이 비면 정책(IO_POLICIES)에 따라 다음 요청을 고릅니다.
+    - 서비스 시간 = 전송 시간(버스트 값) + 탐색 시간 (헤드 이동 거리 x seek_cost, 올림)
+    - 채널마다 헤드가 따로 있으며, 트랙을 생략한 요청은 헤드를 움직이지 않습니다. (탐색 없음)
+
+디스크 스케줄링 정책 (IO_POLICIES):
+    'fcfs'  : 요청 순서대로
+    'sstf'  : 현재 헤드에서 가장 가까운 트랙 먼저 (Shortest Seek Time First)
+    'scan'  : 한 방향으로 이동하며 처리하고, 그 방향에 요청이 없으면 디스크 끝까지 간 뒤 방향을 바꿈 (엘리베이터)
+    'clook' : 바깥쪽으로만 처리하고, 더 처리할 요청이 없으면 가장 안쪽 요청으로 바로 돌아감 (Circular LOOK)
+"""
+import math
+
+from tracer import get_tracer, INFO, WARN
+
+IO_POLICIES = ('fcfs', 'sstf', 'scan', 'clook')
+
+
+class IODevice:
+    """
+    채널 수가 정해진 I/O 장치 (디스크)
+
+    :param tracer: 정책 경고와 생성 메시지를 기록할 Tracer (기본: tracer.get_tracer())
+    """
+    def __init__(self, name, channels=1, policy='fcfs', cylinders=200, seek_cost=0.1, tracer=None):
+        tracer = tracer or get_tracer()
+        if policy not in IO_POLICIES:
+            tracer.emit(WARN, None, 'unknown_io_policy', "경고: 알 수 없는 I/O 스케줄링 정책 '{policy}'. 'fcfs'를 사용합니다.",
+                        policy=policy)
+            policy = 'fcfs'
+        self.name = name
+        self.channels = max(1, channels)
+        self.policy = policy
+        self.cylinders = cylinders
+        self.seek_cost = seek_cost  # 트랙 1개 이동에 드는 시간 (ms)
+        self.reset()
+        tracer.emit(INFO, None, 'device_create', "[장치 생성] I/O 장치 '{device}'(채널 {channels}개, 정책 {policy})이(가) 생성되었습니다.",
+                    device=name, channels=self.channels, policy=policy)
+
+    def reset(self):
+        """대기 큐, 헤드 위치, 통계를 초기화합니다. (시뮬레이션 시작 시 호출)"""
+        self.heads = [0] * self.channels        # 채널별 헤드 위치 (트랙)
+        self.directions = [1] * self.channels   # 채널별 헤드 이동 방향 ('scan'용, 1: 바깥쪽, -1: 안쪽)
+        self.serving = [None] * self.channels   # 채널별 처리 중인 프로세스
+        self.pending = []  # 대기 요청 [(요청 시각, 프로세스, IORequest)] (요청 순서)
+
+        # --- 통계 ---
+        self.requests = 0
+        self.total_queue_wait = 0  # 장치 큐에서 기다린 시간 합계
+        self.max_queue_wait = 0
+        self.max_queue_length = 0
+        self.total_seek = 0        # 헤드 이동 거리 합계 (트랙)
+        self.busy_time = 0         # 채널들이 요청을 처리한 시간 합계
+
+    @property
+    def queue_length(self):
+        return len(self.pending)
+
+    def submit(self, proc, request, now):
+        """
+        요청을 장치에 넣습니다.
+
+        :return: 빈 채널에서 바로 시작하면 완료 시각, 모든 채널이 바쁘면 None (장치 큐 대기)
+        """
+        self.requests += 1
+        self.pending.append((now, proc, request))
+        if None in self.serving:
+            return self._start(self.serving.index(None), now)[1]
+        self.max_queue_length = max(self.max_queue_length, len(self.pending))
+        return None
+
+    def complete(self, proc, now):
+        """
+        proc의 요청 처리를 끝내고, 비게 된 채널에서 다음 요청을 시작합니다.
+
+        :return: (다음 프로세스, 완료 시각). 대기 요청이 없으면 None
+        """
+        channel = self.serving.index(proc)
+        self.serving[channel] = None
+        if not self.pending:
+            return None
+        return self._start(channel, now)
+
+    def _track(self, request, head):
+        if request.track is None:
+            return head
+        return min(max(request.track, 0), self.cylinders - 1)
+
+    def _select(self, channel):
+        """정책에 따라 다음에 처리할 대기 요청의 인덱스와 헤드 이동 거리를 반환합니다."""
+        head = self.heads[channel]
+        tracks = [self._track(request, head) for requested, proc, request in self.pending]
+        order = range(len(tracks))
+
+        if self.policy == 'fcfs':
+            index = 0
+        elif self.policy == 'sstf':
+            index = min(order, key=lambda i: (abs(tracks[i] - head), i))
+        elif self.policy == 'scan':
+            direction = self.directions[channel]
+            ahead = [i for i in order if (tracks[i] - head) * direction >= 0]
+            if not ahead:
+                # 이 방향에 요청이 없음: 디스크 끝까지 이동한 뒤 방향을 바꿔 가장 가까운 요청으로
+                edge = self.cylinders - 1 if direction > 0 else 0
+                self.directions[channel] = -direction
+                index = min(order, key=lambda i: (abs(tracks[i] - edge), i))
+                return index, abs(edge - head) + abs(edge - tracks[index])
+            index = min(ahead, key=lambda i: (abs(tracks[i] - head), i))
+        else:  # clook
+            ahead = [i for i in order if tracks[i] >= head]
+            index = min(ahead or order, key=lambda i: (tracks[i], i))
+        return index, abs(tracks[index] - head)
+
+    def _start(self, channel, now):
+        index, distance = self._select(channel)
+        requested, proc, request = self.pending.pop(index)
+        self.heads[channel] = self._track(request, self.heads[channel])
+        service = request.duration + math.ceil(round(distance * self.seek_cost, 9))  # (0.1 x 30 = 3.0000000000000004 방지)
+
+        wait = now - requested
+        self.total_queue_wait += wait
+        self.max_queue_wait = max(self.max_queue_wait, wait)
+        self.total_seek += distance
+        self.busy_time += service
+        self.serving[channel] = proc
+        return proc, now + service
@@ -0,0 +1,127 @@
+"""
+작업별 지연 시간 분포 (병합 가능한 분위수 스케치)
+
+평균만으로는 꼬리 지연(p95/p99)을 알 수 없고, 반복 실행의 모든 작업 기록을 보관하면 메모리가 회차 수에 비례해 늘어납니다.
+LatencySketch는 HDR 히스토그램과 같은 로그-선형 버킷에 개수만 세므로
+    - 메모리는 값의 범위에만 비례하고 (2배 구간마다 버킷 최대 2^sub_bucket_bits개) 작업 수와 무관하며,
+    - 같은 버킷 구성끼리는 버킷 개수를 더하기만 하면 병합되므로 회차/작업자 프로세스별 결과를 정확히 합칠 수 있습니다.
+
+버킷 (sub_bucket_bits = b):
+    값 < 2^(b+1)        : 값마다 버킷 하나 (정확)
+    그 이상              : 2^k ~ 2^(k+1) 구간을 2^b개로 균등 분할 (상대 오차 <= 1/2^(b+1), 기본 b=5면 약 1.6%)
+분위수는 해당 버킷의 중앙값으로 답하며, 기록된 최소/최대값을 넘지 않습니다.
+
+시뮬레이터는 작업이 끝날 때마다 latencies(LATENCY_METRICS별 LatencySketch)에 기록합니다.
+    waiting    : 대기 시간 (Ready 큐에서 기다린 시간 합계, Process.wait_time)
+    response   : 응답 시간 (도착 -> 처음 CPU를 할당받은 시각)
+    turnaround : 반환 시간
+"""
+import math
+
+SUB_BUCKET_BITS = 5
+LATENCY_METRICS = ('waiting', 'response', 'turnaround')
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+class LatencySketch:
+    """
+    0 이상의 정수 지연 시간(ms) 분포를 로그-선형 버킷으로 세는 히스토그램
+    """
+    def __init__(self, sub_bucket_bits=SUB_BUCKET_BITS):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.linear_limit = 2 << sub_bucket_bits  # 이 값 미만은 값마다 버킷 하나
+        self.counts = {}  # 버킷 인덱스 -> 개수
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def __len__(self):
+        return self.count
+
+    def __eq__(self, other):
+        if not isinstance(other, LatencySketch):
+            return NotImplemented
+        return (self.sub_bucket_bits, self.counts, self.count, self.total, self.min, self.max) == \
+            (other.sub_bucket_bits, other.counts, other.count, other.total, other.min, other.max)
+
+    def _index(self, value):
+        if value < self.linear_limit:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits - 1
+        return (shift << self.sub_bucket_bits) + (value >> shift)
+
+    def _bounds(self, index):
+        """버킷 인덱스가 나타내는 값의 범위 [low, high]"""
+        if index < self.linear_limit:
+            return index, index
+        shift = (index >> self.sub_bucket_bits) - 1
+        low = (index - (shift << self.sub_bucket_bits)) << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, value, count=1):
+        """지연 시간 value를 count번 기록합니다. (음수는 0으로)"""
+        value = max(0, int(value))
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """other의 기록을 합칩니다. (버킷 구성이 다르면 other의 버킷 중앙값으로 다시 기록)"""
+        if other.count == 0:
+            return self
+        if other.sub_bucket_bits == self.sub_bucket_bits:
+            counts = self.counts
+            for index, count in other.counts.items():
+                counts[index] = counts.get(index, 0) + count
+            self.count += other.count
+            self.total += other.total
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        else:
+            for index, count in other.counts.items():
+                low, high = other._bounds(index)
+                self.record((low + high) // 2, count)
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def quantile(self, q):
+        """q 분위수 (0 <= q <= 1, 기록이 없으면 0)"""
+        if self.count == 0:
+            return 0
+        rank = max(1, math.ceil(q * self.count))
+        if rank == 1:
+            return self.min
+        if rank >= self.count:
+            return self.max
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                low, high = self._bounds(index)
+                return min(max((low + high) / 2, self.min), self.max)
+        return self.max
+
+    def percentiles(self, percents=DEFAULT_PERCENTILES):
+        """{'p50': ..., 'p95': ..., 'p99': ...}"""
+        return {f"p{p:g}": self.quantile(p / 100) for p in percents}
+
+
+def latency_sketches():
+    """지표(LATENCY_METRICS)별 빈 LatencySketch 딕셔너리"""
+    return {metric: LatencySketch() for metric in LATENCY_METRICS}
+
+
+def merge_latencies(total, latencies):
+    """지표별 스케치 딕셔너리 latencies를 total에 병합합니다."""
+    for metric, sketch in latencies.items():
+        total.setdefault(metric, LatencySketch(sketch.sub_bucket_bits)).merge(sketch)
+    return total
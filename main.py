@@ -1,135 +1,45 @@
 # 기존 시뮬레이터들 import
-from process import parse_input_file 
-from simulator_fcfs import SimulatorFCFS
-from simulator_rr import SimulatorRR
-from simulator_sjf import SimulatorSJF
+from process import parse_input_file, Workload
 from simulator_priority_static import SimulatorPriorityStatic
-from simulator_priority_dynamic import SimulatorPriorityDynamic
-from simulator_mlfq import SimulatorMLFQ
-from simulator_rm import SimulatorRM
-from simulator_edf import SimulatorEDF
-from sync import initialize_resources
+from sync import initialize_resources, initialize_devices, ResourceManager, SYNC_PROTOCOLS
+from tracer import NULL_TRACER
 
 # 시각화 도구 import
 from visualizer import SchedulingVisualizer
 import os
 
-import copy  # 깊은 복사(deep copy)를 위해 추가
-from generator import generate_random_processes, generate_random_realtime_processes # 방금 만든 generator import
-import statistics  # 통계 계산을 위해 추가
+from monte_carlo import run_single_simulation, run_iterations, generate_workload, new_base_seed, collect_latencies  # 반복 실행 러너
+from monte_carlo import NORMAL_ALGORITHMS, REALTIME_ALGORITHMS, AUTO_ITERATIONS, precise_enough, RepresentativeCandidates
+from results_cube import ResultsCube, WelfordAccumulator  # 반복 결과 집계 (평균/표준편차/신뢰구간)
 from gui_selector import get_user_selection  # GUI 선택기 import
 
+# --- SCHEDULING 모드 I/O 장치 설정 ---
+# 장치 이름 -> IODevice 인자 (channels: 동시에 처리하는 요청 수, policy: 장치 큐 정책 'fcfs'/'sstf'/'scan'/'clook')
+# 실행 전에 등록하고, 일반 프로세스의 I/O는 첫 번째 장치로 보내는 "IO:<장치>:<시간>:<트랙>" 버스트로 생성합니다.
+# (비워 두면 기존처럼 장치 제한 없는 I/O)
+IO_DEVICES = {
+    'disk0': {'channels': 2, 'policy': 'scan'},
+}
 
-def run_single_simulation(master_process_list_normal, master_process_list_realtime):
+
+def compare_sync_protocols(process_list, resource_names):
     """
-    단일 시뮬레이션 실행 및 결과 반환 (반복 실행용)
+    같은 워크로드를 우선순위 역전 대응 프로토콜별로 '정적 우선순위'에서 실행하고
+    PID별 자원 블로킹 시간을 비교합니다. (시뮬레이션 로그는 출력하지 않음)
     """
-    comparison_results = {}
-    realtime_results = {}
-    
-    # 1. FCFS
-    non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-    sim_fcfs = SimulatorFCFS(non_rt_processes)
-    sim_fcfs.run()
-    fcfs_n = len(sim_fcfs.completed_processes)
-    comparison_results['FCFS'] = {
-        'avg_turnaround': (sum(p.turnaround_time for p in sim_fcfs.completed_processes) / fcfs_n) if fcfs_n > 0 else 0,
-        'avg_waiting': (sum(p.wait_time for p in sim_fcfs.completed_processes) / fcfs_n) if fcfs_n > 0 else 0,
-        'cpu_utilization': (sum(end - start for pid, start, end in sim_fcfs.gantt_chart) / sim_fcfs.current_time) * 100 if sim_fcfs.current_time > 0 else 0,
-        'context_switches': sim_fcfs.context_switches
-    }
-    
-    # 2. RR (Q=4)
-    non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-    sim_rr = SimulatorRR(non_rt_processes, time_quantum=4)
-    sim_rr.run()
-    rr_n = len(sim_rr.completed_processes)
-    comparison_results['RR(Q=4)'] = {
-        'avg_turnaround': (sum(p.turnaround_time for p in sim_rr.completed_processes) / rr_n) if rr_n > 0 else 0,
-        'avg_waiting': (sum(p.wait_time for p in sim_rr.completed_processes) / rr_n) if rr_n > 0 else 0,
-        'cpu_utilization': (sum(end - start for pid, start, end in sim_rr.gantt_chart) / sim_rr.current_time) * 100 if sim_rr.current_time > 0 else 0,
-        'context_switches': sim_rr.context_switches
-    }
-    
-    # 3. SJF (SRTF)
-    non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-    sim_sjf = SimulatorSJF(non_rt_processes)
-    sim_sjf.run()
-    sjf_n = len(sim_sjf.completed_processes)
-    comparison_results['SJF'] = {
-        'avg_turnaround': (sum(p.turnaround_time for p in sim_sjf.completed_processes) / sjf_n) if sjf_n > 0 else 0,
-        'avg_waiting': (sum(p.wait_time for p in sim_sjf.completed_processes) / sjf_n) if sjf_n > 0 else 0,
-        'cpu_utilization': (sum(end - start for pid, start, end in sim_sjf.gantt_chart) / sim_sjf.current_time) * 100 if sim_sjf.current_time > 0 else 0,
-        'context_switches': sim_sjf.context_switches
-    }
-    
-    # 4. Static Priority
-    non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-    sim_prio = SimulatorPriorityStatic(non_rt_processes)
-    sim_prio.run()
-    prio_n = len(sim_prio.completed_processes)
-    comparison_results['Priority(Static)'] = {
-        'avg_turnaround': (sum(p.turnaround_time for p in sim_prio.completed_processes) / prio_n) if prio_n > 0 else 0,
-        'avg_waiting': (sum(p.wait_time for p in sim_prio.completed_processes) / prio_n) if prio_n > 0 else 0,
-        'cpu_utilization': (sum(end - start for pid, start, end in sim_prio.gantt_chart) / sim_prio.current_time) * 100 if sim_prio.current_time > 0 else 0,
-        'context_switches': sim_prio.context_switches
-    }
-    
-    # 5. Dynamic Priority (Aging)
-    non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-    sim_prio_dyn = SimulatorPriorityDynamic(non_rt_processes, aging_factor=10)
-    sim_prio_dyn.run()
-    prio_dyn_n = len(sim_prio_dyn.completed_processes)
-    comparison_results['Priority(Aging)'] = {
-        'avg_turnaround': (sum(p.turnaround_time for p in sim_prio_dyn.completed_processes) / prio_dyn_n) if prio_dyn_n > 0 else 0,
-        'avg_waiting': (sum(p.wait_time for p in sim_prio_dyn.completed_processes) / prio_dyn_n) if prio_dyn_n > 0 else 0,
-        'cpu_utilization': (sum(end - start for pid, start, end in sim_prio_dyn.gantt_chart) / sim_prio_dyn.current_time) * 100 if sim_prio_dyn.current_time > 0 else 0,
-        'context_switches': sim_prio_dyn.context_switches
-    }
-    
-    # 6. MLFQ
-    non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-    sim_mlfq = SimulatorMLFQ(non_rt_processes)
-    sim_mlfq.run()
-    mlfq_n = len(sim_mlfq.completed_processes)
-    comparison_results['MLFQ'] = {
-        'avg_turnaround': (sum(p.turnaround_time for p in sim_mlfq.completed_processes) / mlfq_n) if mlfq_n > 0 else 0,
-        'avg_waiting': (sum(p.wait_time for p in sim_mlfq.completed_processes) / mlfq_n) if mlfq_n > 0 else 0,
-        'cpu_utilization': (sum(end - start for pid, start, end in sim_mlfq.gantt_chart) / sim_mlfq.current_time) * 100 if sim_mlfq.current_time > 0 else 0,
-        'context_switches': sim_mlfq.context_switches
-    }
-    
-    # 7. RM (Rate Monotonic)
-    if master_process_list_realtime:
-        rt_processes_rm = copy.deepcopy(master_process_list_realtime)
-        sim_rm = SimulatorRM(rt_processes_rm, max_simulation_time=200)
-        sim_rm.run()
-        if sim_rm.completed_processes:
-            rm_n = len(sim_rm.completed_processes)
-            realtime_results['RM'] = {
-                'deadline_misses': sim_rm.deadline_misses,
-                'avg_turnaround': (sum(p.turnaround_time for p in sim_rm.completed_processes) / rm_n) if rm_n > 0 else 0,
-                'avg_waiting': (sum(p.wait_time for p in sim_rm.completed_processes) / rm_n) if rm_n > 0 else 0,
-                'cpu_utilization': (sum(end - start for pid, start, end in sim_rm.gantt_chart) / sim_rm.current_time) * 100 if sim_rm.current_time > 0 else 0,
-                'context_switches': sim_rm.context_switches
-            }
-    
-    # 8. EDF (Earliest Deadline First)
-    if master_process_list_realtime:
-        rt_processes_edf = copy.deepcopy(master_process_list_realtime)
-        sim_edf = SimulatorEDF(rt_processes_edf, max_simulation_time=200)
-        sim_edf.run()
-        if sim_edf.completed_processes:
-            edf_n = len(sim_edf.completed_processes)
-            realtime_results['EDF'] = {
-                'deadline_misses': sim_edf.deadline_misses,
-                'avg_turnaround': (sum(p.turnaround_time for p in sim_edf.completed_processes) / edf_n) if edf_n > 0 else 0,
-                'avg_waiting': (sum(p.wait_time for p in sim_edf.completed_processes) / edf_n) if edf_n > 0 else 0,
-                'cpu_utilization': (sum(end - start for pid, start, end in sim_edf.gantt_chart) / sim_edf.current_time) * 100 if sim_edf.current_time > 0 else 0,
-                'context_switches': sim_edf.context_switches
-            }
-    
-    return comparison_results, realtime_results
+    workload = Workload.from_processes(process_list)
+    protocols = [p for p in SYNC_PROTOCOLS if p != 'srp']  # SRP는 EDF용
+    results = {}
+    for protocol in protocols:
+        resources = ResourceManager(resource_names, protocol=protocol, tracer=NULL_TRACER)
+        sim = SimulatorPriorityStatic(workload.instantiate(realtime=False), tracer=NULL_TRACER, resources=resources)
+        sim.run()
+        results[protocol] = sim.blocking_times()
+
+    print("\n--- 프로토콜별 자원 블로킹 시간 (정적 우선순위, 합계 ms) ---")
+    print("PID\t| " + "\t| ".join(protocols))
+    for pid in sorted(results['none']):
+        print(f"{pid}\t| " + "\t| ".join(str(results[p][pid][1]) for p in protocols))
 
 
 def run_simulations_with_visualization():
@@ -159,16 +69,14 @@ def run_simulations_with_visualization():
     # --- 2. 모드에 따른 프로세스 데이터 로드 ---
     if SIMULATION_MODE == 'SCHEDULING':
         print("--- 🚀 모드: 알고리즘 성능 비교 (랜덤 생성) ---")
-        print(f"반복 횟수: {num_iterations}회\n")
-        print(f"워크로드 생성 중... (반복: {num_iterations}회)")
-        master_process_list_normal = generate_random_processes(
-            num_processes=8,
-            arrival_lambda=3.0,  # 평균 3ms 간격으로 도착
-            max_cpu_burst=20,
-            max_io_burst=30,
-            workload_distribution={'cpu_bound': 0.3, 'io_bound': 0.4, 'mixed': 0.3}
-        )
-        master_process_list_realtime = generate_random_realtime_processes(num_processes=5, target_utilization=0.98)
+        if num_iterations == 0:
+            print(f"반복 횟수: 자동 (평균 반환 시간의 95% 신뢰구간이 평균의 {AUTO_ITERATIONS['relative_ci']:.0%} 이내가 될 때까지)\n")
+        else:
+            print(f"반복 횟수: {num_iterations}회\n")
+        initialize_devices(IO_DEVICES)
+        io_device = next(iter(IO_DEVICES), None)
+        print("워크로드 생성 중...")
+        master_process_list_normal, master_process_list_realtime = generate_workload(io_device)
         
     elif SIMULATION_MODE == 'SYNC':
         print("--- 🔬 모드: 동기화 기능 테스트 ---")
@@ -219,11 +127,14 @@ def run_simulations_with_visualization():
         print("\n--- (동기화 테스트는 '정적 우선순위'로 실행합니다) ---")
         print("[1/1] Priority (Sync Test)...", end=" ")
         
-        sync_test_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
+        sync_test_processes = Workload.from_processes(master_process_list_normal).instantiate(realtime=False)
         sim_prio = SimulatorPriorityStatic(sync_test_processes)
         
         sim_prio.run() 
         print("✓")
+
+        if sync_choice == '1':
+            compare_sync_protocols(master_process_list_normal, RESOURCE_NAMES)
         
         # (시나리오 이름에 맞게 그래프 제목 변경)
         scenario_names = {
@@ -245,181 +156,122 @@ def run_simulations_with_visualization():
         print("=" * 70)
         print("CPU Scheduling Simulation & Visualization (Scheduling Mode)")
         print("=" * 70)
-        print(f"\n반복 시뮬레이션 실행 중... (총 {num_iterations}회)\n")
+        auto_iterations = num_iterations == 0  # 0: 회차 수를 정하지 않고 신뢰구간이 충분히 좁아질 때까지 반복
+        if auto_iterations:
+            print(f"\n반복 시뮬레이션 실행 중... (자동, 최대 {AUTO_ITERATIONS['max_iterations']}회)\n")
+        else:
+            print(f"\n반복 시뮬레이션 실행 중... (총 {num_iterations}회)\n")
         
         import warnings
         warnings.filterwarnings('ignore')
         
         # 반복 실행을 위한 통계 수집 변수
-        all_comparison_results = []
-        all_realtime_results = []
-        
-        # 마지막 실행의 시뮬레이터 객체들 (시각화용)
-        last_sim_fcfs = None
-        last_sim_rr = None
-        last_sim_sjf = None
-        last_sim_prio = None
-        last_sim_prio_dyn = None
-        last_sim_mlfq = None
-        last_sim_rm = None
-        last_sim_edf = None
-        
-        # 반복 실행
-        for iteration in range(num_iterations):
-            if num_iterations > 1:
-                print(f"[반복 {iteration + 1}/{num_iterations}] ", end="")
-                # 매 반복마다 새로운 워크로드 생성
-                master_process_list_normal = generate_random_processes(
-                    num_processes=8,
-                    arrival_lambda=3.0,
-                    max_cpu_burst=20,
-                    max_io_burst=30,
-                    workload_distribution={'cpu_bound': 0.3, 'io_bound': 0.4, 'mixed': 0.3}
-                )
-                master_process_list_realtime = generate_random_realtime_processes(num_processes=5, target_utilization=0.98)
-            
+        # (회차 수를 알면 회차 x 알고리즘 x 지표 배열을 미리 할당, 모르면 회차 값을 보관하지 않는 Welford 누적기)
+        if auto_iterations:
+            iteration_results = WelfordAccumulator(NORMAL_ALGORITHMS + REALTIME_ALGORITHMS)
+        else:
+            iteration_results = ResultsCube(num_iterations, NORMAL_ALGORITHMS + REALTIME_ALGORITHMS)
+        
+        all_latencies = {}  # 알고리즘 -> 지표별 지연 시간 분포 (전체 회차의 작업을 병합, 회차 수와 무관한 크기)
+        candidates = RepresentativeCandidates('FCFS', 'avg_turnaround')  # 대표 회차 후보의 시각화 기록
+        
+        if num_iterations != 1:
+            # 반복 실행: 회차마다 시드를 고정한 새 워크로드를 여러 프로세스에서 병렬 실행
+            # (이벤트 추적은 꺼지고, 결과는 회차 순서대로 도착)
+            base_seed = new_base_seed()
+            print(f"기본 시드: {base_seed}")
+            results = run_iterations(None if auto_iterations else num_iterations, base_seed, keep_records=True,
+                                     io_device=io_device, devices=IO_DEVICES)
+            for iteration, (comparison_results, realtime_results, records) in enumerate(results):
+                collect_latencies(all_latencies, comparison_results, realtime_results)
+                iteration_results.add(comparison_results, realtime_results)
+                candidates.offer(iteration, comparison_results, records)
+                if not auto_iterations:
+                    print(f"[반복 {iteration + 1}/{num_iterations}] ✓")
+                    continue
+                done = iteration + 1
+                converged = done >= AUTO_ITERATIONS['min_iterations'] and precise_enough(iteration_results)
+                if converged or done >= AUTO_ITERATIONS['max_iterations']:
+                    print(f"[반복 {done}] ✓ ({'신뢰구간 수렴' if converged else '최대 회차 도달'})")
+                    break
+                if done % AUTO_ITERATIONS['report_every'] == 0:
+                    print(f"[반복 {done}] ✓")
+            results.close()  # 자동 반복: 아직 받지 않은 회차 취소
+            num_iterations = len(iteration_results)
+        else:
             # 단일 시뮬레이션 실행
+            records = {}
             comparison_results, realtime_results = run_single_simulation(
                 master_process_list_normal, 
-                master_process_list_realtime
+                master_process_list_realtime,
+                records
             )
-            
-            all_comparison_results.append(comparison_results)
-            all_realtime_results.append(realtime_results)
-            
-            if num_iterations > 1:
-                print("✓")
+            collect_latencies(all_latencies, comparison_results, realtime_results)
+            iteration_results.add(comparison_results, realtime_results)
         
         # 평균 통계 계산
         print("\n통계 계산 중...", end=" ")
         averaged_comparison = {}
         averaged_realtime = {}
         
-        # Non-realtime 알고리즘 평균
-        for alg in all_comparison_results[0].keys():
+        # Non-realtime 알고리즘 평균 (모든 알고리즘/지표를 한 번의 배열 연산으로 집계)
+        for alg, summary in iteration_results.summary(NORMAL_ALGORITHMS).items():
+            mean, std, ci = summary['mean'], summary['std'], summary['ci']
             averaged_comparison[alg] = {
-                'avg_turnaround': statistics.mean([r[alg]['avg_turnaround'] for r in all_comparison_results]),
-                'avg_waiting': statistics.mean([r[alg]['avg_waiting'] for r in all_comparison_results]),
-                'cpu_utilization': statistics.mean([r[alg]['cpu_utilization'] for r in all_comparison_results]),
-                'context_switches': statistics.mean([r[alg]['context_switches'] for r in all_comparison_results]),
-                'std_turnaround': statistics.stdev([r[alg]['avg_turnaround'] for r in all_comparison_results]) if num_iterations > 1 else 0,
-                'std_waiting': statistics.stdev([r[alg]['avg_waiting'] for r in all_comparison_results]) if num_iterations > 1 else 0,
+                'avg_turnaround': mean['avg_turnaround'],
+                'avg_waiting': mean['avg_waiting'],
+                'cpu_utilization': mean['cpu_utilization'],
+                'context_switches': mean['context_switches'],
+                'std_turnaround': std['avg_turnaround'],
+                'std_waiting': std['avg_waiting'],
+                'ci_turnaround': ci['avg_turnaround'],  # 95% 신뢰구간 반폭
+                'ci_waiting': ci['avg_waiting'],
             }
         
-        # Realtime 알고리즘 평균
-        if all_realtime_results and all_realtime_results[0]:
-            for alg in all_realtime_results[0].keys():
-                averaged_realtime[alg] = {
-                    'deadline_misses': sum([r[alg]['deadline_misses'] for r in all_realtime_results if alg in r]),  # 합계로 변경
-                    'avg_turnaround': statistics.mean([r[alg]['avg_turnaround'] for r in all_realtime_results if alg in r]),
-                    'avg_waiting': statistics.mean([r[alg]['avg_waiting'] for r in all_realtime_results if alg in r]),
-                    'cpu_utilization': statistics.mean([r[alg]['cpu_utilization'] for r in all_realtime_results if alg in r]),
-                    'context_switches': statistics.mean([r[alg]['context_switches'] for r in all_realtime_results if alg in r]),
-                }
+        # Realtime 알고리즘 평균 (작업을 끝낸 회차만)
+        for alg, summary in iteration_results.summary(REALTIME_ALGORITHMS).items():
+            mean = summary['mean']
+            averaged_realtime[alg] = {
+                'deadline_misses': int(summary['total']['deadline_misses']),  # 합계로 변경
+                'avg_turnaround': mean['avg_turnaround'],
+                'avg_waiting': mean['avg_waiting'],
+                'cpu_utilization': mean['cpu_utilization'],
+                'context_switches': mean['context_switches'],
+            }
         print("✓")
         
         # [6단계] 대표 회차 선정 (평균 반환시간과 가장 가까운 회차)
         print("\n대표 회차 선정 중...", end=" ")
-        representative_idx = 0
         if num_iterations > 1:
-            # FCFS 기준으로 평균과 가장 가까운 회차 선정
-            avg_tt = averaged_comparison['FCFS']['avg_turnaround']
-            min_diff = float('inf')
-            for i, result in enumerate(all_comparison_results):
-                diff = abs(result['FCFS']['avg_turnaround'] - avg_tt)
-                if diff < min_diff:
-                    min_diff = diff
-                    representative_idx = i
+            # FCFS 기준으로 평균과 가장 가까운 회차 선정 (회차마다 받아 둔 기록 중에서 고름, 다시 실행하지 않음)
+            representative_idx, records = candidates.representative(averaged_comparison['FCFS']['avg_turnaround'])
             print(f"✓ (회차 {representative_idx + 1}/{num_iterations})")
         else:
             print("✓")
         
-        # 대표 회차의 워크로드로 시각화용 시뮬레이션 실행
-        print("\n시각화를 위한 대표 회차 실행...")
-        
-        # 대표 회차 워크로드 재생성 (동일한 시드 사용 불가하므로 새로 생성)
-        master_process_list_normal = generate_random_processes(
-            num_processes=8,
-            arrival_lambda=3.0,
-            max_cpu_burst=20,
-            max_io_burst=30,
-            workload_distribution={'cpu_bound': 0.3, 'io_bound': 0.4, 'mixed': 0.3}
-        )
-        master_process_list_realtime = generate_random_realtime_processes(num_processes=5, target_utilization=0.98)
-        
-        # 간트 차트 시각화용 시뮬레이션 (출력 억제)
-        print("[1/8] FCFS...", end=" ")
-        non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-        sim_fcfs = SimulatorFCFS(non_rt_processes)
-        sim_fcfs.run()
-        visualizer.visualize_algorithm_complete(sim_fcfs.gantt_chart, sim_fcfs.completed_processes, "FCFS")
-        # [5단계] 프로세스 상태 타임라인 시각화 (대표 회차만)
-        if num_iterations == 1 or representative_idx == 0:
-            visualizer.visualize_process_state_timeline(sim_fcfs.completed_processes, "FCFS")
-        print("✓")
-        
-        print("[2/8] RR (Q=4)...", end=" ")
-        non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-        sim_rr = SimulatorRR(non_rt_processes, time_quantum=4)
-        sim_rr.run()
-        visualizer.visualize_algorithm_complete(sim_rr.gantt_chart, sim_rr.completed_processes, "RR (Q=4)")
-        if num_iterations == 1 or representative_idx == 0:
-            visualizer.visualize_process_state_timeline(sim_rr.completed_processes, "RR (Q=4)")
-        print("✓")
-        
-        print("[3/8] SJF (SRTF)...", end=" ")
-        non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-        sim_sjf = SimulatorSJF(non_rt_processes)
-        sim_sjf.run()
-        visualizer.visualize_algorithm_complete(sim_sjf.gantt_chart, sim_sjf.completed_processes, "SJF (Preemptive)")
-        if num_iterations == 1 or representative_idx == 0:
-            visualizer.visualize_process_state_timeline(sim_sjf.completed_processes, "SJF (Preemptive)")
-        print("✓")
-        
-        print("[4/8] Priority (Static)...", end=" ")
-        non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-        sim_prio = SimulatorPriorityStatic(non_rt_processes)
-        sim_prio.run()
-        visualizer.visualize_algorithm_complete(sim_prio.gantt_chart, sim_prio.completed_processes, "Priority (Static)")
-        if num_iterations == 1 or representative_idx == 0:
-            visualizer.visualize_process_state_timeline(sim_prio.completed_processes, "Priority (Static)")
-        print("✓")
-        
-        print("[5/8] Priority (Aging)...", end=" ")
-        non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-        sim_prio_dyn = SimulatorPriorityDynamic(non_rt_processes, aging_factor=10)
-        sim_prio_dyn.run()
-        visualizer.visualize_algorithm_complete(sim_prio_dyn.gantt_chart, sim_prio_dyn.completed_processes, "Priority (Aging)")
-        if num_iterations == 1 or representative_idx == 0:
-            visualizer.visualize_process_state_timeline(sim_prio_dyn.completed_processes, "Priority (Aging)")
-        print("✓")
-        
-        print("[6/8] MLFQ...", end=" ")
-        non_rt_processes = [p for p in copy.deepcopy(master_process_list_normal) if p.period == 0]
-        sim_mlfq = SimulatorMLFQ(non_rt_processes)
-        sim_mlfq.run()
-        visualizer.visualize_algorithm_complete(sim_mlfq.gantt_chart, sim_mlfq.completed_processes, "MLFQ")
-        if num_iterations == 1 or representative_idx == 0:
-            visualizer.visualize_process_state_timeline(sim_mlfq.completed_processes, "MLFQ")
-        print("✓")
-        
-        # ========== Realtime Scheduling Algorithms ==========
-        
-        print("[7/8] RM (Realtime)...", end=" ")
-        rt_processes_rm = copy.deepcopy(master_process_list_realtime)
-        sim_rm = SimulatorRM(rt_processes_rm, max_simulation_time=200)
-        sim_rm.run()
-        if sim_rm.completed_processes:
-            visualizer.visualize_algorithm_complete(sim_rm.gantt_chart, sim_rm.completed_processes, "Rate Monotonic")
-        print("✓")
-        
-        print("[8/8] EDF (Realtime)...", end=" ")
-        rt_processes_edf = copy.deepcopy(master_process_list_realtime)
-        sim_edf = SimulatorEDF(rt_processes_edf, max_simulation_time=200)
-        sim_edf.run()
-        if sim_edf.completed_processes:
-            visualizer.visualize_algorithm_complete(sim_edf.gantt_chart, sim_edf.completed_processes, "EDF")
-        print("✓")
+        # 대표 회차 시각화 (간트 차트 배열과 완료 프로세스 요약으로 그림)
+        print("\n대표 회차 시각화...")
+        
+        # (결과 키, 진행 표시 이름, 그래프 제목, 실시간 여부)
+        visualization_order = [
+            ('FCFS', "FCFS", "FCFS", False),
+            ('RR(Q=4)', "RR (Q=4)", "RR (Q=4)", False),
+            ('SJF', "SJF (SRTF)", "SJF (Preemptive)", False),
+            ('Priority(Static)', "Priority (Static)", "Priority (Static)", False),
+            ('Priority(Aging)', "Priority (Aging)", "Priority (Aging)", False),
+            ('MLFQ', "MLFQ", "MLFQ", False),
+            ('RM', "RM (Realtime)", "Rate Monotonic", True),
+            ('EDF', "EDF (Realtime)", "EDF", True),
+        ]
+        for step, (alg, label, title, realtime) in enumerate(visualization_order, 1):
+            print(f"[{step}/{len(visualization_order)}] {label}...", end=" ")
+            record = records.get(alg)
+            if record is not None and (record.completed_processes or not realtime):
+                visualizer.visualize_algorithm_complete(record.gantt_chart, record.completed_processes, title)
+                # [5단계] 프로세스 상태 타임라인 시각화 (대표 회차만)
+                if not realtime:
+                    visualizer.visualize_process_state_timeline(record.completed_processes, title)
+            print("✓")
         
         # ========== Generate Comparison Charts ==========
         
@@ -439,6 +291,11 @@ def run_simulations_with_visualization():
                     'std_turnaround': 0,
                     'std_waiting': 0,
                 }
+        # 꼬리 지연 (전체 회차 병합 분포의 p50/p95/p99)
+        for alg_name, latencies in all_latencies.items():
+            if alg_name in combined_comparison:
+                combined_comparison[alg_name]['tails'] = {metric: latencies[metric].percentiles()
+                                                          for metric in ('waiting', 'response')}
         visualizer.compare_algorithms(combined_comparison)
         print("✓")
         
@@ -450,30 +307,15 @@ def run_simulations_with_visualization():
         
         # 3. 통합 간트 차트 (대표 회차)
         print("  - 통합 간트 차트...", end=" ")
-        all_gantt_charts = {
-            'FCFS': sim_fcfs.gantt_chart,
-            'RR(Q=4)': sim_rr.gantt_chart,
-            'SJF': sim_sjf.gantt_chart,
-            'Priority(Static)': sim_prio.gantt_chart,
-            'Priority(Aging)': sim_prio_dyn.gantt_chart,
-            'MLFQ': sim_mlfq.gantt_chart,
-            'RM': sim_rm.gantt_chart,
-            'EDF': sim_edf.gantt_chart,
-        }
+        all_gantt_charts = {alg: record.gantt_chart for alg, record in records.items()}
         visualizer.visualize_all_gantt_charts(all_gantt_charts)
         print("✓")
         
         # 4. 문맥 교환 오버헤드 분석 그래프 (RM, EDF 포함)
         print("  - 문맥 교환 오버헤드 분석...", end=" ")
         overhead_data = {
-            'FCFS': {'context_switches': sim_fcfs.context_switches, 'total_overhead': sim_fcfs.total_overhead_time, 'total_time': sim_fcfs.current_time},
-            'RR(Q=4)': {'context_switches': sim_rr.context_switches, 'total_overhead': sim_rr.total_overhead_time, 'total_time': sim_rr.current_time},
-            'SJF': {'context_switches': sim_sjf.context_switches, 'total_overhead': sim_sjf.total_overhead_time, 'total_time': sim_sjf.current_time},
-            'Priority(Static)': {'context_switches': sim_prio.context_switches, 'total_overhead': sim_prio.total_overhead_time, 'total_time': sim_prio.current_time},
-            'Priority(Aging)': {'context_switches': sim_prio_dyn.context_switches, 'total_overhead': sim_prio_dyn.total_overhead_time, 'total_time': sim_prio_dyn.current_time},
-            'MLFQ': {'context_switches': sim_mlfq.context_switches, 'total_overhead': sim_mlfq.total_overhead_time, 'total_time': sim_mlfq.current_time},
-            'RM': {'context_switches': sim_rm.context_switches, 'total_overhead': sim_rm.total_overhead_time, 'total_time': sim_rm.current_time},
-            'EDF': {'context_switches': sim_edf.context_switches, 'total_overhead': sim_edf.total_overhead_time, 'total_time': sim_edf.current_time},
+            alg: {'context_switches': record.context_switches, 'total_overhead': record.total_overhead_time, 'total_time': record.current_time}
+            for alg, record in records.items()
         }
         visualizer.visualize_context_switch_overhead(overhead_data)
         print("✓")
@@ -484,15 +326,17 @@ def run_simulations_with_visualization():
         
         # Summary statistics (평균값 출력)
         print("\n📊 Algorithm Performance Summary (평균):")
-        print("-" * 110)
+        print("-" * 120)
         if num_iterations > 1:
-            print(f"{'Algorithm':<20} {'Avg TT':>12} {'±Std':>10} {'Avg WT':>12} {'±Std':>10} {'CPU Util':>12} {'Context SW':>12}")
+            print(f"{'Algorithm':<20} {'Avg TT':>12} {'±Std':>10} {'±95%CI':>9} {'Avg WT':>12} {'±Std':>10} {'±95%CI':>9} {'CPU Util':>12} {'Context SW':>12}")
         else:
             print(f"{'Algorithm':<20} {'Avg Turnaround':>15} {'Avg Waiting':>15} {'CPU Util':>12} {'Context SW':>12}")
-        print("-" * 110)
+        print("-" * 120)
         for alg, stats in averaged_comparison.items():
             if num_iterations > 1:
-                print(f"{alg:<20} {stats['avg_turnaround']:>11.2f}ms ±{stats['std_turnaround']:>8.2f} {stats['avg_waiting']:>11.2f}ms ±{stats['std_waiting']:>8.2f} {stats['cpu_utilization']:>11.2f}% {stats['context_switches']:>12.1f}")
+                print(f"{alg:<20} {stats['avg_turnaround']:>11.2f}ms ±{stats['std_turnaround']:>8.2f} ±{stats['ci_turnaround']:>7.2f} "
+                      f"{stats['avg_waiting']:>11.2f}ms ±{stats['std_waiting']:>8.2f} ±{stats['ci_waiting']:>7.2f} "
+                      f"{stats['cpu_utilization']:>11.2f}% {stats['context_switches']:>12.1f}")
             else:
                 print(f"{alg:<20} {stats['avg_turnaround']:>14.2f}ms {stats['avg_waiting']:>14.2f}ms {stats['cpu_utilization']:>11.2f}% {stats['context_switches']:>12.0f}")
         
@@ -503,6 +347,19 @@ def run_simulations_with_visualization():
             print("-" * 90)
             for alg, stats in averaged_realtime.items():
                 print(f"{alg:<20} {stats['deadline_misses']:>18.0f} {stats['avg_turnaround']:>14.2f}ms {stats['context_switches']:>12.1f}")
+
+        if all_latencies:
+            print(f"\n📊 Tail Latency Summary (전체 {num_iterations}회 작업 병합):")
+            print("-" * 110)
+            print(f"{'Algorithm':<20} {'Jobs':>8} {'WT p50':>10} {'WT p95':>10} {'WT p99':>10} {'RT p50':>10} {'RT p95':>10} {'RT p99':>10}")
+            print("-" * 110)
+            for alg, latencies in all_latencies.items():
+                waiting = latencies['waiting'].percentiles()
+                response = latencies['response'].percentiles()
+                print(f"{alg:<20} {len(latencies['waiting']):>8} "
+                      + " ".join(f"{waiting[p]:>8.1f}ms" for p in ('p50', 'p95', 'p99')) + " "
+                      + " ".join(f"{response[p]:>8.1f}ms" for p in ('p50', 'p95', 'p99')))
+            print("(WT: 대기 시간, RT: 응답 시간 = 처음 CPU 할당 시각 - 도착 시각)")
         
         print("\n" + "=" * 70)
 
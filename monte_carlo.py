@@ -0,0 +1,380 @@
+"""
+반복 실행(Monte Carlo) 러너
+
+SCHEDULING 모드의 반복 회차를 ProcessPoolExecutor로 여러 프로세스에 나누어 실행합니다.
+
+- 회차 i의 워크로드는 iteration_seed(base_seed, i)로 시드를 고정한 난수로 생성되므로
+  직렬/병렬 여부나 작업자 수와 관계없이 같은 회차는 같은 결과를 냅니다.
+- 결과는 회차 순서대로 스트리밍됩니다. (Executor.map)
+  회차 수를 None으로 주면 끝없이 실행하므로 호출자가 precise_enough() 같은 조건으로 멈춥니다.
+- 작업자 프로세스는 NULL_TRACER로 실행되어 이벤트 출력 비용이 없습니다.
+  장치 I/O 워크로드(io_device)를 쓰면 작업자마다 시작할 때 devices를 기본 ResourceManager에 등록합니다.
+- keep_records=True면 회차마다 시각화에 필요한 결과(SimulationRecord: 간트 차트 배열, 완료 프로세스 요약)도
+  함께 돌려주므로 대표 회차를 다시 생성/실행하지 않고 그대로 그릴 수 있습니다.
+  RepresentativeCandidates는 기준 지표가 평균에 가까운 회차의 기록만 남기므로 회차 수와 관계없이 메모리가 일정합니다.
+- 알고리즘별 결과의 'latency'는 작업별 대기/응답/반환 시간 분포(latency_sketch.LatencySketch)입니다.
+  collect_latencies()로 회차마다 꺼내어 병합하면 작업 기록을 보관하지 않고도 전체 회차의 p95/p99를 구할 수 있습니다.
+"""
+import collections
+import contextlib
+import functools
+import io
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from process import Workload
+from simulator_fcfs import SimulatorFCFS
+from simulator_rr import SimulatorRR
+from simulator_sjf import SimulatorSJF
+from simulator_priority_static import SimulatorPriorityStatic
+from simulator_priority_dynamic import SimulatorPriorityDynamic
+from simulator_mlfq import SimulatorMLFQ
+from simulator_rm import SimulatorRM
+from simulator_edf import SimulatorEDF
+from generator import seed_generators, generate_random_processes, generate_random_realtime_processes
+from sync import initialize_devices
+from tracer import set_tracer, get_tracer, NULL_TRACER
+from latency_sketch import merge_latencies
+
+# --- SCHEDULING 모드 워크로드 파라미터 ---
+NORMAL_WORKLOAD = {
+    'num_processes': 8,
+    'arrival_lambda': 3.0,  # 평균 3ms 간격으로 도착
+    'max_cpu_burst': 20,
+    'max_io_burst': 30,
+    'workload_distribution': {'cpu_bound': 0.3, 'io_bound': 0.4, 'mixed': 0.3},
+}
+REALTIME_WORKLOAD = {'num_processes': 5, 'target_utilization': 0.98}
+
+SEED_RANGE = 2 ** 32  # numpy 시드 범위
+
+# 회차 수를 정하지 않은 반복 (GUI 반복 횟수 0): 모든 일반 알고리즘의 평균 반환 시간
+# 95% 신뢰구간 반폭이 평균의 relative_ci 이하가 되면 멈춤 (결과는 WelfordAccumulator로 누적, 메모리 고정)
+AUTO_ITERATIONS = {
+    'min_iterations': 30,       # 신뢰구간을 판단하기 전 최소 회차
+    'max_iterations': 100000,   # 수렴하지 않을 때의 상한
+    'relative_ci': 0.02,
+    'report_every': 50,         # 진행 상황 출력 간격
+}
+UNBOUNDED_BATCH_PER_WORKER = 16  # 회차 수를 모를 때 작업자마다 한 번에 제출하는 회차 수
+UNBOUNDED_CHUNKSIZE = 4
+
+# run_single_simulation 결과의 알고리즘 이름 (comparison_results, realtime_results 순서)
+NORMAL_ALGORITHMS = ('FCFS', 'RR(Q=4)', 'SJF', 'Priority(Static)', 'Priority(Aging)', 'MLFQ')
+REALTIME_ALGORITHMS = ('RM', 'EDF')
+
+# 대표 회차 후보로 보관할 회차 수 (GUI 최대 반복 횟수보다 크므로 보통은 모든 회차를 보관)
+REPRESENTATIVE_CANDIDATES = 32
+
+# 시각화에 필요한 완료 프로세스 요약 (visualizer가 읽는 속성만, timeline은 (start, end, state) 튜플)
+ProcessSummary = collections.namedtuple(
+    'ProcessSummary', 'pid arrival_time completion_time turnaround_time wait_time static_priority period timeline')
+
+# 시각화에 필요한 시뮬레이션 결과 (시뮬레이터 객체 대신 보관, 작업자 프로세스에서 pickle로 전달)
+# gantt_chart는 (pid, start, end) 행의 int32 배열, completed_processes는 ProcessSummary 튜플
+SimulationRecord = collections.namedtuple(
+    'SimulationRecord', 'gantt_chart completed_processes context_switches total_overhead_time current_time')
+
+
+def summarize_process(proc):
+    """완료된 Process에서 ProcessSummary를 만듭니다. (상태 타임라인은 저장소에서 꺼내 튜플로 고정)"""
+    return ProcessSummary(proc.pid, proc.arrival_time, proc.completion_time, proc.turnaround_time,
+                          proc.wait_time, proc.static_priority, proc.period, tuple(proc.timeline))
+
+
+def record_simulation(sim):
+    """실행이 끝난 시뮬레이터에서 SimulationRecord를 만듭니다."""
+    gantt = np.array(sim.gantt_chart, dtype=np.int32).reshape(-1, 3)
+    completed = tuple(summarize_process(proc) for proc in sim.completed_processes)
+    return SimulationRecord(gantt, completed, sim.context_switches, sim.total_overhead_time, sim.current_time)
+
+
+class RepresentativeCandidates:
+    """
+    대표 회차 후보 (기준 지표가 누적 평균에 가까운 회차 capacity개의 SimulationRecord만 보관)
+
+    회차 수가 capacity 이하이면 모든 회차를 보관하므로 representative()는 전체 회차 중 평균에 가장 가까운 회차와 같습니다.
+    넘치면 그때까지의 누적 평균에서 가장 먼 후보를 버립니다.
+
+    :param algorithm, metric: 기준 지표 (comparison_results[algorithm][metric])
+    """
+    def __init__(self, algorithm='FCFS', metric='avg_turnaround', capacity=REPRESENTATIVE_CANDIDATES):
+        self.algorithm = algorithm
+        self.metric = metric
+        self.capacity = capacity
+        self.count = 0
+        self.total = 0.0
+        self.candidates = []  # (회차 번호, 기준 지표 값, records)
+
+    def __len__(self):
+        return len(self.candidates)
+
+    def offer(self, iteration, comparison_results, records):
+        """회차 하나의 결과를 후보로 넣습니다. (기준 지표가 없는 회차는 무시)"""
+        value = comparison_results.get(self.algorithm, {}).get(self.metric)
+        if value is None:
+            return
+        self.count += 1
+        self.total += value
+        self.candidates.append((iteration, value, records))
+        if len(self.candidates) > self.capacity:
+            mean = self.total / self.count
+            farthest = max(self.candidates, key=lambda c: (abs(c[1] - mean), c[0]))
+            self.candidates.remove(farthest)
+
+    def representative(self, mean=None):
+        """
+        mean(없으면 누적 평균)에 가장 가까운 후보의 (회차 번호, records)를 반환합니다. (같으면 앞 회차, 후보가 없으면 (0, {}))
+        """
+        if not self.candidates:
+            return 0, {}
+        if mean is None:
+            mean = self.total / self.count
+        iteration, _, records = min(self.candidates, key=lambda c: (abs(c[1] - mean), c[0]))
+        return iteration, records
+
+
+def collect_latencies(total, *results):
+    """
+    회차 결과(comparison_results, realtime_results)에서 알고리즘별 'latency' 스케치를 꺼내 total에 병합합니다.
+    (결과에서 제거하므로 회차 결과를 보관해도 스케치는 total에만 남음)
+
+    :param total: {알고리즘: {지표: LatencySketch}} (병합 대상, 갱신됨)
+    """
+    for result in results:
+        for alg, stats in result.items():
+            latencies = stats.pop('latency', None)
+            if latencies is not None:
+                merge_latencies(total.setdefault(alg, {}), latencies)
+    return total
+
+
+def generate_workload(io_device=None):
+    """
+    SCHEDULING 모드 워크로드 (일반 프로세스, 실시간 프로세스) 리스트를 생성합니다.
+
+    :param io_device: 일반 프로세스의 I/O를 보낼 장치 이름 (None이면 장치 제한 없는 I/O)
+    """
+    normal = generate_random_processes(**NORMAL_WORKLOAD, io_device=io_device)
+    realtime = generate_random_realtime_processes(**REALTIME_WORKLOAD)
+    return normal, realtime
+
+
+def new_base_seed():
+    """반복 실행 전체의 기본 시드를 새로 뽑습니다. (출력해 두면 같은 실행을 재현 가능)"""
+    return random.SystemRandom().randrange(SEED_RANGE)
+
+
+def iteration_seed(base_seed, iteration):
+    """
+    회차별 시드 (기본 시드가 가까워도 회차 시드가 겹치지 않도록 황금비 상수로 분산)
+    """
+    return (base_seed + iteration * 0x9E3779B1) % SEED_RANGE
+
+
+def run_single_simulation(master_process_list_normal, master_process_list_realtime, records=None):
+    """
+    단일 시뮬레이션 실행 및 결과 반환 (반복 실행용)
+
+    :param records: 딕셔너리를 넘기면 알고리즘 이름별 SimulationRecord를 채움 (시각화용)
+    """
+    comparison_results = {}
+    realtime_results = {}
+
+    # 워크로드를 불변 명세로 한 번만 변환하고, 알고리즘마다 새 Process를 생성 (deepcopy 대신)
+    workload_normal = Workload.from_processes(master_process_list_normal)
+    workload_realtime = Workload.from_processes(master_process_list_realtime)
+    
+    # 1. FCFS
+    non_rt_processes = workload_normal.instantiate(realtime=False)
+    sim_fcfs = SimulatorFCFS(non_rt_processes)
+    sim_fcfs.run()
+    fcfs_n = len(sim_fcfs.completed_processes)
+    comparison_results['FCFS'] = {
+        'avg_turnaround': (sum(p.turnaround_time for p in sim_fcfs.completed_processes) / fcfs_n) if fcfs_n > 0 else 0,
+        'avg_waiting': (sum(p.wait_time for p in sim_fcfs.completed_processes) / fcfs_n) if fcfs_n > 0 else 0,
+        'cpu_utilization': (sum(end - start for pid, start, end in sim_fcfs.gantt_chart) / sim_fcfs.current_time) * 100 if sim_fcfs.current_time > 0 else 0,
+        'context_switches': sim_fcfs.context_switches,
+        'latency': sim_fcfs.latencies
+    }
+    if records is not None:
+        records['FCFS'] = record_simulation(sim_fcfs)
+    
+    # 2. RR (Q=4)
+    non_rt_processes = workload_normal.instantiate(realtime=False)
+    sim_rr = SimulatorRR(non_rt_processes, time_quantum=4)
+    sim_rr.run()
+    rr_n = len(sim_rr.completed_processes)
+    comparison_results['RR(Q=4)'] = {
+        'avg_turnaround': (sum(p.turnaround_time for p in sim_rr.completed_processes) / rr_n) if rr_n > 0 else 0,
+        'avg_waiting': (sum(p.wait_time for p in sim_rr.completed_processes) / rr_n) if rr_n > 0 else 0,
+        'cpu_utilization': (sum(end - start for pid, start, end in sim_rr.gantt_chart) / sim_rr.current_time) * 100 if sim_rr.current_time > 0 else 0,
+        'context_switches': sim_rr.context_switches,
+        'latency': sim_rr.latencies
+    }
+    if records is not None:
+        records['RR(Q=4)'] = record_simulation(sim_rr)
+    
+    # 3. SJF (SRTF)
+    non_rt_processes = workload_normal.instantiate(realtime=False)
+    sim_sjf = SimulatorSJF(non_rt_processes)
+    sim_sjf.run()
+    sjf_n = len(sim_sjf.completed_processes)
+    comparison_results['SJF'] = {
+        'avg_turnaround': (sum(p.turnaround_time for p in sim_sjf.completed_processes) / sjf_n) if sjf_n > 0 else 0,
+        'avg_waiting': (sum(p.wait_time for p in sim_sjf.completed_processes) / sjf_n) if sjf_n > 0 else 0,
+        'cpu_utilization': (sum(end - start for pid, start, end in sim_sjf.gantt_chart) / sim_sjf.current_time) * 100 if sim_sjf.current_time > 0 else 0,
+        'context_switches': sim_sjf.context_switches,
+        'latency': sim_sjf.latencies
+    }
+    if records is not None:
+        records['SJF'] = record_simulation(sim_sjf)
+    
+    # 4. Static Priority
+    non_rt_processes = workload_normal.instantiate(realtime=False)
+    sim_prio = SimulatorPriorityStatic(non_rt_processes)
+    sim_prio.run()
+    prio_n = len(sim_prio.completed_processes)
+    comparison_results['Priority(Static)'] = {
+        'avg_turnaround': (sum(p.turnaround_time for p in sim_prio.completed_processes) / prio_n) if prio_n > 0 else 0,
+        'avg_waiting': (sum(p.wait_time for p in sim_prio.completed_processes) / prio_n) if prio_n > 0 else 0,
+        'cpu_utilization': (sum(end - start for pid, start, end in sim_prio.gantt_chart) / sim_prio.current_time) * 100 if sim_prio.current_time > 0 else 0,
+        'context_switches': sim_prio.context_switches,
+        'latency': sim_prio.latencies
+    }
+    if records is not None:
+        records['Priority(Static)'] = record_simulation(sim_prio)
+    
+    # 5. Dynamic Priority (Aging)
+    non_rt_processes = workload_normal.instantiate(realtime=False)
+    sim_prio_dyn = SimulatorPriorityDynamic(non_rt_processes, aging_factor=10)
+    sim_prio_dyn.run()
+    prio_dyn_n = len(sim_prio_dyn.completed_processes)
+    comparison_results['Priority(Aging)'] = {
+        'avg_turnaround': (sum(p.turnaround_time for p in sim_prio_dyn.completed_processes) / prio_dyn_n) if prio_dyn_n > 0 else 0,
+        'avg_waiting': (sum(p.wait_time for p in sim_prio_dyn.completed_processes) / prio_dyn_n) if prio_dyn_n > 0 else 0,
+        'cpu_utilization': (sum(end - start for pid, start, end in sim_prio_dyn.gantt_chart) / sim_prio_dyn.current_time) * 100 if sim_prio_dyn.current_time > 0 else 0,
+        'context_switches': sim_prio_dyn.context_switches,
+        'latency': sim_prio_dyn.latencies
+    }
+    if records is not None:
+        records['Priority(Aging)'] = record_simulation(sim_prio_dyn)
+    
+    # 6. MLFQ
+    non_rt_processes = workload_normal.instantiate(realtime=False)
+    sim_mlfq = SimulatorMLFQ(non_rt_processes)
+    sim_mlfq.run()
+    mlfq_n = len(sim_mlfq.completed_processes)
+    comparison_results['MLFQ'] = {
+        'avg_turnaround': (sum(p.turnaround_time for p in sim_mlfq.completed_processes) / mlfq_n) if mlfq_n > 0 else 0,
+        'avg_waiting': (sum(p.wait_time for p in sim_mlfq.completed_processes) / mlfq_n) if mlfq_n > 0 else 0,
+        'cpu_utilization': (sum(end - start for pid, start, end in sim_mlfq.gantt_chart) / sim_mlfq.current_time) * 100 if sim_mlfq.current_time > 0 else 0,
+        'context_switches': sim_mlfq.context_switches,
+        'latency': sim_mlfq.latencies
+    }
+    if records is not None:
+        records['MLFQ'] = record_simulation(sim_mlfq)
+    
+    # 7. RM (Rate Monotonic)
+    if workload_realtime:
+        rt_processes_rm = workload_realtime.instantiate()
+        sim_rm = SimulatorRM(rt_processes_rm)
+        sim_rm.run()
+        if records is not None:
+            records['RM'] = record_simulation(sim_rm)
+        if sim_rm.completed_processes:
+            realtime_results['RM'] = dict(sim_rm.stats(), latency=sim_rm.latencies)
+    
+    # 8. EDF (Earliest Deadline First)
+    if workload_realtime:
+        rt_processes_edf = workload_realtime.instantiate()
+        sim_edf = SimulatorEDF(rt_processes_edf)
+        sim_edf.run()
+        if records is not None:
+            records['EDF'] = record_simulation(sim_edf)
+        if sim_edf.completed_processes:
+            realtime_results['EDF'] = dict(sim_edf.stats(), latency=sim_edf.latencies)
+    
+    return comparison_results, realtime_results
+
+
+def run_iteration(seed, keep_records=False, io_device=None):
+    """
+    시드 하나로 워크로드를 생성하고 8개 알고리즘을 실행합니다. (생성기 출력은 버림)
+
+    :param io_device: 일반 프로세스의 I/O를 보낼 장치 이름 (generate_workload 참고, 장치는 미리 등록되어 있어야 함)
+    :return: (comparison_results, realtime_results), keep_records=True면 records(알고리즘별 SimulationRecord)까지
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        seed_generators(seed)
+        normal, realtime = generate_workload(io_device)
+    if not keep_records:
+        return run_single_simulation(normal, realtime)
+    records = {}
+    comparison_results, realtime_results = run_single_simulation(normal, realtime, records)
+    return comparison_results, realtime_results, records
+
+
+def _init_worker(devices=None):
+    set_tracer(NULL_TRACER)
+    if devices:
+        initialize_devices(devices)
+
+
+def run_iterations(num_iterations, base_seed, workers=None, keep_records=False, io_device=None, devices=None):
+    """
+    num_iterations 회차를 실행하고 (comparison_results, realtime_results)를 회차 순서대로 yield합니다.
+
+    :param num_iterations: 회차 수 (None: 끝없이 실행, 호출자가 반복을 멈추면 남은 회차는 취소)
+    :param base_seed: 기본 시드 (회차 i는 iteration_seed(base_seed, i) 사용)
+    :param workers: 작업자 프로세스 수 (None: CPU 코어 수, 1 이하: 현재 프로세스에서 직렬 실행)
+    :param keep_records: True면 (comparison_results, realtime_results, records)를 yield (run_iteration 참고)
+    :param io_device: 일반 프로세스의 I/O를 보낼 장치 이름 (run_iteration 참고)
+    :param devices: 실행 전에 등록할 I/O 장치 (sync.initialize_devices 인자, 작업자 프로세스마다 등록)
+    """
+    iteration = functools.partial(run_iteration, keep_records=keep_records, io_device=io_device)
+    counter = itertools.count() if num_iterations is None else range(num_iterations)
+    seeds = (iteration_seed(base_seed, i) for i in counter)
+    if workers is None:
+        workers = os.cpu_count() or 1
+        if num_iterations is not None:
+            workers = min(workers, num_iterations)
+
+    if workers <= 1:
+        console_tracer = get_tracer()
+        _init_worker(devices)
+        try:
+            for seed in seeds:
+                yield iteration(seed)
+        finally:
+            set_tracer(console_tracer)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(devices,)) as executor:
+        if num_iterations is not None:
+            # 작업 하나가 짧으므로 작업자마다 여러 회차씩 묶어서 전달 (IPC 비용 감소)
+            chunksize = max(1, num_iterations // (workers * 8))
+            yield from executor.map(iteration, seeds, chunksize=chunksize)
+            return
+        # 회차 수를 모르면 Executor.map이 입력을 미리 모두 제출하지 않도록 묶음 단위로 제출
+        batch = workers * UNBOUNDED_BATCH_PER_WORKER
+        while True:
+            yield from executor.map(iteration, itertools.islice(seeds, batch), chunksize=UNBOUNDED_CHUNKSIZE)
+
+
+def precise_enough(results, algorithms=NORMAL_ALGORITHMS, metric='avg_turnaround',
+                   relative_ci=AUTO_ITERATIONS['relative_ci']):
+    """
+    algorithms의 metric 95% 신뢰구간 반폭이 모두 평균의 relative_ci 이하인지 (회차 수를 정하지 않은 반복의 종료 조건)
+
+    :param results: ResultsCube 또는 WelfordAccumulator
+    """
+    mean, ci = results.mean(), results.confidence_interval()
+    rows = [results.alg_index[alg] for alg in algorithms]
+    column = results.metric_index[metric]
+    with np.errstate(invalid='ignore'):
+        return bool(np.all(ci[rows, column] <= relative_ci * np.abs(mean[rows, column])))
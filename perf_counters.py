@@ -0,0 +1,151 @@
+"""
+시뮬레이터 메인 루프 단계별 성능 카운터 (opt-in 프로파일링)
+
+sim.enable_profiling()을 호출한 시뮬레이터만 단계 메서드를 시간을 재는 래퍼로 바꿉니다.
+래퍼는 인스턴스 속성으로 설치되므로(클래스 메서드를 가림) 프로파일링하지 않는 시뮬레이터의
+실행 경로에는 검사나 카운터가 전혀 없습니다.
+
+단계 (PHASES, 호출 횟수와 누적 시간):
+    arrivals       : 신규 프로세스 도착 처리 (_handle_arrivals)
+    io_completion  : I/O 완료 처리 (_handle_io_completions)
+    preemption     : 선점 검사 (_check_preemption)
+    dispatch       : Ready 큐에서 선택 + 문맥 교환 (_dispatch)
+    execute        : 1틱 실행 또는 0-tick 명령 처리 (_execute)
+    advance_clock  : 다음 이벤트 시각까지 시계 이동 (_advance_clock)
+    queue_log      : 큐 변경 이력 기록 (QueueLog.ready_in 등)
+    시간은 포함(inclusive) 시간입니다. queue_log와 Ready 큐 정책 호출은 그것을 부른 단계의 시간에도 포함됩니다.
+
+횟수 (COUNTS):
+    ready_push / ready_pop     : Ready 큐 삽입(enqueue)/꺼내기(pick) (SJF, 우선순위, RM, EDF는 힙 연산)
+    waiting_push / waiting_pop : I/O 완료 힙 삽입/꺼내기
+    arrival_push / arrival_pop : 도착 큐 삽입(실시간 다음 주기 작업, 힙)/꺼내기
+    preemption_checks          : 정책의 should_preempt() 호출
+    preemptions                : 선점된 횟수
+    context_switches           : 문맥 교환 횟수 (시뮬레이터 통계와 같음)
+"""
+import time
+
+PHASES = ('arrivals', 'io_completion', 'preemption', 'dispatch', 'execute', 'advance_clock', 'queue_log')
+
+# 시뮬레이터 메서드 -> 단계
+PHASE_METHODS = {
+    '_handle_arrivals': 'arrivals',
+    '_handle_io_completions': 'io_completion',
+    '_check_preemption': 'preemption',
+    '_dispatch': 'dispatch',
+    '_execute': 'execute',
+    '_advance_clock': 'advance_clock',
+}
+QUEUE_LOG_METHODS = ('ready_in', 'ready_out', 'waiting_in', 'waiting_out')
+
+COUNTS = ('ready_push', 'ready_pop', 'waiting_push', 'waiting_pop', 'arrival_push', 'arrival_pop',
+          'preemption_checks', 'preemptions', 'context_switches')
+
+
+class PerfCounters:
+    """
+    시뮬레이터 하나의 단계별 시간/호출 횟수와 자료구조 연산 횟수
+    """
+    def __init__(self):
+        self.times = dict.fromkeys(PHASES, 0)  # 누적 시간 (ns)
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.counts = dict.fromkeys(COUNTS, 0)
+        self.total = 0  # run() 전체 시간 (ns)
+        self.sim = None
+
+    def attach(self, sim):
+        """sim의 단계 메서드와 Ready 큐/도착 큐/큐 로그 메서드를 카운터 래퍼로 바꿉니다. (run() 전에 호출)"""
+        self.sim = sim
+        for method, phase in PHASE_METHODS.items():
+            setattr(sim, method, self._timed(phase, getattr(sim, method)))
+        for method in QUEUE_LOG_METHODS:
+            setattr(sim.queue_log, method, self._timed('queue_log', getattr(sim.queue_log, method)))
+
+        # I/O 완료 힙에서 꺼낼 때마다 waiting_out이 기록됨
+        sim.queue_log.waiting_out = self._counted('waiting_pop', sim.queue_log.waiting_out)
+        sim._check_preemption = self._counting_preemption(sim._check_preemption)
+        sim.should_preempt = self._counted('preemption_checks', sim.should_preempt)
+        sim.enqueue = self._counted('ready_push', sim.enqueue)
+        sim.pick = self._counting_pick(sim.pick)
+        sim.processes_to_arrive.push = self._counted('arrival_push', sim.processes_to_arrive.push)
+        sim.processes_to_arrive.pop = self._counted('arrival_pop', sim.processes_to_arrive.pop)
+        sim.run = self._timed_run(sim.run)
+
+    def attach_smp(self, engine):
+        """다중 CPU 실행 엔진의 시계 이동을 측정합니다. (SMPEngine은 run()에서 만들어지므로 그때 호출됨)"""
+        engine._advance_clock = self._timed('advance_clock', engine._advance_clock)
+
+    def _timed(self, phase, func):
+        times, calls, clock = self.times, self.calls, time.perf_counter_ns
+
+        def timed(*args):
+            start = clock()
+            result = func(*args)
+            times[phase] += clock() - start
+            calls[phase] += 1
+            return result
+        return timed
+
+    def _counted(self, name, func):
+        counts = self.counts
+
+        def counted(*args):
+            counts[name] += 1
+            return func(*args)
+        return counted
+
+    def _counting_pick(self, pick):
+        counts = self.counts
+
+        def counting_pick():
+            proc = pick()
+            if proc is not None:
+                counts['ready_pop'] += 1
+            return proc
+        return counting_pick
+
+    def _counting_preemption(self, check):
+        sim, counts = self.sim, self.counts
+
+        def counting_preemption():
+            running = sim.running_process
+            check()
+            if running is not None and sim.running_process is None:
+                counts['preemptions'] += 1
+        return counting_preemption
+
+    def _timed_run(self, run):
+        def timed_run():
+            start = time.perf_counter_ns()
+            run()
+            self.total += time.perf_counter_ns() - start
+        return timed_run
+
+    def as_dict(self):
+        """
+        카운터를 딕셔너리로 반환합니다. (시간은 초 단위)
+
+        {'total_s': ..., 'phases': {단계: {'calls': n, 'time_s': t}}, 'counts': {...}}
+        """
+        sim = self.sim
+        counts = dict(self.counts)
+        if sim is not None:
+            counts['waiting_push'] = counts['waiting_pop'] + len(sim.waiting_queue)  # 삽입 수 = 꺼낸 수 + 남은 수
+            counts['context_switches'] = sim.context_switches
+        return {
+            'total_s': self.total / 1e9,
+            'phases': {phase: {'calls': self.calls[phase], 'time_s': self.times[phase] / 1e9} for phase in PHASES},
+            'counts': counts,
+        }
+
+    def print_summary(self):
+        """단계별 시간 비율과 횟수를 출력합니다."""
+        data = self.as_dict()
+        total = data['total_s']
+        print(f"\n--- 단계별 실행 시간 (run() 전체 {total * 1000:.2f}ms, 포함 시간) ---")
+        print(f"{'단계':<16}{'호출':>10}{'시간(ms)':>12}{'비율':>8}{'호출당(us)':>12}")
+        for phase, stat in data['phases'].items():
+            share = stat['time_s'] / total * 100 if total > 0 else 0
+            per_call = stat['time_s'] / stat['calls'] * 1e6 if stat['calls'] else 0
+            print(f"{phase:<16}{stat['calls']:>10}{stat['time_s'] * 1000:>12.2f}{share:>7.1f}%{per_call:>12.2f}")
+        print("횟수: " + ", ".join(f"{name} {count}" for name, count in data['counts'].items()))
@@ -1,5 +1,132 @@
 import collections
 import re
+from dataclasses import dataclass
+from enum import IntEnum
+
+# -------------------------------------------------------------------
+# 0. 상태 코드 / 명령 코드
+# -------------------------------------------------------------------
+class State(IntEnum):
+    """프로세스 상태 코드"""
+    READY = 0
+    RUNNING = 1
+    WAITING = 2      # I/O 대기 + '자원(Mutex) 대기' 포함
+    TERMINATED = 3
+
+    @property
+    def label(self):
+        """출력/시각화용 이름 (e.g., 'Ready')"""
+        return self.name.capitalize()
+
+
+class Op(IntEnum):
+    """버스트 명령 코드"""
+    CPU = 0
+    IO = 1
+    LOCK = 2
+    UNLOCK = 3
+
+
+# 시뮬레이터 루프에서 쓰는 모듈 상수 (Op.CPU 속성 조회보다 빠름)
+READY, RUNNING, WAITING, TERMINATED = State
+CPU, IO, LOCK, UNLOCK = Op
+
+
+class IORequest(collections.namedtuple('IORequest', 'device duration track')):
+    """
+    장치를 지정한 I/O 버스트 값 ("IO:disk0:10" 또는 "IO:disk0:10:57")
+
+    device: I/O 장치 이름 (io_device.IODevice, ResourceManager에 등록)
+    duration: 전송 시간 (탐색 시간 제외)
+    track: 요청 트랙 (None이면 탐색 없음)
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        if self.track is None:
+            return f"{self.device}:{self.duration}"
+        return f"{self.device}:{self.duration}:{self.track}"
+
+
+def io_time(value):
+    """I/O 버스트 값(정수 또는 IORequest)의 전송 시간을 반환합니다."""
+    if isinstance(value, IORequest):
+        return value.duration
+    return value
+
+
+def format_bursts(burst_pattern):
+    """
+    burst_pattern 리스트를 입력 파일 형식 문자열로 되돌립니다.
+    e.g., [(Op.CPU, 5), (Op.IO, 10)] -> "CPU:5,IO:10"
+          [(Op.IO, IORequest('disk0', 10, 57))] -> "IO:disk0:10:57"
+    """
+    return ",".join(f"{op.name}:{value}" for op, value in burst_pattern)
+
+
+def format_input_line(proc):
+    """
+    Process를 입력 파일의 한 줄 형식으로 되돌립니다. (줄바꿈 제외, max_claim이 있으면 7번째 열 포함)
+    e.g., '1,0,3,"CPU:5,IO:10",0,0'
+    """
+    line = f'{proc.pid},{proc.arrival_time},{proc.static_priority},"{format_bursts(proc.burst_pattern)}",{proc.period},{proc.deadline}'
+    if proc.max_claim:
+        line += ',"' + ",".join(f"{name}:{count}" for name, count in proc.max_claim) + '"'
+    return line
+
+
+def parse_claims(pid, claims_str):
+    """
+    "R1:1,Buffer:2" 문자열을 (('R1', 1), ('Buffer', 2)) 튜플로 변환합니다. (자원별 최대 요구량)
+    (잘못된 항목은 경고 후 건너뜀)
+    """
+    claims = []
+    for item in claims_str.split(','):
+        name, _, count = item.partition(':')
+        try:
+            claims.append((name.strip(), int(count)))
+        except ValueError:
+            print(f"경고: P{pid}의 최대 요구량 형식이 잘못되었습니다: '{item}'. 건너뜁니다.")
+    return tuple(claims)
+
+
+def parse_bursts(pid, burst_pattern_str):
+    """
+    "CPU:5,IO:10,LOCK:R1" 문자열을 [(Op.CPU, 5), (Op.IO, 10), (Op.LOCK, 'R1')] 리스트로 변환합니다.
+    I/O는 "IO:<장치>:<시간>[:<트랙>]"으로 장치를 지정할 수 있습니다. (-> IORequest, 지정하지 않으면 장치 제한 없음)
+    (잘못된 항목은 경고 후 건너뛰고, 파싱 오류 시 빈 리스트)
+    """
+    burst_pattern = []
+    try:
+        # 빈 문자열이 아닐 경우에만 파싱 시도
+        if burst_pattern_str:
+            bursts = burst_pattern_str.split(',')
+            for burst in bursts:
+                parts = burst.split(':')
+                if len(parts) < 2:
+                    print(f"경고: P{pid}의 버스트 형식이 잘못되었습니다: '{burst}'. 건너뜁니다.")
+                    continue
+                    
+                command = parts[0].upper().strip() # CPU, IO, LOCK, UNLOCK
+                value_str = parts[1].strip()
+                op = Op.__members__.get(command)
+                
+                if op is IO and len(parts) >= 3:
+                    track = int(parts[3]) if len(parts) >= 4 else None
+                    burst_pattern.append((op, IORequest(value_str, int(parts[2]), track)))
+                elif op is CPU or op is IO:
+                    value = int(value_str)
+                    burst_pattern.append((op, value))
+                elif op is LOCK or op is UNLOCK:
+                    value = value_str # 자원 이름 (e.g., "Printer")
+                    burst_pattern.append((op, value))
+                else:
+                    print(f"경고: P{pid}의 알 수 없는 명령어: '{command}'. 건너뜁니다.")
+    except Exception as e:
+        print(f"오류: P{pid}의 실행 패턴 파싱 실패: '{burst_pattern_str}' ({e})")
+        burst_pattern = [] # 오류 시 빈 패턴
+    return burst_pattern
+
 
 # -------------------------------------------------------------------
 # 1. 프로세스(PCB)를 정의하는 클래스
@@ -8,47 +135,39 @@ class Process:
     """
     Process Control Block (PCB) 역할을 하는 클래스입니다.
     (sync 기능 추가로 burst_pattern 처리 방식 변경됨)
+
+    수천 개의 인스턴스가 만들어지므로 __slots__로 속성을 고정하고,
+    상태와 명령은 정수 코드(State, Op)로 저장합니다.
     """
-    # 프로세스 상태를 문자열 상수로 정의
-    READY = 'Ready'
-    RUNNING = 'Running'
-    WAITING = 'Waiting'      # I/O 대기 + '자원(Mutex) 대기' 포함
-    TERMINATED = 'Terminated'
+    __slots__ = (
+        'pid', 'arrival_time', 'static_priority', 'dynamic_priority',
+        'burst_pattern', 'current_burst_index', 'remaining_cpu_time',
+        'state', 'held_resources', 'blocked_on', 'io_device', 'max_claim', 'inherited_priority',
+        'period', 'deadline', 'absolute_deadline',
+        'wait_time', 'turnaround_time', 'last_ready_time', 'completion_time', 'first_run_time',
+        'ready_wait_time', 'io_wait_time', 'blocking_time', 'blocked_since', 'timeline_store', 'timeline_slot',
+    )
 
-    def __init__(self, pid, arrival_time, priority, burst_pattern_str, period=0, deadline=0):
+    # 프로세스 상태 (기존 Process.READY 등의 이름 유지)
+    READY = State.READY
+    RUNNING = State.RUNNING
+    WAITING = State.WAITING
+    TERMINATED = State.TERMINATED
+
+    def __init__(self, pid, arrival_time, priority, burst_pattern_str, period=0, deadline=0, max_claim=None):
         self.pid = pid
         self.arrival_time = arrival_time
         self.static_priority = priority
         self.dynamic_priority = priority
 
         # 실행 패턴: "CPU:5,IO:10,LOCK:R1" 문자열을
-        # [ ('CPU', 5), ('IO', 10), ('LOCK', 'R1') ]
+        # [ (Op.CPU, 5), (Op.IO, 10), (Op.LOCK, 'R1') ]
         # 형태의 '튜플 리스트'로 변환합니다.
-        self.burst_pattern = []
-        try:
-            # 빈 문자열이 아닐 경우에만 파싱 시도
-            if burst_pattern_str:
-                bursts = burst_pattern_str.split(',')
-                for burst in bursts:
-                    parts = burst.split(':')
-                    if len(parts) < 2:
-                        print(f"경고: P{pid}의 버스트 형식이 잘못되었습니다: '{burst}'. 건너뜁니다.")
-                        continue
-                        
-                    command = parts[0].upper().strip() # CPU, IO, LOCK, UNLOCK
-                    value_str = parts[1].strip()
-                    
-                    if command in ('CPU', 'IO'):
-                        value = int(value_str)
-                        self.burst_pattern.append((command, value))
-                    elif command in ('LOCK', 'UNLOCK'):
-                        value = value_str # 자원 이름 (e.g., "Printer")
-                        self.burst_pattern.append((command, value))
-                    else:
-                        print(f"경고: P{pid}의 알 수 없는 명령어: '{command}'. 건너뜁니다.")
-        except Exception as e:
-            print(f"오류: P{pid}의 실행 패턴 파싱 실패: '{burst_pattern_str}' ({e})")
-            self.burst_pattern = [] # 오류 시 빈 패턴
+        # (이미 파싱된 버스트 시퀀스가 오면 복사 없이 그대로 공유합니다. -> ProcessSpec.instantiate)
+        if isinstance(burst_pattern_str, str):
+            self.burst_pattern = parse_bursts(pid, burst_pattern_str)
+        else:
+            self.burst_pattern = burst_pattern_str
         
         # 현재 실행해야 할 버스트의 인덱스
         self.current_burst_index = 0
@@ -56,11 +175,17 @@ class Process:
         # 현재 CPU 버스트의 남은 시간 (SRTF, RR 등에서 사용)
         self.remaining_cpu_time = 0 
         # 첫 번째 버스트가 CPU이면, 그 시간으로 remaining_cpu_time을 초기화
-        if self.burst_pattern and self.burst_pattern[0][0] == 'CPU':
+        if self.burst_pattern and self.burst_pattern[0][0] == CPU:
             self.remaining_cpu_time = self.burst_pattern[0][1]
 
-        self.state = Process.READY
+        self.state = READY
         self.held_resources = []
+        self.blocked_on = None  # Lock을 기다리는 자원 (대기 그래프의 간선, sync.Resource가 관리)
+        self.io_device = None   # 현재 요청을 처리 중이거나 대기 중인 I/O 장치 (io_device.IODevice)
+        # 자원별 최대 요구량 ((자원 이름, 개수) 튜플, Banker's 알고리즘용). None이면 LOCK 명령에서 계산
+        self.max_claim = max_claim
+        # 동기화 프로토콜(상속/천장)이 올려 준 우선순위 값 (None이면 원래 우선순위로 실행)
+        self.inherited_priority = None
 
         # 실시간 스케줄링용
         self.period = period
@@ -72,23 +197,39 @@ class Process:
         self.turnaround_time = 0
         self.last_ready_time = arrival_time
         self.completion_time = 0
+        self.first_run_time = None  # 처음 CPU를 할당받은 시각 (응답 시간 = first_run_time - arrival_time)
         
         # --- 5단계: 상태별 시간 추적 ---
         self.ready_wait_time = 0  # Ready 큐에서 대기한 시간
         self.io_wait_time = 0     # I/O 대기 시간
-        self.timeline = []        # [(start_time, end_time, state)] 형태로 상태 변화 기록
+        self.blocking_time = 0    # 자원 때문에 막힌 시간 (Lock 대기 + SRP 시작 지연)
+        self.blocked_since = None # 현재 막힌 구간의 시작 시각
+        self.timeline_store = None  # 상태 구간 저장소 (시뮬레이터가 도착 시 설정, timeline_store.TimelineStore)
+        self.timeline_slot = -1     # 저장소 안에서 이 프로세스의 슬롯 번호
+
+    @property
+    def timeline(self):
+        """
+        [(start_time, end_time, state)] 형태의 상태 변화 기록
+        (시뮬레이터의 TimelineStore에서 읽어 오며, 시뮬레이션 전에는 빈 리스트)
+        """
+        if self.timeline_store is None:
+            return []
+        return self.timeline_store.intervals(self.timeline_slot)
 
     def __repr__(self):
         """
         디버깅을 위해 print(process) 실행 시 출력될 형태를 정의합니다.
+        (명령 코드는 기존과 같이 이름으로 표시: [('CPU', 5), ('IO', 10)])
         """
-        return f"Process(PID:{self.pid}, Arrival:{self.arrival_time}, Priority:{self.static_priority}, Bursts:{self.burst_pattern})"
+        bursts = [(op.name, value) for op, value in self.burst_pattern]
+        return f"Process(PID:{self.pid}, Arrival:{self.arrival_time}, Priority:{self.static_priority}, Bursts:{bursts})"
 
     def get_current_burst(self):
         """
         [새 함수]
-        현재 실행해야 할 버스트 튜플 (명령, 값)을 반환합니다.
-        (e.g., ('CPU', 5) 또는 ('LOCK', 'Printer'))
+        현재 실행해야 할 버스트 튜플 (명령 코드, 값)을 반환합니다.
+        (e.g., (Op.CPU, 5) 또는 (Op.LOCK, 'Printer'))
         """
         if self.current_burst_index < len(self.burst_pattern):
             return self.burst_pattern[self.current_burst_index]
@@ -98,32 +239,92 @@ class Process:
         """
         [새 함수]
         다음 버스트로 인덱스를 이동하고,
-        새 버스트가 'CPU'이면 remaining_cpu_time을 세팅합니다.
+        새 버스트가 CPU이면 remaining_cpu_time을 세팅합니다.
         """
         self.current_burst_index += 1
         
         next_burst = self.get_current_burst()
-        if next_burst and next_burst[0] == 'CPU':
+        if next_burst and next_burst[0] == CPU:
             self.remaining_cpu_time = next_burst[1]
         else:
             self.remaining_cpu_time = 0 # CPU 버스트가 아님
             
     # (get_current_burst_type 함수는 이제 사용되지 않음)
 
+# -------------------------------------------------------------------
+# 1-1. 불변 워크로드 명세 (시뮬레이션마다 deepcopy 대신 instantiate)
+# -------------------------------------------------------------------
+@dataclass(frozen=True)
+class ProcessSpec:
+    """
+    프로세스 하나의 불변 명세 (파싱된 버스트 프로그램 + 생성 인자)
+
+    instantiate()는 실행 상태만 새로 만든 Process를 반환하며,
+    burst_pattern 튜플은 모든 인스턴스가 복사 없이 공유합니다.
+    """
+    pid: int
+    arrival_time: int
+    priority: int
+    bursts: tuple
+    period: int = 0
+    deadline: int = 0
+    max_claim: tuple = None
+
+    @classmethod
+    def from_process(cls, proc):
+        """아직 실행되지 않은 Process에서 명세를 만듭니다."""
+        return cls(proc.pid, proc.arrival_time, proc.static_priority,
+                   tuple(proc.burst_pattern), proc.period, proc.deadline, proc.max_claim)
+
+    def instantiate(self):
+        return Process(self.pid, self.arrival_time, self.priority, self.bursts, self.period, self.deadline,
+                       self.max_claim)
+
+
+@dataclass(frozen=True)
+class Workload:
+    """
+    ProcessSpec 묶음 (한 회차의 입력 워크로드)
+    """
+    specs: tuple
+
+    @classmethod
+    def from_processes(cls, process_list):
+        return cls(tuple(ProcessSpec.from_process(p) for p in process_list))
+
+    def __len__(self):
+        return len(self.specs)
+
+    def __bool__(self):
+        return bool(self.specs)
+
+    def instantiate(self, realtime=None):
+        """
+        새 Process 리스트를 만듭니다.
+
+        :param realtime: None이면 전부, False면 일반(period == 0)만, True면 실시간(period > 0)만
+        """
+        if realtime is None:
+            return [spec.instantiate() for spec in self.specs]
+        return [spec.instantiate() for spec in self.specs if (spec.period > 0) == realtime]
+
+
 # -------------------------------------------------------------------
 # 2. 입력 파일을 읽어 Process 객체 리스트를 반환하는 함수
 # -------------------------------------------------------------------
 
-def parse_input_file(filename="sample_input.txt"):
+# 입력 파일 한 줄: PID,도착,우선순위,"버스트",주기,마감[,"최대 요구량"]
+INPUT_LINE_PATTERN = re.compile(r'(\d+),(\d+),(\d+),"([^"]+)",(\d+),(\d+)(?:,"([^"]*)")?')
+
+
+def iter_input_file(filename="sample_input.txt"):
     """
-    (수정됨) 입력 파일을 읽어서 Process 객체 리스트를 생성합니다.
-    "CPU:5,IO:10" 형태의 문자열을 그대로 Process 클래스에 전달합니다.
+    입력 파일을 한 줄씩 읽어 Process 객체를 하나씩 내주는 제너레이터입니다. (파일 전체를 리스트로 만들지 않음)
+    도착 시각 순으로 정렬된 파일이면 시뮬레이터에 그대로 넘길 수 있으며,
+    시뮬레이터는 시뮬레이션 시각이 진행될 때 필요한 만큼만 읽습니다. (-> arrival_queue.ArrivalQueue)
+    (형식이 맞지 않는 라인은 경고 후 건너뛰고, 파일이 없거나 읽기 오류가 나면 메시지를 출력하고 멈춤)
     """
-    processes = []
-    
-    # 정규식 패턴은 기존과 동일 (따옴표 안의 문자열을 통째로 가져옴)
-    pattern = re.compile(r'(\d+),(\d+),(\d+),"([^"]+)",(\d+),(\d+)')
-    
+    line = None
     try:
         with open(filename, 'r', encoding='utf-8') as f:
             for line in f:
@@ -131,7 +332,7 @@ def parse_input_file(filename="sample_input.txt"):
                 if line.startswith('#') or not line:
                     continue
                 
-                match = pattern.match(line)
+                match = INPUT_LINE_PATTERN.match(line)
                 
                 if not match:
                     print(f"경고: 라인 형식이 맞지 않습니다. 건너뜁니다: {line}")
@@ -145,21 +346,27 @@ def parse_input_file(filename="sample_input.txt"):
                 bursts_str = groups[3]  # "CPU:5,IO:10,LOCK:R1" 문자열
                 period = int(groups[4])
                 deadline = int(groups[5])
+                max_claim = parse_claims(pid, groups[6]) if groups[6] else None
 
                 # __init__이 새로운 burst_str을 파싱하도록 변경됨
-                proc = Process(pid, arrival, priority, bursts_str, period, deadline)
-                processes.append(proc)
+                yield Process(pid, arrival, priority, bursts_str, period, deadline, max_claim)
 
     except FileNotFoundError:
         print(f"오류: '{filename}' 파일을 찾을 수 없습니다!")
-        return []
     except Exception as e:
         print(f"파일 파싱 중 예기치 않은 오류 발생: {e}")
-        if 'line' in locals():
+        if line is not None:
              print(f"문제가 발생한 라인: {line}")
-        return []
 
-    return processes
+
+def parse_input_file(filename="sample_input.txt"):
+    """
+    (수정됨) 입력 파일을 읽어서 Process 객체 리스트를 생성합니다.
+    "CPU:5,IO:10" 형태의 문자열을 그대로 Process 클래스에 전달합니다.
+    (선택) 7번째 열에 자원별 최대 요구량을 "R1:1,R2:1"처럼 지정할 수 있습니다. (생략 시 LOCK 명령에서 계산)
+    (한 줄씩 읽으려면 iter_input_file 사용)
+    """
+    return list(iter_input_file(filename))
 
 # -------------------------------------------------------------------
 # 3. (1.5단계) 테스트 실행
@@ -180,7 +387,7 @@ if __name__ == "__main__":
             print(f"총 {len(process_list)}개의 프로세스를 읽었습니다.")
             for proc in process_list:
                 print(proc) # __repr__ 호출
-                print(f"  -> 파싱된 버스트: {proc.burst_pattern}")
+                print(f"  -> 파싱된 버스트: {format_bursts(proc.burst_pattern)}")
                 
     except FileNotFoundError:
         print("오류: 'sample_input.txt' 파일을 찾을 수 없습니다!")
\ No newline at end of file
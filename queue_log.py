@@ -0,0 +1,118 @@
+"""
+큐 상태 기록 (Delta-encoded queue log)
+
+매 틱마다 Ready/Waiting 큐 전체를 복사하는 대신,
+프로세스가 큐에 들어가고(enqueue) 나오는(dequeue) 순간만 기록합니다.
+일정 간격(keyframe_interval)마다 전체 스냅샷(키프레임)을 함께 저장하므로
+snapshot_at(t)는 가장 가까운 키프레임부터 변경분만 재생하여 빠르게 복원합니다.
+
+- 이벤트는 array 3개(시각, 연산 코드, PID)에 저장되어 이벤트당 9바이트만 사용합니다.
+- Ready 큐 스냅샷은 '큐에 들어온 순서'로 복원됩니다. (우선순위 힙의 내부 순서는 기록하지 않음)
+"""
+import bisect
+from array import array
+
+# 연산 코드
+READY_IN = 0
+READY_OUT = 1
+WAITING_IN = 2
+WAITING_OUT = 3
+
+
+class QueueLog:
+    """
+    Ready / Waiting(I/O) 큐의 변경 이력
+
+    :param keyframe_interval: 몇 개의 이벤트마다 전체 스냅샷을 저장할지
+    """
+    def __init__(self, keyframe_interval=256):
+        self.keyframe_interval = keyframe_interval
+
+        self.times = array('i')  # 이벤트 시각 (단조 증가)
+        self.ops = array('b')    # 연산 코드
+        self.pids = array('i')   # 대상 PID
+
+        # 키프레임: (이벤트 인덱스, Ready 스냅샷, Waiting 스냅샷)
+        # keyframe_indices[i] 개의 이벤트를 적용한 직후의 상태
+        self.keyframe_indices = [0]
+        self.keyframes = [((), ())]
+
+        # 현재 상태 (삽입 순서를 유지하는 dict를 순서 있는 집합으로 사용)
+        self._ready = {}
+        self._waiting = {}
+
+    def __len__(self):
+        return len(self.times)
+
+    # -------------------------------------------------------------------
+    # 기록
+    # -------------------------------------------------------------------
+    def _append(self, time, op, pid):
+        self.times.append(time)
+        self.ops.append(op)
+        self.pids.append(pid)
+        if len(self.times) % self.keyframe_interval == 0:
+            self.keyframe_indices.append(len(self.times))
+            self.keyframes.append((tuple(self._ready), tuple(self._waiting)))
+
+    def ready_in(self, time, pid):
+        self._ready[pid] = None
+        self._append(time, READY_IN, pid)
+
+    def ready_out(self, time, pid):
+        self._ready.pop(pid, None)
+        self._append(time, READY_OUT, pid)
+
+    def waiting_in(self, time, pid):
+        self._waiting[pid] = None
+        self._append(time, WAITING_IN, pid)
+
+    def waiting_out(self, time, pid):
+        self._waiting.pop(pid, None)
+        self._append(time, WAITING_OUT, pid)
+
+    # -------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------
+    def _replay(self, start, end, ready, waiting):
+        """start ~ end-1 번째 이벤트를 ready/waiting(dict)에 적용합니다."""
+        ops, pids = self.ops, self.pids
+        for i in range(start, end):
+            op, pid = ops[i], pids[i]
+            if op == READY_IN:
+                ready[pid] = None
+            elif op == READY_OUT:
+                ready.pop(pid, None)
+            elif op == WAITING_IN:
+                waiting[pid] = None
+            else:
+                waiting.pop(pid, None)
+
+    def snapshot_at(self, time):
+        """
+        시각 time의 모든 이벤트가 반영된 큐 상태를 반환합니다.
+
+        :return: (ready_pids, waiting_pids) 리스트 튜플
+        """
+        end = bisect.bisect_right(self.times, time)
+        k = bisect.bisect_right(self.keyframe_indices, end) - 1
+        ready_frame, waiting_frame = self.keyframes[k]
+        ready = dict.fromkeys(ready_frame)
+        waiting = dict.fromkeys(waiting_frame)
+        self._replay(self.keyframe_indices[k], end, ready, waiting)
+        return list(ready), list(waiting)
+
+    def snapshots(self):
+        """
+        큐 상태가 바뀐 시각마다 (time, ready_pids, waiting_pids)를 차례로 반환합니다.
+        (기존 per-tick queue_log와 같은 형식, 변화가 없는 시각은 생략)
+        """
+        ready, waiting = {}, {}
+        n = len(self.times)
+        i = 0
+        while i < n:
+            time = self.times[i]
+            j = bisect.bisect_right(self.times, time, i)
+            self._replay(i, j, ready, waiting)
+            yield time, list(ready), list(waiting)
+            i = j
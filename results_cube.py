@@ -0,0 +1,210 @@
+"""
+반복 실행 결과 집계 (NumPy 결과 큐브, Welford 누적기)
+
+회차별 결과 딕셔너리({알고리즘: {지표: 값}})를 리스트로 모아 지표/알고리즘마다 statistics.mean/stdev를 다시 도는 대신
+숫자만 꺼내 배열에 담고 평균/표준편차/신뢰구간/대표 회차를 한 번의 배열 연산으로 구합니다.
+
+ResultsCube        : 회차 수 x 알고리즘 x 지표 크기로 미리 할당한 고정 크기 배열 (회차 수를 알 때, 대표 회차 선정 가능)
+WelfordAccumulator : 알고리즘 x 지표 크기의 평균/편차 제곱합만 갱신 (회차 수를 모를 때, 메모리 고정, merge()로 병합)
+
+결과에 없는 알고리즘/지표(예: 작업을 끝내지 못한 회차의 RM, 일반 알고리즘의 deadline_misses)는 NaN으로 두고
+집계에서 제외합니다. 표준편차는 statistics.stdev와 같은 표본 표준편차(n-1)이고 값이 하나 이하면 0입니다.
+신뢰구간은 정규 근사(평균 ± z * 표준편차 / sqrt(n))의 반폭입니다.
+"""
+import math
+
+import numpy as np
+
+METRICS = ('avg_turnaround', 'avg_waiting', 'cpu_utilization', 'context_switches', 'deadline_misses')
+CONFIDENCE_LEVEL = 0.95
+
+
+def _z_value(level):
+    """양측 신뢰수준 level의 표준정규 분위수 (0.95 -> 1.96, 정규분포 CDF를 math.erf로 두고 이분법으로 역산)"""
+    target = 0.5 + level / 2
+    low, high = 0.0, 40.0
+    for _ in range(100):
+        mid = (low + high) / 2
+        if 0.5 * (1 + math.erf(mid / math.sqrt(2))) < target:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+def _half_width(n, std, level):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(n > 1, _z_value(level) * std / np.sqrt(n), 0.0)
+
+
+class _Results:
+    """알고리즘/지표 이름과 배열 인덱스의 대응 (ResultsCube, WelfordAccumulator 공통)"""
+    def __init__(self, algorithms, metrics):
+        self.algorithms = tuple(algorithms)
+        self.metrics = tuple(metrics)
+        self.alg_index = {alg: i for i, alg in enumerate(self.algorithms)}
+        self.metric_index = {metric: i for i, metric in enumerate(self.metrics)}
+
+    def _row(self, results):
+        """회차 하나의 결과 딕셔너리들을 알고리즘 x 지표 배열로 변환합니다. (없는 값은 NaN)"""
+        row = np.full((len(self.algorithms), len(self.metrics)), np.nan)
+        for result in results:
+            for alg, stats in result.items():
+                a = self.alg_index.get(alg)
+                if a is None:
+                    continue
+                row[a] = [stats.get(metric, np.nan) for metric in self.metrics]
+        return row
+
+    def moments(self):
+        """알고리즘 x 지표별 (개수, 합계, 평균, 표준편차) 배열 (값이 없으면 평균 NaN, 하나 이하면 표준편차 0)"""
+        raise NotImplementedError
+
+    def counts(self):
+        return self.moments()[0]
+
+    def total(self):
+        return self.moments()[1]
+
+    def mean(self):
+        return self.moments()[2]
+
+    def std(self):
+        return self.moments()[3]
+
+    def confidence_interval(self, level=CONFIDENCE_LEVEL):
+        """알고리즘 x 지표별 신뢰구간 반폭 (값이 하나 이하면 0)"""
+        n, total, mean, std = self.moments()
+        return _half_width(n, std, level)
+
+    def summary(self, algorithms=None, level=CONFIDENCE_LEVEL):
+        """
+        알고리즘별 집계 딕셔너리 (값이 하나도 없는 알고리즘은 제외)
+
+        {알고리즘: {'mean': {지표: 평균}, 'std': {...}, 'ci': {...}, 'total': {...}, 'count': n}}
+        """
+        counts, total, mean, std = self.moments()
+        ci = _half_width(counts, std, level)
+        summary = {}
+        for alg in (self.algorithms if algorithms is None else algorithms):
+            a = self.alg_index[alg]
+            if not counts[a].any():
+                continue
+            summary[alg] = {
+                'mean': dict(zip(self.metrics, mean[a].tolist())),
+                'std': dict(zip(self.metrics, std[a].tolist())),
+                'ci': dict(zip(self.metrics, ci[a].tolist())),
+                'total': dict(zip(self.metrics, total[a].tolist())),
+                'count': int(counts[a].max()),
+            }
+        return summary
+
+
+class ResultsCube(_Results):
+    """
+    회차 x 알고리즘 x 지표 결과 배열
+
+    :param num_iterations: 회차 수 (배열을 미리 할당하며 늘리지 않음, 회차 수를 모르면 WelfordAccumulator 사용)
+    """
+    def __init__(self, num_iterations, algorithms, metrics=METRICS):
+        super().__init__(algorithms, metrics)
+        self.data = np.full((max(1, num_iterations), len(self.algorithms), len(self.metrics)), np.nan)
+        self.num_iterations = 0
+
+    def __len__(self):
+        return self.num_iterations
+
+    def add(self, *results):
+        """다음 회차의 결과 딕셔너리들(comparison_results, realtime_results 등)을 기록합니다."""
+        if self.num_iterations == len(self.data):
+            raise IndexError(f"ResultsCube: 미리 할당한 회차 수({len(self.data)})를 넘었습니다. "
+                             "회차 수를 모르면 WelfordAccumulator를 사용하세요.")
+        self.data[self.num_iterations] = self._row(results)
+        self.num_iterations += 1
+
+    @property
+    def values(self):
+        """기록된 회차만의 배열 (회차 x 알고리즘 x 지표)"""
+        return self.data[:self.num_iterations]
+
+    def _squares(self):
+        """(개수, 합계, 평균, 편차 제곱합)"""
+        values = self.values
+        present = ~np.isnan(values)
+        n = np.count_nonzero(present, axis=0)
+        total = np.sum(values, axis=0, where=present)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(n > 0, total / n, np.nan)
+        deviation = values - mean
+        squares = np.sum(deviation * deviation, axis=0, where=present)
+        return n, total, mean, squares
+
+    def moments(self):
+        n, total, mean, squares = self._squares()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.where(n > 1, np.sqrt(squares / (n - 1)), 0.0)
+        return n, total, mean, std
+
+    def representative(self, alg, metric='avg_turnaround'):
+        """alg의 metric 값이 평균과 가장 가까운 회차 인덱스 (같으면 앞 회차, 값이 없으면 0)"""
+        column = self.values[:, self.alg_index[alg], self.metric_index[metric]]
+        present = ~np.isnan(column)
+        if not present.any():
+            return 0
+        distance = np.abs(column - column.mean(where=present))
+        return int(np.argmin(np.where(present, distance, np.inf)))
+
+    def accumulator(self):
+        """기록된 회차를 담은 WelfordAccumulator (다른 누적기와 병합할 때)"""
+        accumulator = WelfordAccumulator(self.algorithms, self.metrics)
+        accumulator.n, accumulator.sum, mean, accumulator.m2 = self._squares()
+        accumulator._mean = np.nan_to_num(mean)
+        return accumulator
+
+
+class WelfordAccumulator(_Results):
+    """
+    회차를 보관하지 않는 스트리밍 평균/분산 (Welford 알고리즘, 알고리즘 x 지표 단위)
+
+    회차 수와 관계없이 배열 네 개(개수, 합계, 평균, 편차 제곱합)만 유지합니다.
+    회차 값이 남지 않으므로 대표 회차는 monte_carlo.RepresentativeCandidates로 고릅니다.
+    """
+    def __init__(self, algorithms, metrics=METRICS):
+        super().__init__(algorithms, metrics)
+        shape = (len(self.algorithms), len(self.metrics))
+        self.n = np.zeros(shape, dtype=np.int64)
+        self.sum = np.zeros(shape)
+        self._mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)
+
+    def __len__(self):
+        return int(self.n.max()) if self.n.size else 0
+
+    def add(self, *results):
+        """회차 하나의 결과 딕셔너리들을 누적합니다."""
+        row = self._row(results)
+        present = ~np.isnan(row)
+        self.n += present
+        value = row[present]
+        delta = value - self._mean[present]
+        self.sum[present] += value
+        self._mean[present] += delta / self.n[present]
+        self.m2[present] += delta * (value - self._mean[present])
+
+    def merge(self, other):
+        """other의 누적값을 합칩니다. (Chan의 병렬 분산 결합, 같은 알고리즘/지표 구성이어야 함)"""
+        n = self.n + other.n
+        delta = other._mean - self._mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(n > 0, other.n / n, 0.0)
+            self.m2 += other.m2 + delta ** 2 * self.n * weight
+        self._mean += delta * weight
+        self.sum += other.sum
+        self.n = n
+        return self
+
+    def moments(self):
+        n = self.n.copy()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.where(n > 1, np.sqrt(self.m2 / (n - 1)), 0.0)
+        return n, self.sum.copy(), np.where(n > 0, self._mean, np.nan), std
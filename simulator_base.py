@@ -0,0 +1,1288 @@
+"""
+공통 시뮬레이션 엔진 (SimulatorBase)
+
+도착, I/O 완료, LOCK/UNLOCK, 간트 차트, 타임라인, 통계 처리는 이 클래스가 담당하고,
+각 스케줄링 알고리즘은 'Ready 큐 정책'만 구현합니다.
+
+정책 인터페이스 (서브클래스에서 구현):
+    enqueue(proc, reason)   : Ready 큐에 프로세스를 넣음
+                              reason: 'arrival', 'io', 'wakeup', 'preempt', 'quantum', 'burst',
+                                      'shift' (실시간 정상 상태 외삽 후 시각을 옮겨 다시 넣음),
+                                      'reprioritize' (동기화 프로토콜로 우선순위가 바뀌어 다시 넣음),
+                                      'migrate' (다중 CPU에서 다른 CPU의 Ready 큐로 옮김)
+    pick()                  : 다음에 실행할 프로세스를 Ready 큐에서 꺼냄 (없으면 None)
+    should_preempt(running) : CPU 버스트를 실행 중인 프로세스를 선점해야 하는지
+    on_quantum_expiry(proc) : 타임 퀀텀 만료 처리 (기본: enqueue(proc, 'quantum'))
+    ready_processes()       : Ready 큐의 프로세스 목록 (큐 순서)
+    clear_ready()           : Ready 큐를 새 빈 큐로 바꿈 (기본: ready_queue와 같은 타입의 빈 컨테이너)
+
+다중 CPU(num_cpus > 1)는 smp.SMPEngine이 CPU별 상태를 바꿔 가며 같은 코어 루프를 실행합니다.
+    queue_attrs             : Ready 큐를 이루는 속성 이름들 (CPU별 Ready 큐일 때 CPU마다 따로 둠)
+    core_attrs              : 실행 중인 프로세스에 딸린 정책 상태 (e.g., MLFQ의 현재 퀀텀, CPU마다 따로 둠)
+
+우선순위 스케줄러(정적 우선순위, RM, EDF)는 PriorityHeapPolicy로 Ready 큐 정책을 공유하고 선점 비교 키만 정하며,
+동기화 프로토콜(sync.SYNC_PROTOCOLS)을 위해 ceiling_protocol을 설정하고 추가로 구현합니다.
+    base_priority(proc)     : 원래 우선순위 값 (작을수록 높음)
+    preemption_level(proc)  : 자원 천장 계산용 고정 선점 수준 (작을수록 높음)
+    reprioritize(proc)      : Ready 큐에 있는 proc의 priority()가 바뀜 (큐에서 빼고 다시 넣음)
+    Ready 큐 키와 선점 비교에는 priority(proc)(상속/천장 우선순위 반영)를 사용하고,
+    pick()/should_preempt()에서 srp_blocked(proc)인 프로세스는 시작/선점할 수 없습니다.
+
+should_preempt()의 결과는 Ready 큐가 바뀌지 않는 한 실행 도중 False -> True로 바뀌면 안 됩니다.
+(시간에 따라 바뀌는 정책은 next_policy_event()로 그 시각을 알려야 이벤트 엔진이 건너뛰지 않습니다.)
+"""
+import functools
+import heapq
+import math
+
+from arrival_queue import ArrivalQueue
+from event_engine import advance_clock
+from smp import SMPEngine
+from queue_log import QueueLog
+from perf_counters import PerfCounters
+from latency_sketch import latency_sketches
+from timeline_store import TimelineStore, READY, RUNNING, WAITING
+from process import Process, IORequest, CPU, IO, LOCK, UNLOCK, TERMINATED
+from sync import get_resource_manager, find_cycle
+from tracer import get_tracer, WARN, INFO, DEBUG
+
+INF = float('inf')
+
+# Ready 큐 진입 이벤트 메시지 (reason별)
+ADMIT_MESSAGES = {
+    'arrival': "프로세스 {pid} 도착 (Ready 큐 진입{info})",
+    'io': "프로세스 {pid} I/O 완료 (Ready 큐 진입{info})",
+    'wakeup': "프로세스 {pid} '{resource}' 획득 (Ready 큐 진입{info})",
+}
+
+
+def command_priority(proc):
+    """
+    명령어 우선순위를 반환합니다.
+    0-tick 명령(IO/LOCK/UNLOCK)이 남은 프로세스는 0, CPU 작업은 1 (힙에서 0-tick 명령 최우선)
+    """
+    burst = proc.get_current_burst()
+    if burst and burst[0] != CPU:
+        return 0
+    return 1
+
+
+class SimulatorBase:
+    """
+    모든 스케줄링 시뮬레이터의 공통 코어 루프
+    """
+    name = "Base"                 # 출력용 알고리즘 이름
+    requeue_after_burst = False   # True: CPU 버스트/0-tick 명령이 끝날 때마다 Ready 큐로 복귀 (우선순위 계열)
+    queue_attrs = ('ready_queue',)
+    core_attrs = ()
+
+    # 시뮬레이션하지 않고 외삽한 구간의 누적값 (RealtimeSimulatorBase의 정상 상태 외삽)
+    skipped_jobs = 0
+    skipped_turnaround = 0
+    skipped_wait = 0
+    skipped_busy_time = 0
+
+    def __init__(self, process_list, context_switch_overhead=1, tracer=None, resources=None,
+                 num_cpus=1, smp_queues='global'):
+        # [이벤트 추적] (None이면 tracer.get_tracer()의 기본 Tracer 사용)
+        self.trace = tracer if tracer is not None else get_tracer()
+
+        # 도착 예정 프로세스 (리스트 또는 도착 순 반복자, 반복자는 시뮬레이션 중에 필요한 만큼만 읽음)
+        self.processes_to_arrive = ArrivalQueue(process_list, self.trace)
+
+        self.waiting_queue = []  # I/O 처리 중: (완료 시각, PID, 프로세스) 최소 힙 (장치 큐에서 기다리는 요청은 IODevice가 보관)
+        self.current_time = 0
+        self.running_process = None
+        self.completed_processes = []
+
+        self.gantt_chart = []
+        self.total_cpu_idle_time = 0
+        self.last_cpu_busy_time = 0
+
+        # [문맥 전환 횟수 및 오버헤드]
+        self.context_switches = 0
+        self.context_switch_overhead = context_switch_overhead  # 문맥 교환 시 소요 시간 (ms)
+        self.total_overhead_time = 0  # 문맥 교환으로 낭비된 총 시간
+        self.cpu_was_idle = True
+        self.last_dispatched_pid = None  # 직전에 CPU를 할당받은 프로세스 (같은 프로세스 재선택은 문맥 교환 아님)
+        self.overhead_remaining = 0   # 현재 진행 중인 오버헤드 남은 시간
+        self.current_time_slice = 0   # 현재 프로세스가 연속으로 사용한 CPU 시간
+
+        # [큐 상태 로깅] (enqueue/dequeue 변경분만 기록, snapshot_at(t)으로 복원)
+        self.queue_log = QueueLog()
+
+        # [상태 타임라인] 모든 프로세스의 Ready/Running/Waiting 구간 (Process.timeline이 여기서 읽음)
+        self.timelines = TimelineStore()
+
+        # [지연 시간 분포] 완료된 작업의 대기/응답/반환 시간 (latency_sketch.LATENCY_METRICS별 LatencySketch)
+        self.latencies = latency_sketches()
+
+        # [성능 카운터] enable_profiling()을 호출했을 때만 생성 (perf_counters.PerfCounters)
+        self.profiler = None
+
+        # [자원] LOCK/UNLOCK 대상 자원과 교착상태 전략 (None이면 sync의 기본 ResourceManager 사용)
+        self.resources = resources if resources is not None else get_resource_manager()
+
+        # [다중 CPU] CPU 수와 Ready 큐 구성 (smp.SMP_QUEUE_MODES, num_cpus > 1일 때 run()에서 SMPEngine 생성)
+        self.num_cpus = num_cpus
+        self.smp_queues = smp_queues
+        self.smp = None
+        self.migrations = 0
+
+        # [자원 천장] 자원별로 그 자원을 LOCK하는 프로세스 중 가장 높은 선점 수준 (천장/SRP 프로토콜용)
+        # (스트림 입력은 미리 볼 수 없으므로 도착할 때마다 올림)
+        self.ceilings = {}
+        if not self.processes_to_arrive.streaming:
+            for proc in process_list:
+                self._raise_ceilings(proc)
+
+    # -------------------------------------------------------------------
+    # 정책 인터페이스 (서브클래스에서 재정의)
+    # -------------------------------------------------------------------
+    def enqueue(self, proc, reason):
+        raise NotImplementedError
+
+    def pick(self):
+        raise NotImplementedError
+
+    def should_preempt(self, running):
+        return False
+
+    def on_quantum_expiry(self, proc):
+        self.enqueue(proc, 'quantum')
+
+    def ready_processes(self):
+        return list(self.ready_queue)
+
+    def has_ready(self):
+        return bool(self.ready_queue)
+
+    def clear_ready(self):
+        """Ready 큐를 새 빈 큐로 바꿉니다. (정상 상태 외삽, CPU별 Ready 큐 생성에 사용)"""
+        self.ready_queue = type(self.ready_queue)()
+
+    def time_slice_limit(self):
+        """현재 실행 중인 프로세스의 타임 퀀텀 (없으면 inf)"""
+        return INF
+
+    def next_policy_event(self):
+        """정책 고유의 다음 이벤트 시각 (e.g., Aging 경계). 없으면 inf"""
+        return INF
+
+    def describe(self, proc):
+        """로그에 덧붙일 정책별 정보 (e.g., ', Prio: 3')"""
+        return ""
+
+    def on_admit(self, proc):
+        """신규 프로세스가 도착했을 때 (Ready 큐 진입 전) 호출됩니다."""
+        pass
+
+    def on_terminate(self, proc):
+        """프로세스가 종료되었을 때 호출됩니다."""
+        pass
+
+    # -------------------------------------------------------------------
+    # 동기화 프로토콜용 우선순위 인터페이스 (우선순위 스케줄러에서 재정의)
+    # -------------------------------------------------------------------
+    # 'ceiling' 설정 시 실제로 적용할 프로토콜 (동적 우선순위인 EDF는 'srp')
+    # None이면 우선순위로 Ready 큐를 정렬하지 않는 정책이므로 동기화 프로토콜을 적용하지 않음
+    ceiling_protocol = None
+
+    def base_priority(self, proc):
+        """원래 우선순위 값 (작을수록 높음)"""
+        return proc.static_priority
+
+    def preemption_level(self, proc):
+        """자원 천장 계산에 쓰는 고정 선점 수준 (작을수록 높음)"""
+        return proc.static_priority
+
+    def _raise_ceilings(self, proc):
+        """proc가 LOCK하는 자원의 천장을 proc의 선점 수준까지 올립니다."""
+        level = self.preemption_level(proc)
+        for op, name in proc.burst_pattern:
+            if op is LOCK and level < self.ceilings.get(name, INF):
+                self.ceilings[name] = level
+                resource = self.resources.get(name)
+                if resource is not None:
+                    resource.ceiling = level
+
+    def reprioritize(self, proc):
+        """Ready 큐에 있는 proc의 priority()가 바뀌었을 때 호출됩니다. (우선순위를 쓰지 않는 정책은 무시)"""
+        pass
+
+    def priority(self, proc):
+        """현재 우선순위 값: 원래 우선순위와 상속/천장 우선순위 중 높은 쪽 (작을수록 높음)"""
+        base = self.base_priority(proc)
+        inherited = proc.inherited_priority
+        return base if inherited is None or base <= inherited else inherited
+
+    @property
+    def protocol(self):
+        """적용 중인 우선순위 역전 대응 프로토콜"""
+        protocol = self.resources.protocol
+        if self.ceiling_protocol is None:
+            return 'none'
+        return self.ceiling_protocol if protocol == 'ceiling' else protocol
+
+    def srp_blocked(self, proc):
+        """
+        SRP: proc의 선점 수준이 시스템 천장(다른 프로세스가 잡고 있는 자원들의 천장)보다 높지 않으면 시작할 수 없습니다.
+        """
+        if self.protocol != 'srp':
+            return False
+        level = self.preemption_level(proc)
+        for res in self.resources:
+            if res.ceiling <= level and any(h is not proc and h.state != TERMINATED for h in res.holders):
+                return True
+        return False
+
+    # -------------------------------------------------------------------
+    # 성능 카운터 (opt-in)
+    # -------------------------------------------------------------------
+    def enable_profiling(self):
+        """
+        메인 루프 단계별 시간/호출 횟수와 큐 연산 횟수를 기록합니다. (run() 전에 호출, perf_counters 참고)
+        호출하지 않은 시뮬레이터에서는 측정 코드가 전혀 실행되지 않습니다.
+        """
+        if self.profiler is None:
+            self.profiler = PerfCounters()
+            self.profiler.attach(self)
+        return self.profiler
+
+    @property
+    def perf_counters(self):
+        """성능 카운터 딕셔너리 (enable_profiling()을 호출하지 않았으면 None)"""
+        return self.profiler.as_dict() if self.profiler is not None else None
+
+    # -------------------------------------------------------------------
+    # 메인 루프
+    # -------------------------------------------------------------------
+    def run(self):
+        """
+        시뮬레이션 메인 루프
+        """
+        self.trace.emit(INFO, None, 'start', "\n--- {name} 시뮬레이션 시작 ---", name=self.name)
+        self.resources.set_ceilings(self.ceilings)
+        self.resources.reset_devices()
+
+        if self.num_cpus > 1:
+            self.smp = SMPEngine(self, self.num_cpus, self.smp_queues)
+            if self.profiler is not None:
+                self.profiler.attach_smp(self.smp)
+            self.smp.run()
+            self._finish()
+            return
+
+        while self.processes_to_arrive or self.has_ready() or self.waiting_queue or self.running_process:
+
+            # --- 1~2. 신규 프로세스 도착, I/O 완료 처리 ---
+            self._handle_arrivals()
+            self._handle_io_completions()
+
+            # --- 3. 선점(Preemption) ---
+            self._check_preemption()
+
+            # --- 4. Dispatcher ---
+            if not self.running_process and self.overhead_remaining == 0:
+                self._dispatch()
+
+            # --- 4-1. 오버헤드 처리 ---
+            if self.overhead_remaining > 0:
+                self.overhead_remaining -= 1
+                # 오버헤드 중에는 실제 작업을 하지 않음
+                self._advance_clock()
+                continue
+
+            # --- 5. 실행 로직 ---
+            if self.running_process:
+                self._execute(self.running_process)
+
+            # --- 6. 시간 증가 (다음 이벤트까지) ---
+            self._advance_clock()
+
+        self._finish()
+
+    def _handle_events(self):
+        """현재 시각까지 도착한 프로세스와 I/O가 끝난 프로세스를 Ready 큐에 넣습니다."""
+        self._handle_arrivals()
+        self._handle_io_completions()
+
+    def _handle_arrivals(self):
+        # --- 1. 신규 프로세스 도착 처리 ---
+        arrivals = self.processes_to_arrive
+        while arrivals.next_time() <= self.current_time:
+            arrival, pid, proc = arrivals.pop()
+            if arrivals.streaming:
+                self._raise_ceilings(proc)
+            proc.timeline_store = self.timelines
+            proc.timeline_slot = self.timelines.register()
+            self.on_admit(proc)
+            self._admit(proc, 'arrival')
+
+    def _handle_io_completions(self):
+        # --- 2. I/O 완료 처리 ---
+        while self.waiting_queue and self.waiting_queue[0][0] <= self.current_time:
+            io_finish_time, pid, proc = heapq.heappop(self.waiting_queue)
+            self.queue_log.waiting_out(self.current_time, pid)
+            self._close_timeline(proc, self.current_time)
+            if proc.io_device is not None:
+                self._complete_device_io(proc)
+            self._admit(proc, 'io')
+
+    def _advance_clock(self):
+        """
+        다음 이벤트 시각까지 시계를 이동합니다. (event_engine.advance_clock 참고)
+        """
+        kind, skipped = advance_clock(self, not self.has_ready(),
+                                      slice_left=self.time_slice_limit() - self.current_time_slice,
+                                      horizon=self.next_policy_event())
+        if kind == 'run':
+            self.current_time_slice += skipped
+        elif kind == 'idle':
+            self.cpu_was_idle = True  # 건너뛴 유휴 틱도 CPU 유휴로 처리
+
+    # -------------------------------------------------------------------
+    # 상태 전이 헬퍼
+    # -------------------------------------------------------------------
+    def _close_timeline(self, proc, end_time):
+        """진행 중인 타임라인 구간을 end_time에 닫습니다. (Waiting 구간은 대기 시간에 합산)"""
+        timelines = self.timelines
+        row = timelines.close(proc.timeline_slot, end_time)
+        if row >= 0 and timelines.states[row] == WAITING:
+            proc.io_wait_time += (end_time - timelines.starts[row])
+
+    def _close_gantt(self, end_time):
+        """열려 있는 간트 차트 구간을 end_time에 닫습니다."""
+        if self.gantt_chart and len(self.gantt_chart[-1]) == 2:
+            pid, start_time = self.gantt_chart[-1]
+            self.gantt_chart[-1] = (pid, start_time, end_time)
+            self.last_cpu_busy_time = end_time
+
+    def _to_ready(self, proc, time):
+        """프로세스를 Ready 상태로 표시합니다. (큐 삽입은 호출자가 담당)"""
+        proc.state = Process.READY
+        proc.last_ready_time = time
+        self.timelines.open(proc.timeline_slot, time, READY)
+        self.queue_log.ready_in(time, proc.pid)
+
+    def _admit(self, proc, reason, **fields):
+        """도착/I-O 완료/자원 획득한 프로세스를 Ready 큐에 넣습니다. (남은 작업이 없으면 종료)"""
+        if not proc.get_current_burst():
+            self._terminate(proc, self.current_time)
+            return
+        self._to_ready(proc, self.current_time)
+        if self.smp is not None:
+            self.smp.enqueue(proc, reason)  # CPU별 Ready 큐 배치
+        else:
+            self.enqueue(proc, reason)
+        running = self.running_process
+        if running is not None:
+            if self.protocol == 'srp':
+                # 실행 중인 작업보다 우선순위가 높아도 시스템 천장 때문에 선점하지 못함
+                if self.priority(proc) < self.priority(running) and self.srp_blocked(proc):
+                    proc.blocked_since = self.current_time
+            elif running.inherited_priority is not None:
+                self._mark_inversion([proc])
+        if self.trace.enabled(INFO):
+            self.trace.emit(INFO, self.current_time, reason, ADMIT_MESSAGES[reason],
+                            pid=proc.pid, info=self.describe(proc), **fields)
+
+    def _terminate(self, proc, time):
+        """프로세스를 종료 처리합니다. (CPU 반납은 호출자가 담당)"""
+        self._close_timeline(proc, time)
+        proc.state = Process.TERMINATED
+        proc.completion_time = time
+        proc.turnaround_time = proc.completion_time - proc.arrival_time
+        self.completed_processes.append(proc)
+        self._record_latency(proc)
+        self.trace.emit(INFO, time, 'terminate', "프로세스 {pid} 종료", pid=proc.pid)
+        self.on_terminate(proc)
+
+    def _record_latency(self, proc, count=1):
+        """완료된 작업의 지연 시간을 분포에 기록합니다. (CPU를 한 번도 받지 못한 작업은 응답 시간 제외)"""
+        latencies = self.latencies
+        latencies['waiting'].record(proc.wait_time, count)
+        latencies['turnaround'].record(proc.turnaround_time, count)
+        if proc.first_run_time is not None:
+            latencies['response'].record(proc.first_run_time - proc.arrival_time, count)
+
+    def _release_cpu(self):
+        """실행 중인 프로세스가 CPU를 반납합니다."""
+        self.running_process = None
+        if not self.has_ready():
+            self.cpu_was_idle = True
+
+    def _block(self, proc):
+        """실행 중인 프로세스를 Waiting 상태로 전환하고 CPU를 반납합니다."""
+        self._close_timeline(proc, self.current_time)
+        proc.state = Process.WAITING
+        self.timelines.open(proc.timeline_slot, self.current_time, WAITING)
+        self._release_cpu()
+
+    def _after_command(self, proc, time):
+        """
+        CPU 버스트 또는 0-tick 명령이 끝난 뒤의 처리
+        (남은 작업 없음 -> 종료, requeue_after_burst -> Ready 큐 복귀, 그 외 -> 계속 실행)
+        """
+        if not proc.get_current_burst():
+            self._terminate(proc, time)
+            self._release_cpu()
+        elif self.requeue_after_burst:
+            self._close_timeline(proc, time)
+            self._to_ready(proc, time)
+            self.running_process = None
+            self.enqueue(proc, 'burst')
+
+    # -------------------------------------------------------------------
+    # 스케줄링 단계
+    # -------------------------------------------------------------------
+    def _check_preemption(self):
+        proc = self.running_process
+        if not proc or not self.has_ready():
+            return
+        burst = proc.get_current_burst()
+        if not burst or burst[0] != CPU or not self.should_preempt(proc):
+            return
+
+        self.trace.emit(INFO, self.current_time, 'preempt', "프로세스 {pid} 선점됨", pid=proc.pid)
+        if self.gantt_chart and self.gantt_chart[-1][0] == proc.pid:
+            self._close_gantt(self.current_time)
+        self._close_timeline(proc, self.current_time)
+        self._to_ready(proc, self.current_time)
+        self.running_process = None
+        self.current_time_slice = 0
+        self.enqueue(proc, 'preempt')
+
+    def _dispatch(self):
+        proc = self.pick()
+        if proc is None:
+            self.cpu_was_idle = True  # CPU 유휴
+            return
+        self.queue_log.ready_out(self.current_time, proc.pid)
+        if proc.blocked_since is not None:
+            self._end_blocking(proc)
+
+        # Ready 상태 종료 기록
+        row = self.timelines.close(proc.timeline_slot, self.current_time)
+        if row >= 0:
+            proc.ready_wait_time += (self.current_time - self.timelines.starts[row])
+
+        proc.state = Process.RUNNING
+        self.timelines.open(proc.timeline_slot, self.current_time, RUNNING)
+        if proc.first_run_time is None:
+            proc.first_run_time = self.current_time
+        if proc.inherited_priority is not None:
+            self._mark_inversion(self._all_ready(), proc)
+
+        # 문맥 교환 오버헤드 적용 (다른 프로세스로 교체될 때만)
+        if not self.cpu_was_idle and proc.pid != self.last_dispatched_pid:
+            self.context_switches += 1
+            self.overhead_remaining = self.context_switch_overhead
+            self.total_overhead_time += self.context_switch_overhead
+            self.trace.emit(INFO, self.current_time, 'context_switch', "문맥 교환 발생 (오버헤드: {overhead}ms)",
+                            overhead=self.context_switch_overhead)
+        self.cpu_was_idle = False
+        self.last_dispatched_pid = proc.pid
+
+        wait = self.current_time - proc.last_ready_time
+        proc.wait_time += wait
+        self.current_time_slice = 0
+        self.running_process = proc
+        if self.trace.enabled(INFO):
+            self.trace.emit(INFO, self.current_time, 'dispatch', "프로세스 {pid} 선택됨 (대기: {wait}ms, 총 대기: {total_wait}ms{info})",
+                            pid=proc.pid, wait=wait, total_wait=proc.wait_time, info=self.describe(proc))
+
+    def _execute(self, proc):
+        current_burst = proc.get_current_burst()
+
+        if not current_burst:
+            self._terminate(proc, self.current_time)
+            self._release_cpu()
+        else:
+            op, value = current_burst
+            if op == CPU:
+                self._run_cpu(proc)
+            elif op == IO:
+                self._start_io(proc, value)
+            elif op == LOCK:
+                self._lock(proc, value)
+            elif op == UNLOCK:
+                self._unlock(proc, value)
+
+    def _run_cpu(self, proc):
+        if (not self.gantt_chart or
+            self.gantt_chart[-1][0] != proc.pid or
+            len(self.gantt_chart[-1]) == 3):
+
+            self.gantt_chart.append((proc.pid, self.current_time))
+            self.trace.emit(DEBUG, self.current_time, 'cpu_start', "프로세스 {pid} CPU 작업 시작 (남은 시간: {remaining}ms)",
+                            pid=proc.pid, remaining=proc.remaining_cpu_time)
+
+        proc.remaining_cpu_time -= 1
+        self.current_time_slice += 1
+        end_time = self.current_time + 1
+
+        # (1) CPU 버스트가 끝났는지 검사
+        if proc.remaining_cpu_time == 0:
+            self.trace.emit(INFO, end_time, 'cpu_done', "프로세스 {pid} CPU 버스트 완료", pid=proc.pid)
+            self._close_gantt(end_time)
+            proc.advance_to_next_burst()
+            self._after_command(proc, end_time)
+
+        # (2) CPU 버스트가 남았는데, 타임 슬라이스를 다 썼는지 검사
+        elif self.current_time_slice >= self.time_slice_limit():
+            self.trace.emit(INFO, end_time, 'quantum_expired', "프로세스 {pid} 타임 슬라이스 만료", pid=proc.pid)
+            self._close_gantt(end_time)
+            self._close_timeline(proc, end_time)
+            self._to_ready(proc, end_time)
+            self.running_process = None
+            self.current_time_slice = 0
+            self.on_quantum_expiry(proc)
+
+    def _start_io(self, proc, io_duration):
+        self._close_timeline(proc, self.current_time)
+        proc.state = Process.WAITING
+        self.timelines.open(proc.timeline_slot, self.current_time, WAITING)
+        self.queue_log.waiting_in(self.current_time, proc.pid)
+
+        if isinstance(io_duration, IORequest):
+            self._submit_device_io(proc, io_duration)
+        else:
+            heapq.heappush(self.waiting_queue, (self.current_time + io_duration, proc.pid, proc))
+            self.trace.emit(INFO, self.current_time, 'io_start', "프로세스 {pid} I/O 시작 (대기 {duration}ms)",
+                            pid=proc.pid, duration=io_duration)
+
+        proc.advance_to_next_burst()
+        self._release_cpu()
+
+    def _submit_device_io(self, proc, request):
+        """장치를 지정한 I/O 요청을 장치에 넣습니다. (채널이 모두 바쁘면 장치 큐에서 대기)"""
+        device = self.resources.get_device(request.device)
+        if device is None:
+            self.trace.emit(WARN, self.current_time, 'io_unknown_device',
+                            "경고: 등록되지 않은 I/O 장치 '{device}'. 프로세스 {pid}의 I/O를 장치 제한 없이 처리합니다.",
+                            device=request.device, pid=proc.pid)
+            heapq.heappush(self.waiting_queue, (self.current_time + request.duration, proc.pid, proc))
+            return
+
+        proc.io_device = device
+        finish = device.submit(proc, request, self.current_time)
+        if finish is None:
+            self.trace.emit(INFO, self.current_time, 'io_queued', "프로세스 {pid} I/O 장치 '{device}' 큐에서 대기 (대기 {queued}개)",
+                            pid=proc.pid, device=device.name, queued=device.queue_length)
+            return
+        self._start_device_io(proc, device, finish)
+
+    def _start_device_io(self, proc, device, finish):
+        heapq.heappush(self.waiting_queue, (finish, proc.pid, proc))
+        self.trace.emit(INFO, self.current_time, 'io_start', "프로세스 {pid} I/O 시작 (장치 '{device}', 대기 {duration}ms)",
+                        pid=proc.pid, device=device.name, duration=finish - self.current_time)
+
+    def _complete_device_io(self, proc):
+        """proc의 장치 I/O를 끝내고, 장치 큐에서 기다리던 다음 요청을 시작합니다."""
+        device, proc.io_device = proc.io_device, None
+        started = device.complete(proc, self.current_time)
+        if started is not None:
+            next_proc, finish = started
+            self._start_device_io(next_proc, device, finish)
+
+    # -------------------------------------------------------------------
+    # 동기화 (LOCK / UNLOCK) + 교착상태 처리
+    # -------------------------------------------------------------------
+    def _lock(self, proc, resource_name):
+        resource = self.resources.get(resource_name)
+        if not resource:
+            self.trace.emit(WARN, self.current_time, 'unknown_resource',
+                            "오류: P{pid}가 존재하지 않는 자원 '{resource}'을(를) 요청했습니다.",
+                            pid=proc.pid, resource=resource_name)
+            proc.advance_to_next_burst()
+            self._after_command(proc, self.current_time)
+            return
+
+        strategy = self.resources.strategy
+
+        if strategy == 'prevention':
+            # 자원 순서 할당: 보유 중인 자원보다 낮은 ID의 자원은 요청 불가
+            max_held_id = max((res.id for res in proc.held_resources), default=-1)
+            if resource.id < max_held_id:
+                self.trace.emit(WARN, self.current_time, 'deadlock_prevention',
+                                "교착상태 예방: P{pid}가 보유 자원(최대 ID: {max_held_id})보다 낮은 ID {resource_id}의 '{resource}'을(를) 요청하여 강제 종료됩니다.",
+                                pid=proc.pid, max_held_id=max_held_id, resource_id=resource.id, resource=resource_name)
+                self._release_all(proc)
+                self._terminate(proc, self.current_time)
+                self._release_cpu()
+                return
+
+        elif strategy == 'avoidance':
+            if not self.resources.banker.is_safe_request(proc, resource):
+                # 불안전 상태: 자원을 할당하지 않고 소유자가 반납할 때까지 대기
+                self.trace.emit(WARN, self.current_time, 'deadlock_avoidance',
+                                "교착상태 회피: P{pid}의 '{resource}' 요청은 불안전 상태를 만듭니다. (대기)",
+                                pid=proc.pid, resource=resource_name)
+                resource.add_waiter(proc)
+                self._block(proc)
+                proc.blocked_since = self.current_time
+                return
+
+        self.trace.emit(DEBUG, self.current_time, 'lock_attempt', "프로세스 {pid}이(가) '{resource}' Lock 시도...",
+                        pid=proc.pid, resource=resource_name)
+        if resource.lock(proc, self.current_time, self.trace):
+            self.trace.emit(INFO, self.current_time, 'lock_acquired', "프로세스 {pid}이(가) '{resource}' Lock 획득",
+                            pid=proc.pid, resource=resource_name)
+            proc.held_resources.append(resource)
+            self._refresh_priority(proc)
+            proc.advance_to_next_burst()
+            self._after_command(proc, self.current_time)
+        else:
+            self.trace.emit(INFO, self.current_time, 'lock_blocked', "프로세스 {pid}이(가) '{resource}' Lock 실패. (자원 대기)",
+                            pid=proc.pid, resource=resource_name)
+            self._block(proc)
+            proc.blocked_since = self.current_time
+            if self.protocol == 'inheritance':
+                self._inherit(proc)
+            if strategy == 'detection':
+                self._recover_from_deadlock(proc)
+
+    def _unlock(self, proc, resource_name):
+        resource = self.resources.get(resource_name)
+        if not resource:
+            self.trace.emit(WARN, self.current_time, 'unknown_resource',
+                            "오류: P{pid}가 존재하지 않는 자원 '{resource}'을(를) Unlock하려 합니다.",
+                            pid=proc.pid, resource=resource_name)
+            proc.advance_to_next_burst()
+            self._after_command(proc, self.current_time)
+            return
+
+        self.trace.emit(INFO, self.current_time, 'unlock', "프로세스 {pid}이(가) '{resource}' Unlock 시도...",
+                        pid=proc.pid, resource=resource_name)
+        if resource in proc.held_resources:
+            proc.held_resources.remove(resource)
+
+        may_grant = self._grant_check()
+        woken_process = resource.unlock(proc, self.current_time, self.trace, may_grant)
+        if woken_process:
+            self._wake(woken_process, resource)
+        if may_grant:
+            self._grant_waiters(may_grant)
+        self._after_release(proc)
+
+        proc.advance_to_next_burst()
+        self._after_command(proc, self.current_time)
+
+    def _wake(self, proc, resource):
+        """자원을 넘겨받은 프로세스를 깨웁니다. (LOCK 명령은 이미 완료된 것으로 처리)"""
+        self._close_timeline(proc, self.current_time)
+        self._end_blocking(proc)
+        proc.held_resources.append(resource)
+        self._refresh_priority(proc)
+        proc.advance_to_next_burst()
+        self._admit(proc, 'wakeup', resource=resource.name)
+
+    def _release_all(self, proc):
+        """프로세스가 보유한 모든 자원을 반납하고 대기자를 깨웁니다."""
+        may_grant = self._grant_check()
+        for res in proc.held_resources[:]:
+            woken_process = res.unlock(proc, self.current_time, self.trace, may_grant)
+            if woken_process:
+                self._wake(woken_process, res)
+        proc.held_resources.clear()
+        if may_grant:
+            self._grant_waiters(may_grant)
+        self._after_release(proc)
+
+    def _grant_check(self):
+        """회피 전략이면 대기자에게 자원을 넘기기 전 안전 상태 검사 함수를, 아니면 None을 반환합니다."""
+        if self.resources.strategy == 'avoidance':
+            return self.resources.banker.is_safe_request
+        return None
+
+    def _grant_waiters(self, may_grant):
+        """
+        반납으로 안전해진 대기자에게 남은 인스턴스를 넘깁니다. (회피 전략)
+        불안전 상태 때문에 대기 중인 프로세스는 다른 자원의 반납으로도 진행 가능해질 수 있습니다.
+        """
+        for res in self.resources:
+            while res.available and res.waiting_queue:
+                woken_process = res.grant_waiter(self.current_time, self.trace, may_grant)
+                if not woken_process:
+                    break
+                self._wake(woken_process, res)
+
+    # -------------------------------------------------------------------
+    # 우선순위 역전 대응 (상속 / 천장 / SRP) + 블로킹 시간
+    # -------------------------------------------------------------------
+    def _end_blocking(self, proc):
+        """막혀 있던 구간을 블로킹 시간에 더합니다."""
+        if proc.blocked_since is not None:
+            proc.blocking_time += self.current_time - proc.blocked_since
+            proc.blocked_since = None
+
+    def _set_inherited(self, proc, inherited):
+        if proc.inherited_priority == inherited:
+            return
+        proc.inherited_priority = inherited
+        if proc.state == READY:
+            if self.smp is not None:
+                self.smp.reprioritize(proc)
+            else:
+                self.reprioritize(proc)
+        elif proc is self.running_process:
+            if inherited is None:
+                # 역전 종료: 이 프로세스 때문에 밀려 있던 Ready 프로세스들의 블로킹을 끝냄
+                for ready_proc in self._all_ready():
+                    self._end_blocking(ready_proc)
+            else:
+                self._mark_inversion(self._all_ready())
+
+    def _all_ready(self):
+        """모든 Ready 큐의 프로세스 목록 (다중 CPU의 CPU별 Ready 큐 포함)"""
+        if self.smp is not None:
+            return self.smp.ready_processes()
+        return self.ready_processes()
+
+    def _mark_inversion(self, procs, running=None):
+        """
+        상속/천장 우선순위로 실행 중인 낮은 우선순위 프로세스 때문에 밀려난
+        (원래 우선순위가 더 높은) Ready 프로세스들의 블로킹 구간을 시작합니다.
+        """
+        running = running or self.running_process
+        base = self.base_priority(running)
+        for proc in procs:
+            if proc.blocked_since is None and self.base_priority(proc) < base:
+                proc.blocked_since = self.current_time
+
+    def _inherit(self, proc):
+        """
+        우선순위 상속: proc가 기다리는 자원의 소유자들에게 proc의 우선순위를 물려줍니다.
+        소유자도 다른 자원을 기다리고 있으면 그 소유자에게 이어서 전달합니다. (사슬 길이에 비례)
+        """
+        priority = self.priority(proc)
+        pending = [proc.blocked_on]
+        while pending:
+            resource = pending.pop()
+            for holder in resource.holders:
+                if holder.state != TERMINATED and self.priority(holder) > priority:
+                    self._set_inherited(holder, priority)
+                    if holder.blocked_on is not None:
+                        pending.append(holder.blocked_on)
+
+    def _refresh_priority(self, proc):
+        """보유 자원이 바뀐 proc의 상속/천장 우선순위를 다시 계산합니다."""
+        protocol = self.protocol
+        if protocol == 'inheritance':
+            inherited = min((self.priority(w) for res in proc.held_resources for w in res.waiting_queue), default=INF)
+        elif protocol == 'ceiling':
+            inherited = min((res.ceiling for res in proc.held_resources), default=INF)
+        else:
+            return
+        self._set_inherited(proc, None if inherited == INF else inherited)
+
+    def _after_release(self, proc):
+        """자원을 반납한 뒤: 반납한 프로세스의 우선순위를 되돌리고, SRP로 막혀 있던 프로세스의 블로킹을 끝냅니다."""
+        self._refresh_priority(proc)
+        if self.protocol == 'srp':
+            for ready_proc in self._all_ready():
+                if ready_proc.blocked_since is not None and not self.srp_blocked(ready_proc):
+                    self._end_blocking(ready_proc)
+
+    def blocking_times(self):
+        """
+        PID별 자원 블로킹 시간
+
+        :return: {PID: (작업 수, 블로킹 합계, 작업당 최대)}
+        """
+        result = {}
+        for proc in self.completed_processes:
+            jobs, total, longest = result.get(proc.pid, (0, 0, 0))
+            result[proc.pid] = (jobs + 1, total + proc.blocking_time, max(longest, proc.blocking_time))
+        return result
+
+    def _recover_from_deadlock(self, proc):
+        """
+        교착상태 탐지 및 회복: 새 대기 간선이 순환을 만들면 순환 안에서 우선순위가 가장 낮은(값이 큰) 프로세스를 종료합니다.
+        (순환에 속한 프로세스는 모두 자원 대기 중이므로 Ready/Waiting 큐에는 없음)
+        """
+        cycle = find_cycle(proc)
+        if not cycle:
+            return
+
+        self.trace.emit(WARN, self.current_time, 'deadlock_detected', "교착상태 탐지: P{pids}",
+                        pids=[p.pid for p in cycle])
+        victim = max(cycle, key=lambda p: p.static_priority)
+
+        self.trace.emit(WARN, self.current_time, 'deadlock_recovery', "교착상태 회복: P{pid} 강제 종료 (우선순위: {priority})",
+                        pid=victim.pid, priority=victim.static_priority)
+        victim.blocked_on.remove_waiter(victim)
+        self._end_blocking(victim)
+        self._release_all(victim)
+        self._terminate(victim, self.current_time)
+
+    # -------------------------------------------------------------------
+    # 종료 처리 및 결과 출력
+    # -------------------------------------------------------------------
+    def _finish(self):
+        total_simulation_time = self.current_time
+
+        # 모든 프로세스의 미완료 타임라인 종료 처리
+        self.timelines.close_all(self.current_time)
+
+        total_cpu_busy_time = 0
+        idle_time_start = 0
+
+        self.gantt_chart = [entry for entry in self.gantt_chart if len(entry) == 3]
+
+        if self.smp is not None:
+            # 다중 CPU: CPU별 간트 차트는 SMPEngine이 닫아 둠 (유휴 시간 = 전체 CPU 시간 - 사용 시간)
+            total_cpu_busy_time = sum(core.busy_time for core in self.smp.cores)
+            self.total_cpu_idle_time = total_simulation_time * self.num_cpus - total_cpu_busy_time
+        else:
+            for pid, start, end in self.gantt_chart:
+                idle_duration = start - idle_time_start
+                if idle_duration > 0:
+                    self.total_cpu_idle_time += idle_duration
+                total_cpu_busy_time += (end - start)
+                idle_time_start = end
+
+            if total_simulation_time > idle_time_start:
+                self.total_cpu_idle_time += (total_simulation_time - idle_time_start)
+
+        # 외삽한 구간은 간트 차트에 없으므로 유휴 시간에서 빼고 사용 시간에 더함
+        total_cpu_busy_time += self.skipped_busy_time
+        self.total_cpu_idle_time -= self.skipped_busy_time
+
+        if self.trace.enabled(INFO):
+            self.trace.emit(INFO, None, 'end', "--- {name} 시뮬레이션 종료 ---", name=self.name)
+            self.print_results(total_simulation_time, total_cpu_busy_time)
+
+    def stats(self):
+        """
+        알고리즘 비교용 요약 통계 (시뮬레이션 종료 후 호출)
+
+        :return: {'avg_turnaround', 'avg_waiting', 'cpu_utilization', 'context_switches'}
+        """
+        completed = self.completed_processes
+        n = len(completed) + self.skipped_jobs
+        busy = sum(end - start for pid, start, end in self.gantt_chart) + self.skipped_busy_time
+        return {
+            'avg_turnaround': ((sum(p.turnaround_time for p in completed) + self.skipped_turnaround) / n) if n > 0 else 0,
+            'avg_waiting': ((sum(p.wait_time for p in completed) + self.skipped_wait) / n) if n > 0 else 0,
+            'cpu_utilization': (busy / (self.current_time * self.num_cpus)) * 100 if self.current_time > 0 else 0,
+            'context_switches': self.context_switches
+        }
+
+    def print_extra_summary(self):
+        """알고리즘별 추가 요약 항목을 출력합니다."""
+        pass
+
+    def print_blocking_summary(self):
+        """자원 때문에 막힌 프로세스가 있으면 PID별 블로킹 시간을 출력합니다."""
+        blocking = self.blocking_times()
+        if not any(total for jobs, total, longest in blocking.values()):
+            return
+        print(f"\n--- 자원 블로킹 시간 (프로토콜: {self.protocol}) ---")
+        print("PID\t| 작업 수\t| 블로킹 합계\t| 작업당 최대")
+        for pid, (jobs, total, longest) in sorted(blocking.items()):
+            print(f"{pid}\t| {jobs}\t\t| {total}\t\t| {longest}")
+
+    def print_device_summary(self, total_time):
+        """요청을 받은 I/O 장치가 있으면 장치별 대기/탐색/사용률 통계를 출력합니다."""
+        devices = [device for device in self.resources.devices.values() if device.requests]
+        if not devices:
+            return
+        print("\n--- I/O 장치 통계 ---")
+        print("장치\t| 정책\t| 채널\t| 요청 수\t| 평균 큐 대기\t| 최대 큐 대기\t| 평균 탐색 거리\t| 사용률")
+        for device in devices:
+            utilization = device.busy_time / (total_time * device.channels) * 100 if total_time > 0 else 0
+            print(f"{device.name}\t| {device.policy}\t| {device.channels}\t| {device.requests}\t\t| "
+                  f"{device.total_queue_wait / device.requests:.2f}\t\t| {device.max_queue_wait}\t\t| "
+                  f"{device.total_seek / device.requests:.2f}\t\t| {utilization:.2f} %")
+
+    def print_results(self, total_time, total_busy_time):
+        """
+        최종 통계 결과를 출력합니다.
+        """
+        print(f"\n--- 📊 {self.name} 최종 결과 ---")
+
+        if not self.completed_processes:
+            print("오류: 완료된 프로세스가 없습니다.")
+            return
+
+        # PID 순서대로 정렬하여 출력
+        self.completed_processes.sort(key=lambda x: x.pid)
+
+        total_tt = 0
+        total_wt = 0
+        print("PID\t| 도착\t| 종료\t| 반환시간(TT)\t| 대기시간(WT)")
+        print("---------------------------------------------------------")
+        for proc in self.completed_processes:
+            print(f"{proc.pid}\t| {proc.arrival_time}\t| {proc.completion_time}\t| {proc.turnaround_time}\t\t| {proc.wait_time}")
+            total_tt += proc.turnaround_time
+            total_wt += proc.wait_time
+
+        n = len(self.completed_processes) + self.skipped_jobs
+        avg_tt = (total_tt + self.skipped_turnaround) / n
+        avg_wt = (total_wt + self.skipped_wait) / n
+
+        # CPU 사용률 계산 (오버헤드 반영)
+        effective_cpu_time = total_busy_time - self.total_overhead_time
+        capacity = total_time * self.num_cpus  # 전체 CPU 시간
+        cpu_utilization = (total_busy_time / capacity) * 100 if capacity > 0 else 0
+        effective_cpu_utilization = (effective_cpu_time / capacity) * 100 if capacity > 0 else 0
+
+        print("\n--- 요약 ---")
+        print(f"평균 반환 시간 (Avg TT) : {avg_tt:.2f}")
+        print(f"평균 대기 시간 (Avg WT) : {avg_wt:.2f}")
+        print(f"총 실행 시간          : {total_time}")
+        print(f"CPU 총 유휴 시간      : {self.total_cpu_idle_time}")
+        print(f"CPU 총 사용 시간      : {total_busy_time}")
+        print(f"문맥 교환 횟수        : {self.context_switches}")
+        print(f"문맥 교환 오버헤드    : {self.total_overhead_time}ms")
+        print(f"CPU 사용률 (명목)     : {cpu_utilization:.2f} %")
+        print(f"CPU 사용률 (유효)     : {effective_cpu_utilization:.2f} %")
+        self.print_extra_summary()
+        self.print_blocking_summary()
+        self.print_device_summary(total_time)
+
+        if self.smp is not None:
+            self.print_cpu_summary()
+            return
+
+        print("\n--- 간트 차트 (Gantt Chart) ---")
+        print("PID | 시작 -> 종료")
+        print("-------------------")
+        for pid, start, end in self.gantt_chart:
+            print(f"{pid: <3} | {start: >3} -> {end: >3} (수행: {end-start}ms)")
+
+    def print_cpu_summary(self):
+        """다중 CPU 실행 결과를 CPU별로 출력합니다. (사용 시간, 문맥 교환, 마이그레이션, 간트 차트)"""
+        print(f"\n--- CPU별 통계 (CPU {self.num_cpus}개, Ready 큐: {self.smp.queues}) ---")
+        print("CPU\t| 사용 시간\t| 문맥 교환\t| 마이그레이션")
+        for core in self.smp.cores:
+            print(f"{core.cpu_id}\t| {core.busy_time}\t\t| {core.context_switches}\t\t| {core.migrations}")
+        print(f"총 마이그레이션 횟수  : {self.migrations}")
+
+        for core in self.smp.cores:
+            print(f"\n--- CPU {core.cpu_id} 간트 차트 ---")
+            print("PID | 시작 -> 종료")
+            print("-------------------")
+            for pid, start, end in core.gantt_chart:
+                print(f"{pid: <3} | {start: >3} -> {end: >3} (수행: {end-start}ms)")
+
+
+# 자동으로 정하는 실시간 시뮬레이션 구간 = 최대 오프셋 + AUTO_HORIZON_HYPERPERIODS x 하이퍼피리어드
+# (첫 하이퍼피리어드 경계에서 반복을 확인한 뒤 온전한 주기를 하나 이상 외삽할 수 있는 최소 길이)
+AUTO_HORIZON_HYPERPERIODS = 3
+# 자동으로 정하는 실시간 시뮬레이션 구간의 상한 (주기들이 서로소이면 하이퍼피리어드가 매우 커짐)
+AUTO_HORIZON_LIMIT = 1000
+
+
+class PriorityHeapPolicy:
+    """
+    우선순위 힙 Ready 큐 정책 (정적 우선순위, RM, EDF 공통, SimulatorBase보다 앞에 상속)
+
+    Ready 큐는 (명령 우선순위, priority(proc), PID, 프로세스) 최소 힙이고, 스케줄러는 선점 비교 키 preempt_key만 정합니다.
+    SRP 프로토콜에서는 srp_blocked()인 프로세스를 건너뛰고 고르며, 그런 프로세스로는 선점하지 않습니다.
+
+    preempt_key : Ready 큐 항목에서 선점 비교 키(작을수록 높음)를 꺼내는 함수
+                  (e.g., operator.itemgetter(slice(2)) -> (명령 우선순위, 우선순위))
+    """
+    preempt_key = None
+
+    def enqueue(self, proc, reason):
+        heapq.heappush(self.ready_queue, (command_priority(proc), self.priority(proc), proc.pid, proc))
+
+    def pick(self):
+        if self.protocol == 'srp':
+            return self.pop_eligible(self.ready_queue)
+        if not self.ready_queue:
+            return None
+        return heapq.heappop(self.ready_queue)[-1]
+
+    def should_preempt(self, running):
+        preempt_key = self.preempt_key
+        key = preempt_key((1, self.priority(running), running.pid, running))
+        if self.protocol == 'srp':
+            return any(preempt_key(item) < key and not self.srp_blocked(item[-1]) for item in self.ready_queue)
+        return preempt_key(self.ready_queue[0]) < key
+
+    def reprioritize(self, proc):
+        self.ready_queue = [item for item in self.ready_queue if item[-1] is not proc]
+        heapq.heapify(self.ready_queue)
+        self.enqueue(proc, 'reprioritize')
+
+    def ready_processes(self):
+        return [item[-1] for item in self.ready_queue]
+
+    def pop_eligible(self, heap):
+        """
+        우선순위 힙에서 SRP로 막히지 않은 가장 높은 항목의 프로세스를 꺼냅니다. (없으면 None)
+        건너뛴 프로세스는 블로킹 구간을 시작합니다.
+        """
+        skipped = []
+        proc = None
+        while heap:
+            item = heapq.heappop(heap)
+            if not self.srp_blocked(item[-1]):
+                proc = item[-1]
+                break
+            skipped.append(item)
+        for item in skipped:
+            if item[-1].blocked_since is None:
+                item[-1].blocked_since = self.current_time
+            heapq.heappush(heap, item)
+        return proc
+
+
+def hyperperiod(process_list):
+    """
+    주기적 프로세스 집합의 하이퍼피리어드(주기들의 최소공배수)와 최대 오프셋(최초 도착 시각)을 반환합니다.
+
+    :return: (hyperperiod, max_offset). 실시간 프로세스가 없으면 (0, 0)
+    """
+    rt_processes = [p for p in process_list if p.period > 0]
+    if not rt_processes:
+        return 0, 0
+    lcm = functools.reduce(lambda a, b: a * b // math.gcd(a, b), (p.period for p in rt_processes))
+    return lcm, max(p.arrival_time for p in rt_processes)
+
+
+class RealtimeSimulatorBase(SimulatorBase):
+    """
+    주기적 실시간 프로세스(RM, EDF)용 공통 엔진
+    - period > 0 인 프로세스만 스케줄링하고, 종료 시 다음 주기 작업을 재생성합니다.
+    - 마감시한 초과 횟수를 기록합니다.
+    - max_simulation_time(작업 재생성 마감 시각)을 생략하면
+      (최대 오프셋 + AUTO_HORIZON_HYPERPERIODS x 하이퍼피리어드)를 사용합니다.
+      AUTO_HORIZON_LIMIT를 넘으면 상한까지만 실행하고 WARN 이벤트('horizon_truncated')를 남깁니다.
+
+    정상 상태 외삽:
+        (최대 오프셋 + k x 하이퍼피리어드) 경계마다 스케줄 상태를 경계 기준 상대 시각으로 기록합니다.
+        직전 경계와 상태가 같으면 이후 스케줄은 하이퍼피리어드마다 그대로 반복되므로,
+        남은 구간의 온전한 주기들은 시뮬레이션하지 않고 시계와 진행 중인 작업만 그만큼 옮긴 뒤
+        한 주기 동안의 통계 증가분(마감시한 초과, 문맥 교환, CPU 사용 시간, 완료 작업 수/반환/대기 시간)에
+        주기 수를 곱해 더합니다. (건너뛴 구간의 작업은 completed_processes/간트 차트에 포함되지 않음)
+    """
+    requeue_after_burst = True
+
+    def __init__(self, process_list, context_switch_overhead=0, max_simulation_time=None, tracer=None,
+                 resources=None):
+        # 실시간 프로세스만 필터링
+        rt_processes = [p for p in process_list if p.period > 0]
+
+        # 원본 프로세스 정보 저장 (주기적 재생성용)
+        self.original_processes = {}
+        for proc in rt_processes:
+            self.prepare(proc)
+            self.original_processes[proc.pid] = {
+                'burst_pattern': tuple(proc.burst_pattern),  # 재생성 작업들이 공유 (불변)
+                'period': proc.period,
+                'deadline': proc.deadline,
+                'static_priority': proc.static_priority
+            }
+
+        super().__init__(rt_processes, context_switch_overhead, tracer, resources)
+        self.hyperperiod, self.max_offset = hyperperiod(rt_processes)
+        self.max_period = max((p.period for p in rt_processes), default=0)
+        if max_simulation_time is None:
+            max_simulation_time = self.max_offset + AUTO_HORIZON_HYPERPERIODS * self.hyperperiod
+            if max_simulation_time > AUTO_HORIZON_LIMIT:
+                self.trace.emit(WARN, None, 'horizon_truncated',
+                                "경고: 자동 시뮬레이션 구간 {horizon}ms(최대 오프셋 {offset} + {cycles} x 하이퍼피리어드 {hyperperiod})가 "
+                                "상한 {limit}ms를 넘어 {limit}ms까지만 실행합니다.",
+                                horizon=max_simulation_time, offset=self.max_offset, cycles=AUTO_HORIZON_HYPERPERIODS,
+                                hyperperiod=self.hyperperiod, limit=AUTO_HORIZON_LIMIT)
+                max_simulation_time = AUTO_HORIZON_LIMIT
+        self.max_simulation_time = max_simulation_time
+        self.deadline_misses = 0
+
+        # [정상 상태 외삽]
+        self.steady_state = None       # (반복 주기 시작 시각, 건너뛴 주기 수)
+        self.next_boundary = INF       # 다음 상태 기록 시각
+        self._boundary = None          # 직전 경계의 (상태, 누적 통계)
+        self._gantt_seen = 0           # 누적 통계 계산 위치 (간트 차트, 완료 작업)
+        self._closed_busy = 0
+        self._completed_seen = 0
+        self._completed_turnaround = 0
+        self._completed_wait = 0
+        if self.hyperperiod and self._can_skip_after(self.max_offset + self.hyperperiod):
+            self.next_boundary = self.max_offset
+
+    def prepare(self, proc):
+        """시뮬레이션 시작 전 실시간 프로세스를 정책에 맞게 설정합니다."""
+        pass
+
+    def run(self):
+        if self.next_boundary == self.current_time:
+            self._check_steady_state()
+        super().run()
+
+    def next_policy_event(self):
+        # 하이퍼피리어드 경계에서 멈춰 상태를 기록
+        return self.next_boundary
+
+    def _advance_clock(self):
+        super()._advance_clock()
+        if self.current_time == self.next_boundary:
+            self._check_steady_state()
+
+    def _can_skip_after(self, boundary):
+        """boundary에서 반복이 확인되면 온전한 주기를 하나 이상 건너뛸 수 있는지"""
+        return boundary + self.hyperperiod + self.max_period <= self.max_simulation_time
+
+    def _schedule_state(self, base):
+        """
+        시각 base 기준 스케줄 상태 (상대 시각으로 표현, 비교 불가능한 상태면 None)
+        """
+        jobs = [(proc, 0, 0) for arrival, pid, proc in self.processes_to_arrive]
+        jobs += [(proc, 1, 0) for proc in self.ready_processes()]
+        if self.running_process:
+            jobs.append((self.running_process, 2, 0))
+        jobs += [(proc, 3, finish - base) for finish, pid, proc in self.waiting_queue]
+        if len(jobs) != len(self.original_processes):
+            return None  # 자원 대기 중이거나 재생성이 끝난 작업이 있음
+
+        job_states = []
+        if any(device.requests for device in self.resources.devices.values()):
+            return None  # I/O 장치 상태(큐, 헤드 위치)는 비교하지 않음
+        for proc, where, io_left in jobs:
+            if proc.held_resources:
+                return None  # 자원 상태는 비교하지 않음
+            job_states.append((proc.pid, where, io_left, proc.arrival_time - base,
+                               proc.current_burst_index, proc.remaining_cpu_time,
+                               proc.absolute_deadline - base if where else 0,
+                               proc.wait_time, proc.last_ready_time - base,
+                               None if proc.first_run_time is None else proc.first_run_time - base))
+        job_states.sort()
+
+        open_gantt = None
+        if self.gantt_chart and len(self.gantt_chart[-1]) == 2:
+            open_gantt = (self.gantt_chart[-1][0], self.gantt_chart[-1][1] - base)
+        # CPU가 유휴 상태였다면 직전 프로세스는 다음 문맥 교환 판정에 쓰이지 않음
+        return (tuple(job_states), open_gantt, self.overhead_remaining, self.current_time_slice,
+                self.cpu_was_idle, None if self.cpu_was_idle else self.last_dispatched_pid)
+
+    def _counters(self, base):
+        """시각 base까지의 누적 통계 (마감 초과, 문맥 교환, 오버헤드, CPU 사용, 완료 수, 반환, 대기)"""
+        gantt = self.gantt_chart
+        i = self._gantt_seen
+        while i < len(gantt) and len(gantt[i]) == 3:
+            pid, start, end = gantt[i]
+            self._closed_busy += end - start
+            i += 1
+        self._gantt_seen = i
+        busy = self._closed_busy
+        if i < len(gantt):
+            busy += base - gantt[i][1]  # 실행 중인 구간
+
+        completed = self.completed_processes
+        for proc in completed[self._completed_seen:]:
+            self._completed_turnaround += proc.turnaround_time
+            self._completed_wait += proc.wait_time
+        self._completed_seen = len(completed)
+
+        return (self.deadline_misses, self.context_switches, self.total_overhead_time, busy,
+                len(completed), self._completed_turnaround, self._completed_wait)
+
+    def _check_steady_state(self):
+        base = self.current_time
+        state = self._schedule_state(base)
+        counters = self._counters(base)
+        previous, self._boundary = self._boundary, (state, counters)
+
+        self.next_boundary = base + self.hyperperiod
+        if not self._can_skip_after(self.next_boundary):
+            self.next_boundary = INF
+
+        if state is None or previous is None or previous[0] != state:
+            return
+        cycles = (self.max_simulation_time - self.max_period - base) // self.hyperperiod
+        if cycles < 1:
+            return
+        per_cycle = [now - before for now, before in zip(counters, previous[1])]
+        self._skip_cycles(cycles, per_cycle)
+        self.next_boundary = INF
+
+    def _skip_cycles(self, cycles, per_cycle):
+        """반복이 확인된 하이퍼피리어드를 cycles번 건너뛰고 통계를 외삽합니다."""
+        base = self.current_time
+        delta = cycles * self.hyperperiod
+        misses, switches, overhead, busy, jobs, turnaround, wait = per_cycle
+        self.deadline_misses += cycles * misses
+        self.context_switches += cycles * switches
+        self.total_overhead_time += cycles * overhead
+        self.skipped_busy_time += cycles * busy
+        self.skipped_jobs += cycles * jobs
+        self.skipped_turnaround += cycles * turnaround
+        self.skipped_wait += cycles * wait
+        self.steady_state = (base - self.hyperperiod, cycles)
+        for proc in self.completed_processes[len(self.completed_processes) - jobs:]:
+            self._record_latency(proc, cycles)  # 건너뛴 주기마다 직전 주기의 작업들이 그대로 반복됨
+
+        # 진행 중인 작업과 시계를 delta만큼 뒤로 이동 (상대 시각은 그대로)
+        ready = self.ready_processes()
+        live = [proc for arrival, pid, proc in self.processes_to_arrive] + ready
+        live += [proc for finish, pid, proc in self.waiting_queue]
+        if self.running_process:
+            live.append(self.running_process)
+        for proc in live:
+            proc.arrival_time += delta
+            proc.absolute_deadline += delta
+            proc.last_ready_time += delta
+            if proc.first_run_time is not None:
+                proc.first_run_time += delta
+            if proc.timeline_slot >= 0:
+                self.timelines.shift(proc.timeline_slot, delta)
+
+        self.processes_to_arrive.shift(delta)
+        self.waiting_queue = [(finish + delta, pid, proc) for finish, pid, proc in self.waiting_queue]
+        self.clear_ready()
+        for proc in ready:
+            self.enqueue(proc, 'shift')
+        if self.gantt_chart and len(self.gantt_chart[-1]) == 2:
+            pid, start_time = self.gantt_chart[-1]
+            self.gantt_chart[-1] = (pid, start_time + delta)
+        self.current_time += delta
+
+        self.trace.emit(INFO, base, 'steady_state',
+                        "정상 상태 탐지: {start}~{end} 구간이 반복됨 -> {cycles}주기({skipped}ms) 외삽, 시각 {resume}부터 재개",
+                        start=base - self.hyperperiod, end=base, cycles=cycles, skipped=delta, resume=self.current_time)
+
+    def on_admit(self, proc):
+        # 절대 마감시한 계산 (도착 시점에 1회)
+        proc.absolute_deadline = proc.arrival_time + proc.deadline
+
+    def on_terminate(self, proc):
+        # --- 마감시한 준수 여부 확인 ---
+        if proc.completion_time > proc.absolute_deadline:
+            self.deadline_misses += 1
+            self.trace.emit(WARN, proc.completion_time, 'deadline_miss',
+                            "프로세스 {pid} 마감시한 초과 !!! (종료: {completion}, 마감: {deadline})",
+                            pid=proc.pid, completion=proc.completion_time, deadline=proc.absolute_deadline)
+
+        # 주기적 재스케줄링
+        next_arrival = proc.arrival_time + proc.period
+        if next_arrival < self.max_simulation_time:
+            original = self.original_processes[proc.pid]
+            new_proc = Process(
+                proc.pid,
+                next_arrival,
+                0,
+                original['burst_pattern'],
+                original['period'],
+                original['deadline']
+            )
+            new_proc.static_priority = original['static_priority']
+            self.processes_to_arrive.push((next_arrival, new_proc.pid, new_proc))
+            self.trace.emit(INFO, proc.completion_time, 'release', "프로세스 {pid} 다음 주기 {next_arrival}에 재도착 예정",
+                            pid=proc.pid, next_arrival=next_arrival)
+
+    def stats(self):
+        result = {'deadline_misses': self.deadline_misses}
+        result.update(super().stats())
+        return result
+
+    def print_extra_summary(self):
+        print(f"마감시한 초과 횟수    : {self.deadline_misses}")
+        if self.steady_state:
+            start, cycles = self.steady_state
+            print(f"정상 상태 외삽        : 시각 {start}부터 {self.hyperperiod}ms 주기 x {cycles}회 (시뮬레이션 생략)")
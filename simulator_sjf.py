@@ -1,373 +1,38 @@
-import collections
-import heapq 
-from process import Process, parse_input_file
-from sync import get_resource
+import heapq
 
-class SimulatorSJF: #  클래스 이름 변경 (SRTF)
+from process import CPU
+from simulator_base import SimulatorBase
+
+class SimulatorSJF(SimulatorBase):
     """
     선점형 SJF (Shortest Remaining Time First - SRTF) 시뮬레이터
+    - Ready 큐: (남은 CPU 시간, PID, 프로세스) 최소 힙
+    - 0-tick 명령(IO/LOCK/UNLOCK)이 남은 프로세스는 키 0으로 최우선 처리
     """
-    def __init__(self, process_list, context_switch_overhead=1):
-        self.processes_to_arrive = []
-        for proc in process_list:
-            heapq.heappush(self.processes_to_arrive, (proc.arrival_time, proc.pid, proc))
-
-        # --- 1. Ready 큐 변경 ---
-        # deque가 아니라 '최소 힙' (priority queue)으로 변경
-        # (남은시간, PID, 프로세스) 튜플을 저장
-        self.ready_queue = [] 
-        
-        self.waiting_queue = []
-        self.current_time = 0
-        self.running_process = None
-        self.completed_processes = []
-        self.gantt_chart = []
-        self.total_cpu_idle_time = 0
-        self.last_cpu_busy_time = 0
-        
-        # [문맥 전환 횟수 및 오버헤드 추가]
-        self.context_switches = 0
-        self.context_switch_overhead = context_switch_overhead
-        self.total_overhead_time = 0
-        self.cpu_was_idle = True
-        self.overhead_remaining = 0
-        
-        # [큐 상태 로깅]
-        self.queue_log = [] 
-
-    # simulator_sjf.py의 run() 메소드 (덮어쓸 내용)
-
-    def run(self):
-        print(f"\n--- 선점형 SJF (SRTF) 시뮬레이션 시작 ---")
-
-        while self.processes_to_arrive or self.ready_queue or self.waiting_queue or self.running_process:
-            
-            # --- 1. 신규 프로세스 도착 처리 ---
-            while self.processes_to_arrive and self.processes_to_arrive[0][0] <= self.current_time:
-                arrival, pid, proc = heapq.heappop(self.processes_to_arrive)
-                proc.state = Process.READY
-                proc.last_ready_time = self.current_time
-                proc.timeline.append((self.current_time, None, Process.READY))
-                
-                current_burst = proc.get_current_burst()
-                if current_burst and current_burst[0] == 'CPU':
-                    heapq.heappush(self.ready_queue, (proc.remaining_cpu_time, proc.pid, proc))
-                    print(f"[Time {self.current_time:3d}] 프로세스 {pid} 도착 (Ready 큐 진입, 남은 시간: {proc.remaining_cpu_time})")
-                elif current_burst: # LOCK, UNLOCK
-                    heapq.heappush(self.ready_queue, (0, proc.pid, proc)) # 0-tick (최우선)
-                    print(f"[Time {self.current_time:3d}] 프로세스 {pid} 도착 (Ready 큐 진입, 명령: {current_burst[0]})")
-
-            # --- 2. I/O 완료 처리 ---
-            while self.waiting_queue and self.waiting_queue[0][0] <= self.current_time:
-                io_finish_time, pid, proc = heapq.heappop(self.waiting_queue)
-                if proc.timeline and proc.timeline[-1][1] is None:
-                    start_time = proc.timeline[-1][0]
-                    proc.timeline[-1] = (start_time, self.current_time, Process.WAITING)
-                proc.state = Process.READY
-                proc.last_ready_time = self.current_time
-                proc.timeline.append((self.current_time, None, Process.READY))
-                
-                current_burst = proc.get_current_burst()
-                if current_burst and current_burst[0] == 'CPU':
-                    heapq.heappush(self.ready_queue, (proc.remaining_cpu_time, proc.pid, proc))
-                    print(f"[Time {self.current_time:3d}] 프로세스 {pid} I/O 완료 (Ready 큐 진입, 남은 시간: {proc.remaining_cpu_time})")
-                elif current_burst: # LOCK, UNLOCK
-                    heapq.heappush(self.ready_queue, (0, proc.pid, proc)) # 0-tick (최우선)
-                    print(f"[Time {self.current_time:3d}] 프로세스 {pid} I/O 완료 (Ready 큐 진입, 명령: {current_burst[0]})")
-
-            # --- 3. 선점(Preemption) 로직 ---
-            if (self.running_process and 
-                self.running_process.get_current_burst() and
-                self.running_process.get_current_burst()[0] == 'CPU' and 
-                self.ready_queue):
-                
-                shortest_remaining_time, shortest_pid, _ = self.ready_queue[0] 
-                
-                if shortest_remaining_time < self.running_process.remaining_cpu_time:
-                    print(f"[Time {self.current_time:3d}] 프로세스 {self.running_process.pid} 선점됨 (새 작업 P{shortest_pid}이 더 짧음)")
-                    
-                    # 간트 차트 종료 처리
-                    if self.gantt_chart and len(self.gantt_chart[-1]) == 2:
-                        start_time = self.gantt_chart[-1][1]
-                        self.gantt_chart[-1] = (self.gantt_chart[-1][0], start_time, self.current_time)
-                        self.last_cpu_busy_time = self.current_time
-
-                    if self.running_process.timeline and self.running_process.timeline[-1][1] is None:
-                        start_time = self.running_process.timeline[-1][0]
-                        self.running_process.timeline[-1] = (start_time, self.current_time, Process.RUNNING)
-                    proc = self.running_process
-                    proc.state = Process.READY
-                    proc.last_ready_time = self.current_time
-                    proc.timeline.append((self.current_time, None, Process.READY))
-                    heapq.heappush(self.ready_queue, (proc.remaining_cpu_time, proc.pid, proc))
-                    
-                    self.running_process = None
-            
-            # --- 3-1. CPU 작업 처리 (Dispatcher) ---
-            if not self.running_process and self.overhead_remaining == 0:
-                if self.ready_queue:
-                    remaining_time, pid, self.running_process = heapq.heappop(self.ready_queue)
-                    
-                    if self.running_process.timeline and self.running_process.timeline[-1][1] is None:
-                        start_time = self.running_process.timeline[-1][0]
-                        self.running_process.timeline[-1] = (start_time, self.current_time, Process.READY)
-                    self.running_process.state = Process.RUNNING
-                    self.running_process.timeline.append((self.current_time, None, Process.RUNNING))
-                    
-                    # 문맥 교환 오버헤드 적용
-                    if not self.cpu_was_idle:
-                        self.context_switches += 1
-                        self.overhead_remaining = self.context_switch_overhead
-                        self.total_overhead_time += self.context_switch_overhead
-                        print(f"[Time {self.current_time:3d}] 문맥 교환 발생 (오버헤드: {self.context_switch_overhead}ms)")
-                    self.cpu_was_idle = False
-                    
-                    wait = self.current_time - self.running_process.last_ready_time
-                    self.running_process.wait_time += wait
-                    
-                    print(f"[Time {self.current_time:3d}] 프로세스 {self.running_process.pid} 실행 시작 (남은 시간: {remaining_time}ms, 대기: {wait}ms, 총 대기: {self.running_process.wait_time}ms)")
-                
-                else:
-                    self.cpu_was_idle = True
-                    pass 
-
-            # --- 3-1-1. 오버헤드 처리 ---
-            if self.overhead_remaining > 0:
-                self.overhead_remaining -= 1
-                self.current_time += 1
-                continue
-
-            # --- 3-2. CPU 실행 ---
-            if self.running_process:
-                proc = self.running_process
-                current_burst = proc.get_current_burst()
-
-                # 3-2-a. TERMINATED
-                if not current_burst:
-                    if proc.timeline and proc.timeline[-1][1] is None:
-                        start_time = proc.timeline[-1][0]
-                        proc.timeline[-1] = (start_time, self.current_time, Process.RUNNING)
-                    proc.state = Process.TERMINATED
-                    proc.completion_time = self.current_time
-                    proc.turnaround_time = proc.completion_time - proc.arrival_time
-                    self.completed_processes.append(proc)
-                    print(f"[Time {self.current_time:3d}] 프로세스 {proc.pid} 종료")
-                    self.running_process = None
-
-                # 3-2-b. 'CPU'
-                elif current_burst[0] == 'CPU':
-                    if (not self.gantt_chart or 
-                        self.gantt_chart[-1][0] != proc.pid or 
-                        len(self.gantt_chart[-1]) == 3):
-                        
-                        self.gantt_chart.append((proc.pid, self.current_time))
-                        print(f"[Time {self.current_time:3d}] 프로세스 {proc.pid} CPU 작업 시작 (남은 시간: {proc.remaining_cpu_time}ms)")
-
-                    proc.remaining_cpu_time -= 1
-                    
-                    if proc.remaining_cpu_time == 0:
-                        print(f"[Time {self.current_time + 1:3d}] 프로세스 {proc.pid} CPU 버스트 완료")
-                        
-                        start_time = self.gantt_chart[-1][1]
-                        self.gantt_chart[-1] = (proc.pid, start_time, self.current_time + 1)
-                        self.last_cpu_busy_time = self.current_time + 1
-                        
-                        proc.advance_to_next_burst()
-                        
-                        next_burst = proc.get_current_burst()
-                        if next_burst:
-                            # [다음 작업이 있음] Ready 큐로 복귀
-                            if proc.timeline and proc.timeline[-1][1] is None:
-                                tl_start = proc.timeline[-1][0]
-                                proc.timeline[-1] = (tl_start, self.current_time + 1, Process.RUNNING)
-                            proc.state = Process.READY
-                            proc.last_ready_time = self.current_time + 1
-                            proc.timeline.append((self.current_time + 1, None, Process.READY))
-                            if next_burst[0] == 'CPU':
-                                heapq.heappush(self.ready_queue, (proc.remaining_cpu_time, proc.pid, proc))
-                            else: # LOCK, UNLOCK
-                                heapq.heappush(self.ready_queue, (0, proc.pid, proc))
-                            self.running_process = None
-                        else:
-                            # --- 👇 [버그 수정] ---
-                            # [다음 작업이 없음] 종료 처리
-                            if proc.timeline and proc.timeline[-1][1] is None:
-                                tl_start = proc.timeline[-1][0]
-                                proc.timeline[-1] = (tl_start, self.current_time + 1, Process.RUNNING)
-                            proc.state = Process.TERMINATED
-                            proc.completion_time = self.current_time + 1
-                            proc.turnaround_time = proc.completion_time - proc.arrival_time
-                            self.completed_processes.append(proc)
-                            print(f"[Time {self.current_time + 1:3d}] 프로세스 {proc.pid} 종료")
-                            self.running_process = None
-                            # --- 👆 [버그 수정 끝] ---
-                    
-                # 3-2-c. 'IO'
-                elif current_burst[0] == 'IO':
-                    if proc.timeline and proc.timeline[-1][1] is None:
-                        start_time = proc.timeline[-1][0]
-                        proc.timeline[-1] = (start_time, self.current_time, Process.RUNNING)
-                    io_duration = current_burst[1]
-                    proc.state = Process.WAITING
-                    proc.timeline.append((self.current_time, None, Process.WAITING))
-                    io_finish_time = self.current_time + io_duration
-                    heapq.heappush(self.waiting_queue, (io_finish_time, proc.pid, proc))
-                    print(f"[Time {self.current_time:3d}] 프로세스 {proc.pid} I/O 시작 (대기 {io_duration}ms)")
-
-                    proc.advance_to_next_burst()
-                    self.running_process = None
-
-                # 3-2-d. 'LOCK'
-                elif current_burst[0] == 'LOCK':
-                    resource_name = current_burst[1]
-                    resource = get_resource(resource_name)
-                    
-                    if not resource:
-                        print(f"!!! [Time {self.current_time:3d}] 오류: P{proc.pid}가 존재하지 않는 자원 '{resource_name}'을(를) 요청했습니다.")
-                        proc.advance_to_next_burst()
-                    else:
-                        print(f"[Time {self.current_time:3d}] 프로세스 {proc.pid}이(가) '{resource_name}' Lock 시도...")
-                        if resource.lock(proc, self.current_time):
-                            print(f"[Time {self.current_time:3d}] 프로세스 {proc.pid}이(가) '{resource_name}' Lock 획득")
-                            proc.advance_to_next_burst()
-                        else:
-                            if proc.timeline and proc.timeline[-1][1] is None:
-                                start_time = proc.timeline[-1][0]
-                                proc.timeline[-1] = (start_time, self.current_time, Process.RUNNING)
-                            print(f"[Time {self.current_time:3d}] 프로세스 {proc.pid}이(가) '{resource_name}' Lock 실패. (자원 대기)")
-                            proc.state = Process.WAITING
-                            proc.timeline.append((self.current_time, None, Process.WAITING))
-                            self.running_process = None
-                            
-                    if self.running_process: 
-                        next_burst = proc.get_current_burst()
-                        if next_burst:
-                            proc.state = Process.READY
-                            proc.last_ready_time = self.current_time
-                            if next_burst[0] == 'CPU':
-                                heapq.heappush(self.ready_queue, (proc.remaining_cpu_time, proc.pid, proc))
-                            else: # LOCK, UNLOCK
-                                heapq.heappush(self.ready_queue, (0, proc.pid, proc))
-                        self.running_process = None
-
-                # 3-2-e. 'UNLOCK'
-                elif current_burst[0] == 'UNLOCK':
-                    resource_name = current_burst[1]
-                    resource = get_resource(resource_name)
-                    
-                    if not resource:
-                        print(f"!!! [Time {self.current_time:3d}] 오류: P{proc.pid}가 존재하지 않는 자원 '{resource_name}'을(를) Unlock하려 합니다.")
-                        proc.advance_to_next_burst()
-                    else:
-                        print(f"[Time {self.current_time:3d}] 프로세스 {proc.pid}이(가) '{resource_name}' Unlock 시도...")
-                        woken_process = resource.unlock(proc, self.current_time)
-                        
-                        if woken_process:
-                            if woken_process.timeline and woken_process.timeline[-1][1] is None:
-                                start_time = woken_process.timeline[-1][0]
-                                woken_process.timeline[-1] = (start_time, self.current_time, Process.WAITING)
-                            woken_process.state = Process.READY
-                            woken_process.last_ready_time = self.current_time
-                            woken_process.timeline.append((self.current_time, None, Process.READY))
-                            
-                            woken_burst = woken_process.get_current_burst()
-                            if woken_burst and woken_burst[0] == 'CPU':
-                                heapq.heappush(self.ready_queue, (woken_process.remaining_cpu_time, woken_process.pid, woken_process))
-                            elif woken_burst:
-                                heapq.heappush(self.ready_queue, (0, woken_process.pid, woken_process))
-                            print(f"[Time {self.current_time:3d}] 프로세스 {woken_process.pid}이(가) '{resource_name}' 획득 (Ready 큐 진입)")
-
-                        proc.advance_to_next_burst()
-
-                    next_burst = proc.get_current_burst()
-                    if next_burst:
-                        proc.state = Process.READY
-                        proc.last_ready_time = self.current_time
-                        if next_burst[0] == 'CPU':
-                            heapq.heappush(self.ready_queue, (proc.remaining_cpu_time, proc.pid, proc))
-                        else: # LOCK, UNLOCK
-                            heapq.heappush(self.ready_queue, (0, proc.pid, proc))
-                    self.running_process = None
+    name = "선점형 SJF (SRTF)"
+    requeue_after_burst = True
 
-            # --- 4. 큐 상태 로깅 ---
-            ready_pids = [item[1] for item in self.ready_queue]  # (remaining_time, pid, proc)
-            waiting_pids = [item[1] for item in self.waiting_queue]  # (time, pid, proc)
-            self.queue_log.append((self.current_time, ready_pids.copy(), waiting_pids.copy()))
-            
-            # --- 5. 시간 증가 ---
-            self.current_time += 1
-        
-        # --- 시뮬레이션 종료 처리 ---
-        total_simulation_time = self.current_time
-        
-        # 모든 프로세스의 미완료 타임라인 종료 처리
-        for proc in self.completed_processes:
-            if proc.timeline and proc.timeline[-1][1] is None:
-                start_time = proc.timeline[-1][0]
-                state = proc.timeline[-1][2]
-                proc.timeline[-1] = (start_time, self.current_time, state)
-        
-        total_cpu_busy_time = 0
-        idle_time_start = 0
-        
-        self.gantt_chart = [entry for entry in self.gantt_chart if len(entry) == 3] 
+    def __init__(self, process_list, context_switch_overhead=1, tracer=None, resources=None,
+                 num_cpus=1, smp_queues='global'):
+        super().__init__(process_list, context_switch_overhead, tracer, resources, num_cpus, smp_queues)
+        self.ready_queue = []
 
-        for pid, start, end in self.gantt_chart:
-            idle_duration = start - idle_time_start
-            if idle_duration > 0:
-                self.total_cpu_idle_time += idle_duration
-            total_cpu_busy_time += (end - start)
-            idle_time_start = end
-        if total_simulation_time > idle_time_start:
-             self.total_cpu_idle_time += (total_simulation_time - idle_time_start)
+    def enqueue(self, proc, reason):
+        burst = proc.get_current_burst()
+        key = proc.remaining_cpu_time if burst and burst[0] == CPU else 0
+        heapq.heappush(self.ready_queue, (key, proc.pid, proc))
 
-        print(f"--- 선점형 SJF (SRTF) 시뮬레이션 종료 ---")
-        self.print_results(total_simulation_time, total_cpu_busy_time)
-        
-    
-    def print_results(self, total_time, total_busy_time):
-        """
-        최종 통계 결과를 출력합니다. (SJF/SRTF)
-        """
-        print(f"\n--- 📊 선점형 SJF (SRTF) 최종 결과 ---")
-        
-        if not self.completed_processes:
-            print("오류: 완료된 프로세스가 없습니다.")
-            return
+    def pick(self):
+        if not self.ready_queue:
+            return None
+        return heapq.heappop(self.ready_queue)[-1]
 
-        self.completed_processes.sort(key=lambda x: x.pid)
-        
-        total_tt = 0
-        total_wt = 0
-        print("PID\t| 도착\t| 종료\t| 반환시간(TT)\t| 대기시간(WT)")
-        print("---------------------------------------------------------")
-        for proc in self.completed_processes:
-            print(f"{proc.pid}\t| {proc.arrival_time}\t| {proc.completion_time}\t| {proc.turnaround_time}\t\t| {proc.wait_time}")
-            total_tt += proc.turnaround_time
-            total_wt += proc.wait_time
+    def should_preempt(self, running):
+        # 남은 시간이 더 짧은 프로세스가 있으면 선점
+        return self.ready_queue[0][0] < running.remaining_cpu_time
 
-        n = len(self.completed_processes)
-        avg_tt = total_tt / n
-        avg_wt = total_wt / n
-        
-        effective_cpu_time = total_busy_time - self.total_overhead_time
-        cpu_utilization = (total_busy_time / total_time) * 100 if total_time > 0 else 0
-        effective_cpu_utilization = (effective_cpu_time / total_time) * 100 if total_time > 0 else 0
-        
-        print("\n--- 요약 ---")
-        print(f"평균 반환 시간 (Avg TT) : {avg_tt:.2f}")
-        print(f"평균 대기 시간 (Avg WT) : {avg_wt:.2f}")
-        print(f"총 실행 시간          : {total_time}")
-        print(f"CPU 총 유휴 시간      : {self.total_cpu_idle_time}")
-        print(f"CPU 총 사용 시간      : {total_busy_time}")
-        print(f"문맥 교환 횟수        : {self.context_switches}")
-        print(f"문맥 교환 오버헤드    : {self.total_overhead_time}ms")
-        print(f"CPU 사용률 (명목)     : {cpu_utilization:.2f} %")
-        print(f"CPU 사용률 (유효)     : {effective_cpu_utilization:.2f} %")
+    def ready_processes(self):
+        return [item[-1] for item in self.ready_queue]
 
-        print("\n--- 간트 차트 (Gantt Chart) ---")
-        print("PID | 시작 -> 종료")
-        print("-------------------")
-        # (SJF 간트 차트는 조각날 수 있으므로, 종료 시간 기록 로직이 매우 중요)
-        for pid, start, end in self.gantt_chart:
-            print(f"{pid: <3} | {start: >3} -> {end: >3} (수행: {end-start}ms)")
\ No newline at end of file
+    def describe(self, proc):
+        return f", 남은 시간: {proc.remaining_cpu_time}ms"
@@ -0,0 +1,344 @@
+"""
+대칭형 다중 프로세서 (SMP) 실행 엔진
+
+SimulatorBase의 코어 루프는 CPU 1개 기준으로 작성되어 있습니다.
+(running_process, overhead_remaining, current_time_slice, gantt_chart 등)
+SMPEngine은 이 상태들을 CPU마다 Core에 따로 보관하고, 한 틱 안에서 CPU를 차례로 시뮬레이터에 '로드'하여
+기존 단일 CPU 처리(_check_preemption, _dispatch, _execute)와 각 알고리즘의 Ready 큐 정책을 그대로 재사용합니다.
+(num_cpus=1이면 사용하지 않으며, 단일 CPU 결과는 기존과 같습니다)
+
+Ready 큐 구성 (SMP_QUEUE_MODES):
+    'global'  : 모든 CPU가 하나의 Ready 큐를 공유 (유휴 CPU가 먼저 가져가고, 그다음 선점 검사)
+    'balance' : CPU별 Ready 큐 + LOAD_BALANCE_INTERVAL(ms)마다 큐 길이 차이가 1 이하가 되도록 옮기는 주기적 부하 분산
+    'steal'   : CPU별 Ready 큐 + 자기 큐가 빈 유휴 CPU가 가장 긴 큐의 맨 앞 프로세스를 가져오는 작업 훔치기
+CPU별 큐에서 새로 도착한 프로세스는 가장 한가한 CPU로, I/O 완료/자원 획득한 프로세스는 마지막 CPU로 들어갑니다.
+마이그레이션: 다른 CPU에서 실행되던 프로세스를 이어서 실행한 횟수 (받은 CPU 기준으로 집계)
+"""
+from event_engine import next_event_time, quiet_ticks
+from tracer import WARN, INFO, DEBUG
+
+INF = float('inf')
+
+SMP_QUEUE_MODES = ('global', 'balance', 'steal')
+
+LOAD_BALANCE_INTERVAL = 10  # 'balance' 모드의 부하 분산 주기 (ms)
+
+# CPU마다 따로 두는 시뮬레이터 상태 (정책 고유의 상태는 SimulatorBase.core_attrs)
+CORE_ATTRS = ('running_process', 'overhead_remaining', 'current_time_slice', 'cpu_was_idle',
+              'last_dispatched_pid', 'gantt_chart', 'last_cpu_busy_time',
+              'context_switches', 'total_overhead_time')
+
+
+class Core:
+    """
+    CPU 하나의 실행 상태
+    """
+    __slots__ = ('cpu_id', 'state', 'queue', 'migrations')
+
+    def __init__(self, cpu_id, state, queue):
+        self.cpu_id = cpu_id
+        self.state = state    # {속성 이름: 값} (CORE_ATTRS + 정책의 core_attrs)
+        self.queue = queue    # CPU별 Ready 큐 상태 {속성 이름: 값} ('global'이면 None)
+        self.migrations = 0
+
+    @property
+    def gantt_chart(self):
+        return self.state['gantt_chart']
+
+    @property
+    def context_switches(self):
+        return self.state['context_switches']
+
+    @property
+    def overhead_time(self):
+        return self.state['total_overhead_time']
+
+    @property
+    def busy_time(self):
+        return sum(end - start for pid, start, end in self.gantt_chart)
+
+
+class SMPEngine:
+    """
+    N개의 CPU로 시뮬레이터를 실행합니다.
+
+    :param sim: 시뮬레이터 (SimulatorBase, Ready 큐가 준비된 상태)
+    :param num_cpus: CPU 수
+    :param queues: Ready 큐 구성 (SMP_QUEUE_MODES)
+    """
+    def __init__(self, sim, num_cpus, queues='global'):
+        if queues not in SMP_QUEUE_MODES:
+            sim.trace.emit(WARN, None, 'unknown_smp_queues', "경고: 알 수 없는 SMP Ready 큐 구성 '{queues}'. 'global'을 사용합니다.",
+                           queues=queues)
+            queues = 'global'
+        self.sim = sim
+        self.queues = queues
+        self.per_cpu = queues != 'global'
+        self.state_attrs = CORE_ATTRS + tuple(sim.core_attrs)
+
+        initial = {attr: getattr(sim, attr) for attr in self.state_attrs}
+        self.cores = []
+        for cpu_id in range(num_cpus):
+            state = dict(initial)
+            state['gantt_chart'] = []
+            queue = None
+            if self.per_cpu:
+                sim.clear_ready()
+                queue = {attr: getattr(sim, attr) for attr in sim.queue_attrs}
+            self.cores.append(Core(cpu_id, state, queue))
+
+        # 현재 시뮬레이터에 로드된 CPU 상태 / Ready 큐
+        self.loaded = self.cores[0]
+        self.queue_owner = self.cores[0]
+        self._restore_state(self.loaded)
+        if self.per_cpu:
+            self._restore_queue(self.queue_owner)
+
+        self.last_cpu = {}   # 프로세스 -> 마지막으로 실행된 CPU 번호
+        self.home = {}       # 프로세스 -> Ready 큐가 있는 (또는 마지막으로 실행된) CPU 번호
+        self.next_balance = LOAD_BALANCE_INTERVAL
+
+    # -------------------------------------------------------------------
+    # CPU / Ready 큐 상태 전환
+    # -------------------------------------------------------------------
+    def _restore_state(self, core):
+        for attr, value in core.state.items():
+            setattr(self.sim, attr, value)
+
+    def _restore_queue(self, core):
+        for attr, value in core.queue.items():
+            setattr(self.sim, attr, value)
+
+    def save(self):
+        """시뮬레이터에 로드된 CPU 상태와 Ready 큐를 Core에 저장합니다."""
+        sim = self.sim
+        state = self.loaded.state
+        for attr in self.state_attrs:
+            state[attr] = getattr(sim, attr)
+        if self.per_cpu:
+            queue = self.queue_owner.queue
+            for attr in queue:
+                queue[attr] = getattr(sim, attr)
+
+    def load(self, core):
+        """core의 실행 상태(와 CPU별 Ready 큐)를 시뮬레이터에 로드합니다."""
+        if core is not self.loaded:
+            sim = self.sim
+            state = self.loaded.state
+            for attr in self.state_attrs:
+                state[attr] = getattr(sim, attr)
+            self.loaded = core
+            self._restore_state(core)
+        self.load_queue(core)
+
+    def load_queue(self, core):
+        """core의 Ready 큐만 시뮬레이터에 로드합니다. (CPU별 큐일 때)"""
+        if not self.per_cpu or core is self.queue_owner:
+            return
+        sim = self.sim
+        queue = self.queue_owner.queue
+        for attr in queue:
+            queue[attr] = getattr(sim, attr)
+        self.queue_owner = core
+        self._restore_queue(core)
+
+    def _with_queue(self, core, func, *args):
+        """core의 Ready 큐에 대해 정책 메서드를 호출합니다."""
+        owner = self.queue_owner
+        self.load_queue(core)
+        result = func(*args)
+        self.load_queue(owner)
+        return result
+
+    def _queues(self):
+        """Ready 큐마다 대표 CPU ('global'이면 현재 CPU 하나)"""
+        return self.cores if self.per_cpu else (self.loaded,)
+
+    def queue_length(self, core):
+        return self._with_queue(core, lambda: len(self.sim.ready_processes()))
+
+    def has_ready(self):
+        """어느 CPU의 Ready 큐든 프로세스가 있는지"""
+        return any(self._with_queue(core, self.sim.has_ready) for core in self._queues())
+
+    def ready_processes(self):
+        """모든 Ready 큐의 프로세스 목록"""
+        result = []
+        for core in self._queues():
+            result += self._with_queue(core, self.sim.ready_processes)
+        return result
+
+    def _busy(self, core):
+        if core is self.loaded:
+            return self.sim.running_process is not None
+        return core.state['running_process'] is not None
+
+    # -------------------------------------------------------------------
+    # Ready 큐 배치 (SimulatorBase가 호출)
+    # -------------------------------------------------------------------
+    def enqueue(self, proc, reason):
+        """도착/I-O 완료/자원 획득한 프로세스를 알맞은 CPU의 Ready 큐에 넣습니다."""
+        if not self.per_cpu:
+            self.sim.enqueue(proc, reason)
+            return
+        cpu_id = self.home.get(proc)
+        target = self.cores[cpu_id] if cpu_id is not None else self._least_loaded()
+        self.home[proc] = target.cpu_id
+        self._with_queue(target, self.sim.enqueue, proc, reason)
+
+    def reprioritize(self, proc):
+        """proc가 들어 있는 Ready 큐에서 우선순위를 다시 계산합니다."""
+        if not self.per_cpu:
+            self.sim.reprioritize(proc)
+            return
+        self._with_queue(self.cores[self.home[proc]], self.sim.reprioritize, proc)
+
+    def _least_loaded(self):
+        return min(self.cores, key=lambda core: (self.queue_length(core) + self._busy(core), core.cpu_id))
+
+    def _take(self, core):
+        """core의 Ready 큐에서 가장 앞의 프로세스를 꺼냅니다. (현재 CPU의 정책 상태는 유지)"""
+        sim = self.sim
+        saved = [getattr(sim, attr) for attr in sim.core_attrs]
+        proc = self._with_queue(core, sim.pick)
+        for attr, value in zip(sim.core_attrs, saved):
+            setattr(sim, attr, value)
+        return proc
+
+    def _move(self, proc, source, target, why):
+        self.home[proc] = target.cpu_id
+        self._with_queue(target, self.sim.enqueue, proc, 'migrate')
+        self.sim.trace.emit(DEBUG, self.sim.current_time, 'move', "프로세스 {pid} Ready 큐 이동 CPU{src} -> CPU{dst} ({why})",
+                            pid=proc.pid, src=source.cpu_id, dst=target.cpu_id, why=why)
+
+    def _steal(self, core):
+        """자기 큐가 빈 core가 가장 긴 Ready 큐에서 프로세스 하나를 가져옵니다."""
+        lengths = [(self.queue_length(other), -other.cpu_id, other) for other in self.cores if other is not core]
+        if not lengths:
+            return
+        length, _, victim = max(lengths)
+        if length == 0:
+            return
+        proc = self._take(victim)
+        if proc is not None:
+            self._move(proc, victim, core, "작업 훔치기")
+
+    def _balance(self):
+        """가장 긴 큐와 가장 짧은 큐의 길이 차이가 1 이하가 될 때까지 프로세스를 옮깁니다."""
+        lengths = {core: self.queue_length(core) for core in self.cores}
+        while True:
+            busiest = max(self.cores, key=lambda core: (lengths[core], -core.cpu_id))
+            idlest = min(self.cores, key=lambda core: (lengths[core], core.cpu_id))
+            if lengths[busiest] - lengths[idlest] <= 1:
+                break
+            proc = self._take(busiest)
+            if proc is None:
+                break
+            self._move(proc, busiest, idlest, "부하 분산")
+            lengths[busiest] -= 1
+            lengths[idlest] += 1
+
+    # -------------------------------------------------------------------
+    # 메인 루프
+    # -------------------------------------------------------------------
+    def run(self):
+        sim = self.sim
+        while sim.processes_to_arrive or sim.waiting_queue or self.has_ready() or \
+                any(self._busy(core) for core in self.cores):
+            sim._handle_events()
+
+            if self.queues == 'balance' and sim.current_time >= self.next_balance:
+                # 큐가 모두 비어 있어 건너뛴 분산 시각은 무시하고 경계 시각에만 분산
+                if sim.current_time % LOAD_BALANCE_INTERVAL == 0:
+                    self._balance()
+                self.next_balance = (sim.current_time // LOAD_BALANCE_INTERVAL + 1) * LOAD_BALANCE_INTERVAL
+
+            # 유휴 CPU가 먼저 Ready 큐에서 가져간 뒤 실행 중인 CPU의 선점을 검사
+            # (공유 큐에서 빈 CPU가 있는데 다른 CPU의 프로세스를 선점하지 않도록)
+            for core in self.cores:
+                self.load(core)
+                if not sim.running_process and sim.overhead_remaining == 0:
+                    self._dispatch(core)
+
+            for core in self.cores:
+                self.load(core)
+                sim._check_preemption()
+                if not sim.running_process and sim.overhead_remaining == 0:
+                    self._dispatch(core)
+
+            # 실행은 모든 CPU의 선택이 끝난 뒤에 (이번 틱에 CPU를 반납한 프로세스는 다음 틱부터 다른 CPU에서 실행)
+            for core in self.cores:
+                self.load(core)
+                if sim.overhead_remaining > 0:
+                    sim.overhead_remaining -= 1
+                elif sim.running_process:
+                    sim._execute(sim.running_process)
+
+            self._advance_clock()
+
+        self.save()
+        self._merge()
+
+    def _dispatch(self, core):
+        sim = self.sim
+        if self.queues == 'steal' and not sim.has_ready():
+            self._steal(core)
+        sim._dispatch()
+        proc = sim.running_process
+        if proc is None:
+            return
+        last = self.last_cpu.get(proc)
+        if last is not None and last != core.cpu_id:
+            core.migrations += 1
+            sim.trace.emit(INFO, sim.current_time, 'migrate', "프로세스 {pid} 마이그레이션 CPU{src} -> CPU{dst}",
+                           pid=proc.pid, src=last, dst=core.cpu_id)
+        self.last_cpu[proc] = core.cpu_id
+        self.home[proc] = core.cpu_id
+
+    def _advance_clock(self):
+        """
+        모든 CPU가 이벤트 없이 보낼 수 있는 틱만큼 건너뜁니다. (event_engine.advance_clock의 다중 CPU 버전)
+        """
+        sim = self.sim
+        horizon = min(self._with_queue(core, sim.next_policy_event) for core in self._queues())
+        if self.queues == 'balance' and self.has_ready():
+            horizon = min(horizon, self.next_balance)
+        limit = min(next_event_time(sim), horizon) - sim.current_time - 1
+
+        skipped = 0
+        if limit > 0:
+            quiet = []
+            skipped = limit
+            # 작업 훔치기: 유휴 CPU는 모든 Ready 큐가 비어 있어야 조용히 있을 수 있음
+            all_empty = self.queues == 'steal' and not self.has_ready()
+            for core in self.cores:
+                self.load(core)
+                ready_empty = all_empty if self.queues == 'steal' else not sim.has_ready()
+                kind, ticks = quiet_ticks(sim, ready_empty, sim.time_slice_limit() - sim.current_time_slice)
+                quiet.append((core, kind))
+                skipped = min(skipped, ticks)
+            if skipped == INF:
+                skipped = 0
+            if skipped > 0:
+                for core, kind in quiet:
+                    self.load(core)
+                    if kind == 'overhead':
+                        sim.overhead_remaining -= skipped
+                    elif kind == 'run':
+                        sim.running_process.remaining_cpu_time -= skipped
+                        sim.current_time_slice += skipped
+                    elif kind == 'idle':
+                        sim.cpu_was_idle = True
+        sim.current_time += 1 + skipped
+
+    def _merge(self):
+        """CPU별 결과를 시뮬레이터 전체 결과로 합칩니다."""
+        sim = self.sim
+        for core in self.cores:
+            core.state['gantt_chart'] = [entry for entry in core.gantt_chart if len(entry) == 3]
+        sim.gantt_chart = sorted((entry for core in self.cores for entry in core.gantt_chart),
+                                 key=lambda entry: (entry[1], entry[0]))
+        sim.context_switches = sum(core.context_switches for core in self.cores)
+        sim.total_overhead_time = sum(core.overhead_time for core in self.cores)
+        sim.migrations = sum(core.migrations for core in self.cores)
+        sim.running_process = None
@@ -1,192 +1,485 @@
 # sync.py
 
 import collections
+import math
 
-RESOURCE_ID_COUNTER = 0
-DEADLOCK_STRATEGY = 'prevention'  # 'prevention', 'avoidance', 'detection'
+import numpy as np
+
+from io_device import IODevice
+from process import LOCK, UNLOCK
+from tracer import get_tracer, DEBUG, INFO, WARN
+
+DEADLOCK_STRATEGIES = ('prevention', 'avoidance', 'detection')
+
+# 우선순위 역전 대응 프로토콜
+#   'none'        : 없음 (자원 대기 중인 높은 우선순위 프로세스가 중간 우선순위 작업에 밀릴 수 있음)
+#   'inheritance' : 우선순위 상속 (PIP) - 소유자가 대기자 중 가장 높은 우선순위를 물려받음
+#   'ceiling'     : 우선순위 천장 (즉시 천장 방식 PCP) - 자원을 잡는 즉시 자원의 천장 우선순위로 실행
+#   'srp'         : Stack Resource Policy - 선점 수준이 시스템 천장보다 높은 작업만 시작 (EDF용)
+SYNC_PROTOCOLS = ('none', 'inheritance', 'ceiling', 'srp')
 
 class Resource:
     """
     Mutex 역할을 하는 공유 자원 클래스입니다.
+    (instances > 1이면 같은 종류의 자원 인스턴스 여러 개를 가진 계수 자원, LOCK/UNLOCK 한 번에 1개씩 획득/반납)
+
+    대기 그래프(wait-for graph)를 lock/unlock 시점에 갱신합니다.
+        대기 간선: 대기 프로세스.blocked_on -> 자원
+        소유 간선: 자원.owner -> 소유 프로세스
+    따라서 "P가 기다리는 자원의 소유자"를 O(1)로 따라갈 수 있습니다. (-> find_cycle)
+    소유자가 여럿인 다중 인스턴스 자원은 순환 대기가 교착상태의 충분조건이 아니므로 owner를 두지 않습니다.
     """
-    def __init__(self, name):
-        global RESOURCE_ID_COUNTER # 
+    def __init__(self, name, resource_id=0, instances=1, tracer=None):
         self.name = name
-        self.id = RESOURCE_ID_COUNTER # 
-        RESOURCE_ID_COUNTER += 1      # 
+        self.id = resource_id  # 자원 순서 할당(예방 전략)과 Banker 행렬의 열 번호 (ResourceManager가 0, 1, 2... 순서로 발급)
         
-        self.is_locked = False
+        self.instances = instances
+        self.available = instances
+        self.holders = []  # 인스턴스를 보유한 프로세스 (1개당 한 번씩)
         self.owner_pid = None
+        self.owner = None  # 소유 프로세스 (Mutex만, 대기 그래프 탐색용)
+        self.banker = None  # 할당 변화를 알릴 Banker (initialize_resources가 설정)
+        self.ceiling = math.inf  # 이 자원을 쓰는 프로세스 중 가장 높은 선점 수준 (작을수록 높음, 시뮬레이터가 설정)
         
         # 이 자원을 기다리는 프로세스들의 대기 큐 (FIFO)
         # 가이드라인에 따라 Waiting 상태가 된 프로세스들이 여기로 옵니다.
         self.waiting_queue = collections.deque()
-        print(f"[자원 생성] Mutex '{self.name}'이(가) 생성되었습니다.")
+        tracer = tracer or get_tracer()
+        if instances == 1:
+            tracer.emit(INFO, None, 'resource_create', "[자원 생성] Mutex '{resource}'이(가) 생성되었습니다.",
+                        resource=name)
+        else:
+            tracer.emit(INFO, None, 'resource_create', "[자원 생성] 자원 '{resource}'(인스턴스 {instances}개)이(가) 생성되었습니다.",
+                        resource=name, instances=instances)
+
+    @property
+    def is_locked(self):
+        """남은 인스턴스가 없는지 (Mutex: 잠겨 있는지)"""
+        return self.available == 0
+
+    def _acquire(self, process):
+        self.available -= 1
+        self.holders.append(process)
+        if self.instances == 1:
+            self.owner_pid = process.pid
+            self.owner = process
+        if self.banker is not None:
+            self.banker.allocate(process, self.id, 1)
 
-    def lock(self, process, current_time):
+    def _release(self, process):
+        self.available += 1
+        self.holders.remove(process)
+        if self.instances == 1:
+            self.owner_pid = None
+            self.owner = None
+        if self.banker is not None:
+            self.banker.allocate(process, self.id, -1)
+
+    def lock(self, process, current_time, tracer=None):
         """
         프로세스가 이 자원의 lock을 시도합니다.
         
         :param process: lock을 시도하는 Process 객체
+        :param current_time: 현재 시뮬레이션 시각
+        :param tracer: 이벤트를 기록할 Tracer (기본: tracer.get_tracer())
         :return: True (성공) 또는 False (실패)
         """
-        if not self.is_locked:
+        tracer = tracer or get_tracer()
+        if self.available:
             # --- Lock 성공 ---
-            self.is_locked = True
-            self.owner_pid = process.pid
-            print(f"[Time ???] 프로세스 {process.pid}이(가) '{self.name}' Lock 획득")
+            self._acquire(process)
+            tracer.emit(DEBUG, current_time, 'resource_acquire',
+                        "프로세스 {pid}이(가) '{resource}' Lock 획득", pid=process.pid, resource=self.name)
             return True
         else:
             # --- Lock 실패 ---
             # 프로세스를 이 자원의 대기 큐에 추가합니다.
-            self.waiting_queue.append(process)
-            print(f"[Time ???] 프로세스 {process.pid}이(가) '{self.name}' Lock 실패. (대기 큐 진입)")
+            self.add_waiter(process)
+            tracer.emit(DEBUG, current_time, 'resource_enqueue',
+                        "프로세스 {pid}이(가) '{resource}' Lock 실패. (대기 큐 진입)", pid=process.pid, resource=self.name)
             return False
 
-    def unlock(self, process, current_time):
+    def unlock(self, process, current_time, tracer=None, may_grant=None):
         """
         프로세스가 이 자원의 unlock을 시도합니다.
         
         :param process: unlock을 시도하는 Process 객체
+        :param current_time: 현재 시뮬레이션 시각
+        :param tracer: 이벤트를 기록할 Tracer (기본: tracer.get_tracer())
+        :param may_grant: 대기자에게 넘겨도 되는지 판단하는 함수 (process, resource) -> bool (기본: 항상 허용)
         :return: (상태가 변경되어 Ready 큐로 가야 할 프로세스) 또는 None
         """
-        if self.is_locked and self.owner_pid == process.pid:
-            self.is_locked = False
-            self.owner_pid = None
-            print(f"[Time ???] 프로세스 {process.pid}이(가) '{self.name}' Unlock 반납")
+        tracer = tracer or get_tracer()
+        if process in self.holders:
+            self._release(process)
+            tracer.emit(DEBUG, current_time, 'resource_release',
+                        "프로세스 {pid}이(가) '{resource}' Unlock 반납", pid=process.pid, resource=self.name)
             
             # --- 대기자 처리 ---
-            # 이 자원을 기다리던 프로세스가 있다면,
-            if self.waiting_queue:
-                # 대기 큐의 맨 앞 프로세스를 꺼냅니다.
-                woken_process = self.waiting_queue.popleft()
-                
-                # 자원의 Lock을 이 새 프로세스에게 즉시 넘겨줍니다.
-                self.is_locked = True
-                self.owner_pid = woken_process.pid
-                
-                print(f"[Time ???] '{self.name}' 자원을 P{woken_process.pid}에게 전달. (Ready 큐로 이동)")
-                # 이 프로세스는 Waiting -> Ready 상태로 변경되어야 합니다.
-                return woken_process 
-                
-            return None # 아무도 깨울 필요 없음
+            # 이 자원을 기다리던 프로세스가 있다면 반납된 인스턴스를 즉시 넘겨줍니다.
+            return self.grant_waiter(current_time, tracer, may_grant)
         
         else:
             # (자신이 소유하지 않은 lock을 해제하려는 비정상적 경우)
-            print(f"경고: P{process.pid}이(가) 소유하지 않은 '{self.name}' Unlock 시도함.")
+            tracer.emit(WARN, current_time, 'resource_bad_unlock',
+                        "경고: P{pid}이(가) 소유하지 않은 '{resource}' Unlock 시도함.", pid=process.pid, resource=self.name)
+            return None
+
+    def grant_waiter(self, current_time, tracer=None, may_grant=None):
+        """
+        남은 인스턴스를 대기 큐에서 가장 먼저 온 (may_grant를 통과하는) 프로세스에게 넘깁니다.
+
+        :return: 자원을 넘겨받아 Ready 큐로 가야 할 프로세스 또는 None
+        """
+        if not self.available:
             return None
+        for woken_process in self.waiting_queue:
+            if may_grant is None or may_grant(woken_process, self):
+                break
+        else:
+            return None # 아무도 깨울 필요 없음 (또는 넘겨도 되는 대기자가 없음)
 
-# --- 모든 시뮬레이션이 공유할 전역 자원 관리자 ---
-# (간단하게 Dictionary로 구현)
-# 예: "Printer", "File", "R1", "R2" ...
-RESOURCE_REGISTRY = {}
+        tracer = tracer or get_tracer()
+        self.remove_waiter(woken_process)
+        self._acquire(woken_process)
+        tracer.emit(DEBUG, current_time, 'resource_handoff',
+                    "'{resource}' 자원을 P{pid}에게 전달. (Ready 큐로 이동)", pid=woken_process.pid, resource=self.name)
+        # 이 프로세스는 Waiting -> Ready 상태로 변경되어야 합니다.
+        return woken_process
+
+    def add_waiter(self, process):
+        """프로세스를 대기 큐에 넣고 대기 간선(process -> 이 자원)을 추가합니다."""
+        self.waiting_queue.append(process)
+        process.blocked_on = self
+
+    def remove_waiter(self, process):
+        """대기 중인 프로세스를 대기 큐에서 빼고 대기 간선을 제거합니다."""
+        self.waiting_queue.remove(process)
+        process.blocked_on = None
+
+def find_cycle(process):
+    """
+    process의 대기 간선에서 시작하는 순환 대기를 찾습니다.
+    (대기 자원 -> 소유자 -> 소유자의 대기 자원 -> ... 사슬만 따라가므로 비용은 사슬 길이에 비례)
+
+    Lock 실패 직후 호출하면, 새 간선이 만든 순환만 검사하면 됩니다.
+    (그 전까지 순환이 없었다면 새로 생긴 순환은 반드시 새 간선을 지남)
+
+    :param process: 방금 대기 상태가 된 프로세스
+    :return: 순환에 속한 프로세스 리스트 (process부터 대기 순서대로). 순환이 없으면 []
+    """
+    cycle = [process]
+    seen = {process}
+    resource = process.blocked_on
+    while resource is not None and resource.owner is not None:
+        owner = resource.owner
+        if owner is process:
+            return cycle
+        if owner in seen:
+            return []  # process를 지나지 않는 (기존) 순환
+        cycle.append(owner)
+        seen.add(owner)
+        resource = owner.blocked_on
+    return []
+
+def detect_deadlock(all_processes):
+    """
+    교착상태 탐지 알고리즘 (순환 대기 검사)
+    :param all_processes: 검사할 프로세스 리스트
+    :return: 교착상태에 있는 프로세스의 PID 리스트
+    """
+    deadlocked = set()
+    for proc in all_processes:
+        if proc.blocked_on is not None and proc.pid not in deadlocked:
+            deadlocked.update(p.pid for p in find_cycle(proc))
+    return list(deadlocked)
+
+def claims_from_bursts(burst_pattern):
+    """
+    버스트 프로그램의 LOCK/UNLOCK을 따라가며 자원별 최대 동시 보유 수(최대 요구량)를 구합니다.
+    e.g., "LOCK:R1,LOCK:R2,UNLOCK:R2,UNLOCK:R1" -> {'R1': 1, 'R2': 1}
+    """
+    held = collections.Counter()
+    claims = {}
+    for op, value in burst_pattern:
+        if op == LOCK:
+            held[value] += 1
+            claims[value] = max(claims.get(value, 0), held[value])
+        elif op == UNLOCK and held[value]:
+            held[value] -= 1
+    return claims
+
+class Banker:
+    """
+    다중 인스턴스 Banker's 알고리즘 (교착상태 회피)
+
+    자원을 보유했거나 요청한 프로세스마다 행을 하나씩 두고 아래 행렬을 유지합니다.
+        allocation[행, 자원 ID] : 보유 인스턴스 수 (Resource가 획득/반납 시 allocate로 갱신)
+        claim[행, 자원 ID]      : 최대 요구량 (Process.max_claim, 없으면 버스트 프로그램에서 계산)
+        available[자원 ID]      : 남은 인스턴스 수
+    need = claim - allocation 입니다.
+
+    보유 자원이 없는 프로세스는 (최대 요구량 <= 전체 인스턴스이므로) 안전 순서의 맨 끝에 둘 수 있어
+    검사에서 빼도 결과가 같습니다. 따라서 행 수는 "현재 자원을 보유한 프로세스 수"로 유지됩니다.
+    """
+    def __init__(self, resources):
+        self.resource_ids = {res.name: res.id for res in resources}
+        self.total = np.array([res.instances for res in resources], dtype=np.int64)
+        self.available = self.total.copy()
+
+        capacity = 16
+        self.allocation = np.zeros((capacity, len(resources)), dtype=np.int64)
+        self.claim = np.zeros((capacity, len(resources)), dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.rows = {}       # 프로세스 -> 행 번호
+        self.free_rows = []
+
+    def claim_vector(self, process):
+        """프로세스의 최대 요구량 벡터 (자원 ID 순, 전체 인스턴스 수로 제한)"""
+        claims = process.max_claim
+        if claims is None:
+            claims = claims_from_bursts(process.burst_pattern).items()
+        vector = np.zeros(len(self.total), dtype=np.int64)
+        for name, count in claims:
+            res_id = self.resource_ids.get(name)
+            if res_id is not None:
+                vector[res_id] = min(count, self.total[res_id])
+        return vector
+
+    def _row(self, process):
+        row = self.rows.get(process)
+        if row is not None:
+            return row
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            row = len(self.rows)
+            if row == len(self.active):
+                # 행렬 용량을 두 배로 늘림
+                self.allocation = np.concatenate([self.allocation, np.zeros_like(self.allocation)])
+                self.claim = np.concatenate([self.claim, np.zeros_like(self.claim)])
+                self.active = np.concatenate([self.active, np.zeros_like(self.active)])
+        self.rows[process] = row
+        self.allocation[row] = 0
+        self.claim[row] = self.claim_vector(process)
+        self.active[row] = True
+        return row
+
+    def _drop_if_idle(self, process, row):
+        """보유 자원이 없어진 프로세스의 행을 반납합니다."""
+        if not self.allocation[row].any():
+            del self.rows[process]
+            self.active[row] = False
+            self.free_rows.append(row)
+
+    def allocate(self, process, res_id, count):
+        """process의 res_id 보유 수를 count만큼 바꿉니다. (반납은 음수)"""
+        row = self._row(process)
+        self.allocation[row, res_id] += count
+        self.available[res_id] -= count
+        # 선언보다 많이 보유하게 되면 최대 요구량을 늘려 need가 음수가 되지 않게 함
+        if self.allocation[row, res_id] > self.claim[row, res_id]:
+            self.claim[row, res_id] = self.allocation[row, res_id]
+        if count < 0:
+            self._drop_if_idle(process, row)
+
+    def is_safe(self):
+        """
+        현재 상태가 안전한지 검사합니다.
+        완료 가능한 (need <= work) 프로세스들을 한 번에 모두 완료시키고 자원을 돌려받는 과정을 벡터 연산으로 반복합니다.
+        """
+        allocation = self.allocation[self.active]
+        need = self.claim[self.active] - allocation
+        work = self.available.copy()
+        finished = np.zeros(len(allocation), dtype=bool)
+        while not finished.all():
+            runnable = ~finished & (need <= work).all(axis=1)
+            if not runnable.any():
+                return False
+            work += allocation[runnable].sum(axis=0)
+            finished |= runnable
+        return True
+
+    def is_safe_request(self, process, resource):
+        """
+        process에게 resource 인스턴스 1개를 할당한 뒤에도 안전 상태인지 검사합니다.
+        (남은 인스턴스가 없으면 어차피 대기하므로 True)
+        """
+        res_id = resource.id
+        if self.available[res_id] == 0:
+            return True
+        row = self._row(process)
+        self.allocation[row, res_id] += 1
+        self.available[res_id] -= 1
+        try:
+            return self.is_safe()
+        finally:
+            self.allocation[row, res_id] -= 1
+            self.available[res_id] += 1
+            self._drop_if_idle(process, row)
+
+
+class ResourceManager:
+    """
+    한 시뮬레이션이 사용하는 자원 집합 (자원, 자원 ID, 교착상태 전략, Banker, I/O 장치)
+
+    시뮬레이터마다 별도의 ResourceManager를 넘기면 자원 상태를 공유하지 않으므로
+    여러 시뮬레이션을 스레드에서 동시에 실행할 수 있습니다.
+    (넘기지 않으면 모듈 함수 initialize_resources 등이 다루는 기본 인스턴스를 사용)
+
+    :param tracer: 자원/I/O 장치 생성, 전략/프로토콜 변경 메시지를 기록할 Tracer (기본: tracer.get_tracer())
+    """
+    def __init__(self, resource_names=(), strategy='prevention', protocol='none', tracer=None):
+        self.tracer = tracer
+        self.resources = {}  # 예: "Printer", "File", "R1", "R2" ...
+        self.banker = Banker([])
+        self.strategy = strategy
+        self.protocol = protocol
+        self.devices = {}  # I/O 장치 (이름 -> io_device.IODevice, "IO:<장치>:<시간>" 버스트가 사용)
+        self.initialize(resource_names)
+
+    def __iter__(self):
+        return iter(self.resources.values())
+
+    def initialize(self, resource_names):
+        """
+        자원을 (다시) 등록합니다. 자원 ID는 0, 1, 2... 순서로 발급됩니다.
+
+        :param resource_names: 자원 이름 리스트 (각 1개, Mutex) 또는 {이름: 인스턴스 수} 딕셔너리
+        """
+        self.resources.clear()
+        if not isinstance(resource_names, dict):
+            resource_names = dict.fromkeys(resource_names, 1)
+        for resource_id, (name, instances) in enumerate(resource_names.items()):
+            self.resources[name] = Resource(name, resource_id, instances, self.tracer)
+
+        self.banker = Banker(list(self.resources.values()))
+        for resource in self.resources.values():
+            resource.banker = self.banker
+
+    def get(self, name):
+        """이름으로 등록된 자원을 가져옵니다. (없으면 None)"""
+        return self.resources.get(name)
+
+    def initialize_devices(self, devices):
+        """
+        I/O 장치를 (다시) 등록합니다.
+
+        :param devices: 장치 이름 리스트 (기본 설정) 또는 {이름: IODevice 인자 딕셔너리}
+                        e.g., {'disk0': {'channels': 2, 'policy': 'scan'}}
+        """
+        self.devices.clear()
+        if not isinstance(devices, dict):
+            devices = dict.fromkeys(devices)
+        for name, options in devices.items():
+            self.devices[name] = IODevice(name, **(options or {}), tracer=self.tracer)
+
+    def get_device(self, name):
+        """이름으로 등록된 I/O 장치를 가져옵니다. (없으면 None)"""
+        return self.devices.get(name)
+
+    def reset_devices(self):
+        """모든 I/O 장치의 대기 큐와 통계를 초기화합니다. (시뮬레이션 시작 시 호출)"""
+        for device in self.devices.values():
+            device.reset()
+
+    def set_strategy(self, strategy):
+        """
+        교착상태 처리 전략을 설정합니다.
+        :param strategy: 'prevention', 'avoidance', 'detection'
+        """
+        tracer = self.tracer or get_tracer()
+        if strategy not in DEADLOCK_STRATEGIES:
+            tracer.emit(WARN, None, 'unknown_strategy', "경고: 알 수 없는 교착상태 전략 '{strategy}'. 무시합니다.",
+                        strategy=strategy)
+            return
+        self.strategy = strategy
+        tracer.emit(INFO, None, 'deadlock_strategy', "[교착상태 전략] '{strategy}' 모드로 설정되었습니다.",
+                    strategy=strategy)
+
+    def set_protocol(self, protocol):
+        """
+        우선순위 역전 대응 프로토콜을 설정합니다.
+        :param protocol: 'none', 'inheritance', 'ceiling', 'srp'
+        """
+        tracer = self.tracer or get_tracer()
+        if protocol not in SYNC_PROTOCOLS:
+            tracer.emit(WARN, None, 'unknown_protocol', "경고: 알 수 없는 동기화 프로토콜 '{protocol}'. 무시합니다.",
+                        protocol=protocol)
+            return
+        self.protocol = protocol
+        tracer.emit(INFO, None, 'sync_protocol', "[동기화 프로토콜] '{protocol}' 모드로 설정되었습니다.",
+                    protocol=protocol)
+
+    def set_ceilings(self, ceilings):
+        """
+        자원별 천장을 설정합니다. (없는 자원은 천장 없음)
+        :param ceilings: {자원 이름: 선점 수준}
+        """
+        for resource in self.resources.values():
+            resource.ceiling = ceilings.get(resource.name, math.inf)
+
+
+# --- 기본 자원 관리자 (ResourceManager를 넘기지 않은 시뮬레이터가 사용) ---
+DEFAULT_RESOURCES = ResourceManager()
+RESOURCE_REGISTRY = DEFAULT_RESOURCES.resources  # (기존 이름 유지, 같은 딕셔너리)
+
+def get_resource_manager():
+    """
+    기본 ResourceManager를 반환합니다.
+    """
+    return DEFAULT_RESOURCES
 
 def initialize_resources(resource_names):
-    global RESOURCE_REGISTRY
-    global RESOURCE_ID_COUNTER # 
-    
-    RESOURCE_REGISTRY.clear()
-    RESOURCE_ID_COUNTER = 0      # 
-    
-    for name in resource_names:
-        # (Resource가 생성될 때마다 self.id가 0, 1, 2...로 자동 할당됨)
-        RESOURCE_REGISTRY[name] = Resource(name)
+    """
+    기본 ResourceManager에 자원을 등록합니다.
+
+    :param resource_names: 자원 이름 리스트 (각 1개, Mutex) 또는 {이름: 인스턴스 수} 딕셔너리
+    """
+    DEFAULT_RESOURCES.initialize(resource_names)
 
 def get_resource(name):
     """
     이름으로 등록된 자원(Mutex)을 가져옵니다.
     """
-    return RESOURCE_REGISTRY.get(name)
+    return DEFAULT_RESOURCES.get(name)
+
+def initialize_devices(devices):
+    """
+    기본 ResourceManager에 I/O 장치를 등록합니다.
+
+    :param devices: 장치 이름 리스트 (기본 설정) 또는 {이름: IODevice 인자 딕셔너리}
+    """
+    DEFAULT_RESOURCES.initialize_devices(devices)
+
+def get_device(name):
+    """
+    이름으로 등록된 I/O 장치를 가져옵니다.
+    """
+    return DEFAULT_RESOURCES.get_device(name)
+
+def get_banker():
+    """
+    기본 ResourceManager의 Banker를 반환합니다.
+    """
+    return DEFAULT_RESOURCES.banker
 
 def set_deadlock_strategy(strategy):
     """
-    교착상태 처리 전략을 설정합니다.
+    기본 ResourceManager의 교착상태 처리 전략을 설정합니다.
     :param strategy: 'prevention', 'avoidance', 'detection'
     """
-    global DEADLOCK_STRATEGY
-    DEADLOCK_STRATEGY = strategy
-    print(f"[교착상태 전략] '{strategy}' 모드로 설정되었습니다.")
+    DEFAULT_RESOURCES.set_strategy(strategy)
 
 def get_deadlock_strategy():
     """
     현재 교착상태 처리 전략을 반환합니다.
     """
-    return DEADLOCK_STRATEGY
+    return DEFAULT_RESOURCES.strategy
 
-def detect_deadlock(all_processes):
+def set_sync_protocol(protocol):
     """
-    교착상태 탐지 알고리즘 (순환 대기 검사)
-    :param all_processes: 모든 프로세스 리스트
-    :return: 교착상태에 있는 프로세스 리스트
+    기본 ResourceManager의 우선순위 역전 대응 프로토콜을 설정합니다.
+    :param protocol: 'none', 'inheritance', 'ceiling', 'srp'
     """
-    # 자원 할당 그래프 구축
-    waiting_for = {}  # {pid: resource_name}
-    holding = {}      # {pid: [resource_names]}
-    
-    for proc in all_processes:
-        if hasattr(proc, 'held_resources'):
-            holding[proc.pid] = [res.name for res in proc.held_resources]
-    
-    # 각 자원의 대기 큐 확인
-    for res_name, resource in RESOURCE_REGISTRY.items():
-        if resource.waiting_queue:
-            for proc in resource.waiting_queue:
-                waiting_for[proc.pid] = res_name
-    
-    # 순환 대기 검사
-    deadlocked = []
-    for pid, waiting_res in waiting_for.items():
-        visited = set()
-        current_pid = pid
-        
-        while current_pid not in visited:
-            visited.add(current_pid)
-            
-            # 현재 프로세스가 기다리는 자원
-            if current_pid not in waiting_for:
-                break
-            
-            waiting_res = waiting_for[current_pid]
-            resource = RESOURCE_REGISTRY.get(waiting_res)
-            
-            if not resource or not resource.is_locked:
-                break
-            
-            # 그 자원을 소유한 프로세스
-            owner_pid = resource.owner_pid
-            
-            if owner_pid == pid:
-                # 순환 발견!
-                deadlocked.extend(list(visited))
-                break
-            
-            current_pid = owner_pid
-    
-    return list(set(deadlocked))  # 중복 제거
-
-def check_safe_state(process, resource, all_processes):
-    """
-    Banker's Algorithm을 사용한 안전 상태 검사 (간단한 버전)
-    :param process: 자원을 요청하는 프로세스
-    :param resource: 요청하는 자원
-    :param all_processes: 모든 프로세스 리스트
-    :return: True (안전), False (불안전)
-    """
-    # 간단한 휴리스틱: 순환 대기 가능성 검사
-    if not resource.is_locked:
-        return True
-    
-    # 자원 소유자 확인
-    owner_pid = resource.owner_pid
-    
-    # 요청 프로세스가 이미 자원을 보유하고 있는지 확인
-    if hasattr(process, 'held_resources') and process.held_resources:
-        # 소유자가 요청자의 자원을 기다리고 있는지 확인
-        for held_res in process.held_resources:
-            if held_res.waiting_queue:
-                for waiting_proc in held_res.waiting_queue:
-                    if waiting_proc.pid == owner_pid:
-                        # 순환 대기 가능성 발견
-                        return False
-    
-    return True
\ No newline at end of file
+    DEFAULT_RESOURCES.set_protocol(protocol)
@@ -0,0 +1,22 @@
+"""
+테스트 공통 설정
+
+시뮬레이터 모듈은 저장소 루트에 평평하게 있으므로 루트를 import 경로에 추가하고,
+테스트 중에는 기본 Tracer를 꺼서 시뮬레이션 로그를 출력하지 않습니다.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tracer import set_tracer, get_tracer, NULL_TRACER  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def quiet_tracer():
+    console_tracer = get_tracer()
+    set_tracer(NULL_TRACER)
+    yield
+    set_tracer(console_tracer)
@@ -0,0 +1,144 @@
+"""
+동적 우선순위 Ready 큐 (simulator_priority_dynamic.AgingReadyQueue)
+
+Aging을 선택 시점에만 계산하는 AgingReadyQueue가
+매번 모든 프로세스의 우선순위를 다시 계산하고 훑는 단순한 방식과 같은 결정을 내리는지 확인합니다.
+"""
+import random
+
+import pytest
+
+from process import Process
+from simulator_base import command_priority, INF
+from simulator_priority_dynamic import AgingReadyQueue, SimulatorPriorityDynamic
+from workloads import NORMAL_SIMULATORS, SYNC_SCENARIOS, load_workload, random_workload, run_normal, snapshot
+
+
+class RescanPriorityDynamic(SimulatorPriorityDynamic):
+    """Ready 큐를 리스트로 두고 결정마다 모든 프로세스를 Aging한 뒤 min()으로 고르는 기준 구현"""
+    def __init__(self, process_list, aging_factor=10, **kwargs):
+        super().__init__(process_list, aging_factor, **kwargs)
+        self.ready_queue = []
+
+    def _age(self):
+        for proc in self.ready_queue:
+            waited = self.current_time - proc.last_ready_time
+            proc.dynamic_priority = proc.static_priority - waited // self.aging_factor
+
+    def _key(self, proc):
+        return (command_priority(proc), proc.dynamic_priority, proc.pid)
+
+    def enqueue(self, proc, reason):
+        proc.dynamic_priority = proc.static_priority
+        self.ready_queue.append(proc)
+
+    def clear_ready(self):
+        self.ready_queue = []
+
+    def pick(self):
+        if not self.ready_queue:
+            return None
+        self._age()
+        best = min(self.ready_queue, key=self._key)
+        self.ready_queue.remove(best)
+        return best
+
+    def should_preempt(self, running):
+        self._age()
+        return self._key(min(self.ready_queue, key=self._key)) < self._key(running)
+
+    def next_policy_event(self):
+        next_aging = INF
+        for proc in self.ready_queue:
+            waited = self.current_time - proc.last_ready_time
+            next_aging = min(next_aging, proc.last_ready_time + self.aging_factor * (waited // self.aging_factor + 1))
+        return next_aging
+
+
+def recording(cls):
+    """pick()과 should_preempt()의 결정을 (시각, 결과)로 기록하는 서브클래스"""
+    class Recording(cls):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.decisions = []
+
+        def pick(self):
+            proc = super().pick()
+            self.decisions.append((self.current_time, 'pick', proc and (proc.pid, proc.dynamic_priority)))
+            return proc
+
+        def should_preempt(self, running):
+            preempt = super().should_preempt(running)
+            self.decisions.append((self.current_time, 'preempt', running.pid, preempt))
+            return preempt
+    return Recording
+
+
+@pytest.fixture
+def rescan(monkeypatch):
+    """workloads의 'Priority(Aging)' 생성 함수를 기준 구현으로 바꿉니다."""
+    def use(cls):
+        monkeypatch.setitem(NORMAL_SIMULATORS, 'Priority(Aging)',
+                            lambda procs, **kw: cls(procs, aging_factor=10, **kw))
+    return use
+
+
+WORKLOADS = {
+    'random_input.txt': (lambda: load_workload('random_input.txt'), 'prevention'),
+    **{f"seed-{seed}": ((lambda seed=seed: random_workload(seed, 30)), 'prevention') for seed in range(5)},
+    **{scenario: ((lambda scenario=scenario: load_workload(scenario)), strategy)
+       for scenario, strategy in SYNC_SCENARIOS.items()},
+}
+
+
+@pytest.mark.parametrize('workload', WORKLOADS)
+def test_simulator_decisions_match_rescan(workload, rescan):
+    make, strategy = WORKLOADS[workload]
+    rescan(recording(SimulatorPriorityDynamic))
+    lazy = run_normal('Priority(Aging)', make(), strategy)
+    rescan(recording(RescanPriorityDynamic))
+    eager = run_normal('Priority(Aging)', make(), strategy)
+
+    assert lazy.decisions == eager.decisions
+    assert snapshot(lazy) == snapshot(eager)
+
+
+def naive_best(entries, now, factor):
+    """(명령 우선순위, 동적 우선순위, PID) 최솟값을 모든 항목을 훑어 구합니다."""
+    return min((cmd, proc.static_priority - (now - proc.last_ready_time) // factor, proc.pid)
+               for proc, cmd in entries)
+
+
+def naive_next_aging(entries, now, factor):
+    return min((proc.last_ready_time + factor * ((now - proc.last_ready_time) // factor + 1)
+                for proc, cmd in entries), default=INF)
+
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('factor', [1, 3, 10])
+def test_queue_operations_match_rescan(seed, factor):
+    rng = random.Random(seed)
+    queue = AgingReadyQueue(factor)
+    entries = []  # [(프로세스, 명령 우선순위)]
+    now = 0
+    next_pid = 1
+    for _ in range(400):
+        now += rng.choice([0, 0, 1, 2, 5])
+        if not entries or rng.random() < 0.55:
+            proc = Process(next_pid, now, rng.randint(1, 5), "CPU:1")
+            next_pid += 1
+            # 선점/외삽으로 과거 시각에 Ready 진입한 프로세스가 들어오는 경우도 포함
+            proc.last_ready_time = now - rng.choice([0, 0, 0, rng.randint(0, 3 * factor)])
+            cmd = rng.choice([0, 0, 0, 1])
+            queue.push(proc, cmd)
+            entries.append((proc, cmd))
+        else:
+            expected = naive_best(entries, now, factor)
+            assert queue.best(now)[0] == expected
+            proc = queue.pop(now)
+            assert (proc.pid, proc.dynamic_priority) == (expected[2], expected[1])
+            entries = [entry for entry in entries if entry[0] is not proc]
+
+        assert len(queue) == len(entries)
+        assert set(queue) == {proc for proc, cmd in entries}
+        assert queue.next_aging(now) == naive_next_aging(entries, now, factor)
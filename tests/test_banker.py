@@ -0,0 +1,141 @@
+"""
+다중 인스턴스 Banker's 알고리즘 (sync.Banker, sync.claims_from_bursts)
+
+교과서의 5개 프로세스 x 3종 자원(A=10, B=5, C=7) 예제로 안전/불안전 판정을 확인하고,
+LOCK/UNLOCK 버스트 프로그램에서 계산한 최대 요구량이 동시 보유 수를 따르는지 확인합니다.
+"""
+import numpy as np
+import pytest
+
+from process import Process
+from sync import ResourceManager, claims_from_bursts
+from tracer import NULL_TRACER
+
+RESOURCES = {'A': 10, 'B': 5, 'C': 7}
+
+# PID -> (보유, 최대 요구량)  (A, B, C 순)
+TEXTBOOK = {
+    0: ((0, 1, 0), (7, 5, 3)),
+    1: ((2, 0, 0), (3, 2, 2)),
+    2: ((3, 0, 2), (9, 0, 2)),
+    3: ((2, 1, 1), (2, 2, 2)),
+    4: ((0, 0, 2), (4, 3, 3)),
+}
+
+
+def textbook_state():
+    """예제 상태 (남은 인스턴스 A=3, B=3, C=2)를 만든 ResourceManager와 PID별 프로세스"""
+    manager = ResourceManager(RESOURCES, strategy='avoidance', tracer=NULL_TRACER)
+    processes = {}
+    for pid, (allocation, claim) in TEXTBOOK.items():
+        proc = Process(pid, 0, 1, "CPU:1", max_claim=tuple(zip(RESOURCES, claim)))
+        processes[pid] = proc
+        for res_id, count in enumerate(allocation):
+            if count:
+                manager.banker.allocate(proc, res_id, count)
+    return manager, processes
+
+
+def test_textbook_state_is_safe():
+    manager, _ = textbook_state()
+    banker = manager.banker
+    assert list(banker.available) == [3, 3, 2]
+    assert banker.is_safe()
+
+
+def test_safe_request_granted():
+    manager, processes = textbook_state()
+    banker = manager.banker
+    # P1이 (1, 0, 2)를 요청하면 안전 상태 유지 (P1 -> P3 -> ... 순서로 완료 가능)
+    for name in ('A', 'C', 'C'):
+        assert banker.is_safe_request(processes[1], manager.get(name))
+        banker.allocate(processes[1], manager.get(name).id, 1)
+    assert list(banker.available) == [2, 3, 0]
+    assert banker.is_safe()
+
+
+def test_unsafe_request_refused():
+    manager, processes = textbook_state()
+    banker = manager.banker
+    for name in ('A', 'C', 'C'):
+        banker.allocate(processes[1], manager.get(name).id, 1)
+
+    # 이어서 P0이 B를 2개 요청: 첫 번째는 안전, 두 번째는 누구도 완료할 수 없는 불안전 상태
+    b = manager.get('B')
+    assert banker.is_safe_request(processes[0], b)
+    banker.allocate(processes[0], b.id, 1)
+    allocation = banker.allocation.copy()
+    assert not banker.is_safe_request(processes[0], b)
+    # 검사는 상태를 바꾸지 않음
+    assert np.array_equal(banker.allocation, allocation)
+    assert list(banker.available) == [2, 2, 0]
+
+
+def test_request_without_free_instance_waits():
+    manager, processes = textbook_state()
+    banker = manager.banker
+    for name in ('A', 'C', 'C'):
+        banker.allocate(processes[1], manager.get(name).id, 1)
+    # C가 남아 있지 않으면 어차피 대기하므로 검사 없이 True
+    newcomer = Process(9, 0, 1, "CPU:1", max_claim=(('C', 7),))
+    assert banker.is_safe_request(newcomer, manager.get('C'))
+    assert newcomer not in banker.rows
+
+
+def test_rows_follow_holding_processes():
+    manager, processes = textbook_state()
+    banker = manager.banker
+    assert set(banker.rows) == set(processes.values())
+    # 모두 반납한 프로세스는 행에서 빠지고, 행은 다음 프로세스가 다시 씀
+    row = banker.rows[processes[4]]
+    banker.allocate(processes[4], manager.get('C').id, -2)
+    assert processes[4] not in banker.rows
+    newcomer = Process(9, 0, 1, "CPU:1", max_claim=(('A', 1),))
+    banker.allocate(newcomer, manager.get('A').id, 1)
+    assert banker.rows[newcomer] == row
+    assert list(banker.available) == [2, 3, 4]
+
+
+def test_rows_grow_past_initial_capacity():
+    manager = ResourceManager({'A': 64}, tracer=NULL_TRACER)
+    banker = manager.banker
+    processes = [Process(pid, 0, 1, "CPU:1", max_claim=(('A', 2),)) for pid in range(40)]
+    for proc in processes:
+        banker.allocate(proc, 0, 1)
+    assert len(banker.rows) == 40 and banker.available[0] == 24
+    assert banker.is_safe()
+
+
+@pytest.mark.parametrize('bursts, expected', [
+    ("CPU:2,LOCK:R1,CPU:2,LOCK:R2,CPU:5,UNLOCK:R2,UNLOCK:R1", {'R1': 1, 'R2': 1}),
+    # 계수 자원: 동시에 쥔 최대 개수
+    ("LOCK:Buffer,LOCK:Buffer,CPU:2,UNLOCK:Buffer,LOCK:Buffer,LOCK:Buffer,UNLOCK:Buffer,UNLOCK:Buffer,UNLOCK:Buffer",
+     {'Buffer': 3}),
+    ("LOCK:Buffer,UNLOCK:Buffer,LOCK:Buffer,UNLOCK:Buffer", {'Buffer': 1}),
+    # 쥐지 않은 자원의 UNLOCK은 무시
+    ("UNLOCK:R1,LOCK:R1,CPU:1", {'R1': 1}),
+    ("CPU:3,IO:2", {}),
+])
+def test_claims_from_bursts(bursts, expected):
+    assert claims_from_bursts(Process(1, 0, 1, bursts).burst_pattern) == expected
+
+
+def test_claim_vector_from_bursts_capped_at_instances():
+    manager = ResourceManager({'R1': 1, 'Buffer': 2}, tracer=NULL_TRACER)
+    proc = Process(1, 0, 1, "LOCK:Buffer,LOCK:Buffer,LOCK:Buffer,LOCK:R1,LOCK:Other")
+    assert list(manager.banker.claim_vector(proc)) == [1, 2]
+    # max_claim을 지정하면 버스트 프로그램 대신 사용
+    declared = Process(2, 0, 1, "LOCK:Buffer", max_claim=(('R1', 1), ('Buffer', 1)))
+    assert list(manager.banker.claim_vector(declared)) == [1, 1]
+
+
+def test_multi_instance_unsafe_when_claims_exceed_remaining():
+    manager = ResourceManager({'Buffer': 3}, tracer=NULL_TRACER)
+    banker = manager.banker
+    buffer = manager.get('Buffer')
+    p1 = Process(1, 0, 1, "LOCK:Buffer,LOCK:Buffer,LOCK:Buffer")
+    p2 = Process(2, 0, 1, "LOCK:Buffer,LOCK:Buffer,LOCK:Buffer")
+    banker.allocate(p1, buffer.id, 1)
+    # 1개 남기고 나누어 쥐면 (p1: 1, p2: 1) 남은 1개로 어느 쪽이든 완료할 수 없음
+    assert banker.is_safe_request(p1, buffer)
+    assert not banker.is_safe_request(p2, buffer)
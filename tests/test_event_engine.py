@@ -0,0 +1,63 @@
+"""
+이벤트 기반 시간 진행 (event_engine)
+
+조용한 틱을 건너뛰는 기본 모드와 매 틱을 하나씩 처리하는 틱 모드가
+같은 워크로드에서 같은 간트 차트, 완료 프로세스, 통계를 내는지 확인합니다.
+"""
+import pytest
+
+import simulator_base
+import smp
+from workloads import (NORMAL_SIMULATORS, REALTIME_SIMULATORS, SYNC_SCENARIOS, load_workload, random_workload,
+                       periodic_workload, run_normal, run_realtime, snapshot)
+
+
+@pytest.fixture
+def tick_mode(monkeypatch):
+    """시계를 항상 1틱씩만 진행하도록 바꿉니다. (건너뛰기 없음)"""
+    def advance_one_tick(sim, ready_empty, slice_left=None, horizon=None):
+        sim.current_time += 1
+        return None, 0
+
+    def advance_smp_one_tick(engine):
+        engine.sim.current_time += 1
+
+    def enable():
+        monkeypatch.setattr(simulator_base, 'advance_clock', advance_one_tick)
+        monkeypatch.setattr(smp.SMPEngine, '_advance_clock', advance_smp_one_tick)
+    return enable
+
+
+NORMAL_WORKLOADS = {
+    'random_input.txt': lambda: load_workload('random_input.txt'),
+    'seed-1': lambda: random_workload(1),
+    'seed-2': lambda: random_workload(2),
+}
+
+
+@pytest.mark.parametrize('workload', NORMAL_WORKLOADS)
+@pytest.mark.parametrize('name', NORMAL_SIMULATORS)
+@pytest.mark.parametrize('num_cpus', [1, 2])
+def test_normal_simulators_match_tick_mode(name, workload, num_cpus, tick_mode):
+    events = snapshot(run_normal(name, NORMAL_WORKLOADS[workload](), num_cpus=num_cpus))
+    tick_mode()
+    ticks = snapshot(run_normal(name, NORMAL_WORKLOADS[workload](), num_cpus=num_cpus))
+    assert events == ticks
+
+
+@pytest.mark.parametrize('scenario', SYNC_SCENARIOS)
+@pytest.mark.parametrize('name', NORMAL_SIMULATORS)
+def test_sync_scenarios_match_tick_mode(name, scenario, tick_mode):
+    strategy = SYNC_SCENARIOS[scenario]
+    events = snapshot(run_normal(name, load_workload(scenario), strategy))
+    tick_mode()
+    ticks = snapshot(run_normal(name, load_workload(scenario), strategy))
+    assert events == ticks
+
+
+@pytest.mark.parametrize('name', REALTIME_SIMULATORS)
+def test_realtime_simulators_match_tick_mode(name, tick_mode):
+    events = snapshot(run_realtime(name, periodic_workload(), max_simulation_time=200))
+    tick_mode()
+    ticks = snapshot(run_realtime(name, periodic_workload(), max_simulation_time=200))
+    assert events == ticks
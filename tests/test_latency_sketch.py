@@ -0,0 +1,110 @@
+"""
+작업별 지연 시간 분포 (latency_sketch.LatencySketch)
+
+분위수가 정확한 값에서 상대 오차 1/2^(b+1) 안에 있는지,
+나누어 기록한 스케치를 병합한 결과가 한 스케치에 모두 기록한 것과 같은지 확인합니다.
+"""
+import math
+import random
+
+import pytest
+
+from latency_sketch import LATENCY_METRICS, LatencySketch, merge_latencies
+from workloads import NORMAL_SIMULATORS, load_workload, run_normal
+
+QUANTILES = (0.0, 0.01, 0.25, 0.5, 0.9, 0.95, 0.99, 0.999, 1.0)
+
+
+def exact_quantile(values, q):
+    """LatencySketch.quantile과 같은 순위 규칙 (ceil(q * n)번째 값)"""
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+def latency_values(seed, n=5000):
+    """0 ~ 약 100만 ms에 걸친 로그 정규 분포 지연 시간"""
+    rng = random.Random(seed)
+    return [int(rng.lognormvariate(5, 2.5)) for _ in range(n)]
+
+
+def sketch_of(values, sub_bucket_bits=5):
+    sketch = LatencySketch(sub_bucket_bits)
+    for value in values:
+        sketch.record(value)
+    return sketch
+
+
+def test_small_values_exact():
+    values = list(range(64)) * 3
+    sketch = sketch_of(values)
+    for q in QUANTILES:
+        assert sketch.quantile(q) == exact_quantile(values, q)
+    assert sketch.mean == sum(values) / len(values)
+
+
+@pytest.mark.parametrize('sub_bucket_bits', [2, 5, 7])
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_quantile_relative_error_bound(seed, sub_bucket_bits):
+    values = latency_values(seed)
+    sketch = sketch_of(values, sub_bucket_bits)
+    bound = 1 / 2 ** (sub_bucket_bits + 1)
+    for q in QUANTILES:
+        exact = exact_quantile(values, q)
+        assert abs(sketch.quantile(q) - exact) <= bound * exact
+    assert (sketch.min, sketch.max, len(sketch)) == (min(values), max(values), len(values))
+    assert sketch.mean == pytest.approx(sum(values) / len(values))
+
+
+def test_bucket_count_independent_of_samples():
+    small = sketch_of(latency_values(1, n=2000))
+    large = sketch_of(latency_values(1, n=50000))
+    # 버킷 수는 값의 범위(2배 구간 수 x 2^b)로 제한됨
+    assert len(large.counts) <= (large.max.bit_length() + 1) * 2 ** 5
+    assert len(large.counts) < 2 * len(small.counts)
+
+
+@pytest.mark.parametrize('parts', [2, 7, 50])
+def test_merge_equals_single_sketch(parts):
+    values = latency_values(4)
+    rng = random.Random(parts)
+    pieces = [[] for _ in range(parts)]
+    for value in values:
+        pieces[rng.randrange(parts)].append(value)
+
+    merged = LatencySketch()
+    for piece in pieces:
+        merged.merge(sketch_of(piece))
+    single = sketch_of(values)
+    assert merged == single
+    assert merged.percentiles((50, 95, 99, 99.9)) == single.percentiles((50, 95, 99, 99.9))
+
+
+def test_merge_empty_and_into_empty():
+    sketch = sketch_of([5, 70, 900])
+    assert sketch.merge(LatencySketch()) == sketch_of([5, 70, 900])
+    assert LatencySketch().merge(sketch) == sketch
+    assert LatencySketch().quantile(0.99) == 0
+
+
+def test_merge_different_bucket_layout_stays_within_bound():
+    values = latency_values(5)
+    coarse = sketch_of(values, sub_bucket_bits=3)
+    fine = LatencySketch(5).merge(coarse)
+    assert len(fine) == len(values)
+    for q in QUANTILES[1:-1]:
+        exact = exact_quantile(values, q)
+        # 거친 버킷 중앙값으로 다시 기록하므로 두 구성의 오차 한계를 합친 범위 안
+        assert abs(fine.quantile(q) - exact) <= (1 / 2 ** 4 + 1 / 2 ** 6) * exact + 1
+
+
+def test_simulator_latencies_match_completed_processes():
+    workload = load_workload('random_input.txt')
+    total, turnaround = {}, []
+    for name in NORMAL_SIMULATORS:
+        sim = run_normal(name, workload)
+        assert set(sim.latencies) == set(LATENCY_METRICS)
+        assert sim.latencies['waiting'] == sketch_of([p.wait_time for p in sim.completed_processes])
+        turnaround += [p.turnaround_time for p in sim.completed_processes]
+        merge_latencies(total, sim.latencies)
+    # 알고리즘별 스케치를 병합한 결과 = 모든 작업을 한 스케치에 기록한 결과
+    assert total['turnaround'] == sketch_of(turnaround)
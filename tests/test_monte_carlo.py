@@ -0,0 +1,100 @@
+"""
+반복 실행 러너 (monte_carlo)
+
+회차마다 돌려받은 SimulationRecord가 시뮬레이터 결과와 같은지,
+RepresentativeCandidates가 ResultsCube와 같은 대표 회차를 고르고 그 회차의 기록을 그대로 내주는지,
+회차 수를 정하지 않은 실행이 같은 시드의 정해진 회차와 같은 순서로 결과를 내는지,
+장치 I/O 워크로드가 작업자 프로세스에서도 등록된 장치로 실행되는지 확인합니다.
+"""
+import numpy as np
+import pytest
+
+from monte_carlo import (NORMAL_ALGORITHMS, REALTIME_ALGORITHMS, RepresentativeCandidates, iteration_seed,
+                         precise_enough, record_simulation, run_iteration, run_iterations)
+from results_cube import ResultsCube, WelfordAccumulator
+from sync import initialize_devices
+from workloads import NORMAL_SIMULATORS, load_workload, run_normal
+
+BASE_SEED = 12345
+
+
+def same_records(a, b):
+    """알고리즘별 SimulationRecord 딕셔너리 비교 (간트 차트는 배열)"""
+    assert a.keys() == b.keys()
+    for alg in a:
+        assert np.array_equal(a[alg].gantt_chart, b[alg].gantt_chart)
+        assert a[alg]._replace(gantt_chart=None) == b[alg]._replace(gantt_chart=None)
+    return True
+
+
+def test_record_matches_simulator():
+    for name in NORMAL_SIMULATORS:
+        sim = run_normal(name, load_workload('random_input.txt'))
+        record = record_simulation(sim)
+        assert record.gantt_chart.dtype == np.int32
+        assert [tuple(row) for row in record.gantt_chart.tolist()] == [tuple(s) for s in sim.gantt_chart]
+        assert [p.pid for p in record.completed_processes] == [p.pid for p in sim.completed_processes]
+        for summary, proc in zip(record.completed_processes, sim.completed_processes):
+            assert summary.turnaround_time == proc.turnaround_time
+            assert summary.wait_time == proc.wait_time
+            assert list(summary.timeline) == proc.timeline
+        assert (record.context_switches, record.total_overhead_time, record.current_time) == \
+            (sim.context_switches, sim.total_overhead_time, sim.current_time)
+
+
+def test_representative_uses_kept_records():
+    num_iterations = 8
+    cube = ResultsCube(num_iterations, NORMAL_ALGORITHMS + REALTIME_ALGORITHMS)
+    candidates = RepresentativeCandidates('FCFS', 'avg_turnaround')
+    results = run_iterations(num_iterations, BASE_SEED, workers=1, keep_records=True)
+    for iteration, (comparison_results, realtime_results, records) in enumerate(results):
+        cube.add(comparison_results, realtime_results)
+        candidates.offer(iteration, comparison_results, records)
+
+    mean = cube.summary(['FCFS'])['FCFS']['mean']['avg_turnaround']
+    index, records = candidates.representative(mean)
+    assert index == cube.representative('FCFS', 'avg_turnaround')
+    # 같은 시드로 다시 실행한 결과와 같은 기록 (다시 실행하지 않고 보관한 것)
+    assert same_records(records, run_iteration(iteration_seed(BASE_SEED, index), keep_records=True)[2])
+
+
+def test_candidates_keep_values_near_running_mean():
+    candidates = RepresentativeCandidates('FCFS', 'avg_turnaround', capacity=3)
+    for iteration, value in enumerate([10, 50, 11, 9, 100, 12]):
+        candidates.offer(iteration, {'FCFS': {'avg_turnaround': value}}, {'value': value})
+    assert len(candidates) == 3
+    assert 4 not in [c[0] for c in candidates.candidates]  # 평균에서 가장 먼 값은 버려짐
+    assert candidates.representative(12) == (5, {'value': 12})
+    assert candidates.representative(10.4) == (0, {'value': 10})
+    assert RepresentativeCandidates().representative() == (0, {})
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_unbounded_iterations_match_fixed_count(workers):
+    unbounded = run_iterations(None, BASE_SEED, workers=workers)
+    streamed = [results for results, _ in zip(unbounded, range(40))]
+    unbounded.close()
+    fixed = list(run_iterations(40, BASE_SEED, workers=1))
+    assert [r[0]['FCFS']['avg_turnaround'] for r in streamed] == [r[0]['FCFS']['avg_turnaround'] for r in fixed]
+
+
+def test_precise_enough_stops_on_narrow_interval():
+    welford = WelfordAccumulator(NORMAL_ALGORITHMS + REALTIME_ALGORITHMS)
+    for value in (100, 101):
+        welford.add({alg: {'avg_turnaround': value} for alg in NORMAL_ALGORITHMS})
+    assert not precise_enough(welford, relative_ci=0.001)
+    for _ in range(200):
+        welford.add({alg: {'avg_turnaround': 100.5} for alg in NORMAL_ALGORITHMS})
+    assert precise_enough(welford, relative_ci=0.001)
+
+
+def test_device_io_iterations_register_devices_in_workers():
+    devices = {'disk0': {'channels': 1, 'policy': 'sstf'}}
+    try:
+        # 작업자 프로세스를 먼저 실행 (현재 프로세스에 등록된 장치를 물려받지 않도록)
+        parallel = list(run_iterations(6, BASE_SEED, workers=2, io_device='disk0', devices=devices))
+        initialize_devices(devices)
+        expected = [run_iteration(iteration_seed(BASE_SEED, i), io_device='disk0') for i in range(6)]
+    finally:
+        initialize_devices({})
+    assert [r[0]['FCFS']['avg_waiting'] for r in parallel] == [r[0]['FCFS']['avg_waiting'] for r in expected]
@@ -0,0 +1,86 @@
+"""
+RM/EDF 정상 상태 외삽 (RealtimeSimulatorBase)
+
+기본 생성자(max_simulation_time 생략)에서도 외삽이 일어나고,
+외삽한 결과가 같은 구간을 끝까지 시뮬레이션한 결과와 같은지 확인합니다.
+"""
+import pytest
+
+from process import Process
+from simulator_base import AUTO_HORIZON_LIMIT
+from simulator_rm import SimulatorRM
+from simulator_edf import SimulatorEDF
+from sync import ResourceManager
+from tracer import Tracer, RingBufferSink, NULL_TRACER, WARN
+
+
+def periodic_processes():
+    # 주기 4, 6, 10 -> 하이퍼피리어드 60, 최대 오프셋 2, 이용률 약 0.88
+    return [
+        Process(1, 0, 0, "CPU:1", 4, 4),
+        Process(2, 1, 0, "CPU:2", 6, 6),
+        Process(3, 2, 0, "CPU:3", 10, 10),
+    ]
+
+
+def harmonic_processes():
+    # 주기 5, 10, 20 -> 하이퍼피리어드 20 (문맥 교환 오버헤드를 넣어도 마감시한을 지킴)
+    return [
+        Process(1, 0, 0, "CPU:1", 5, 5),
+        Process(2, 1, 0, "CPU:2", 10, 10),
+        Process(3, 2, 0, "CPU:3", 20, 20),
+    ]
+
+
+def full_length(cls):
+    """외삽을 끈 시뮬레이터 (같은 구간을 끝까지 시뮬레이션)"""
+    return type(f"Full{cls.__name__}", (cls,), {'_can_skip_after': lambda self, boundary: False})
+
+
+def run(cls, workload, **kwargs):
+    sim = cls(workload(), tracer=NULL_TRACER, resources=ResourceManager(tracer=NULL_TRACER), **kwargs)
+    sim.run()
+    return sim
+
+
+@pytest.mark.parametrize('cls', [SimulatorRM, SimulatorEDF])
+@pytest.mark.parametrize('workload, overhead', [
+    (periodic_processes, 0),
+    (harmonic_processes, 0),
+    (harmonic_processes, 1),
+])
+def test_default_horizon_extrapolates_and_matches_full_run(cls, workload, overhead):
+    sim = run(cls, workload, context_switch_overhead=overhead)
+    full = run(full_length(cls), workload, context_switch_overhead=overhead)
+
+    assert sim.max_simulation_time == sim.max_offset + 3 * sim.hyperperiod
+    assert sim.steady_state is not None, "기본 구간에서 외삽이 일어나지 않음"
+    assert full.steady_state is None
+    assert sim.stats() == full.stats()
+    assert sim.current_time == full.current_time
+    assert sim.deadline_misses == full.deadline_misses
+    assert sim.total_overhead_time == full.total_overhead_time
+    assert len(sim.completed_processes) + sim.skipped_jobs == len(full.completed_processes)
+
+
+def test_truncated_default_horizon_is_reported():
+    # 서로소 주기 -> 하이퍼피리어드 11339ms, 자동 구간이 상한을 넘음
+    procs = [Process(1, 0, 0, "CPU:1", 17, 17), Process(2, 0, 0, "CPU:1", 23, 23), Process(3, 0, 0, "CPU:1", 29, 29)]
+    sink = RingBufferSink()
+    sim = SimulatorRM(procs, tracer=Tracer(sink), resources=ResourceManager(tracer=NULL_TRACER))
+
+    assert sim.max_simulation_time == AUTO_HORIZON_LIMIT
+    truncated = [(level, fields) for time, level, event, message, fields in sink.records
+                 if event == 'horizon_truncated']
+    assert len(truncated) == 1
+    level, fields = truncated[0]
+    assert level == WARN
+    assert fields['horizon'] == 3 * 17 * 23 * 29
+
+
+def test_explicit_horizon_is_not_truncated():
+    sink = RingBufferSink()
+    sim = SimulatorRM(periodic_processes(), max_simulation_time=5000, tracer=Tracer(sink))
+
+    assert sim.max_simulation_time == 5000
+    assert not any(event == 'horizon_truncated' for time, level, event, message, fields in sink.records)
@@ -0,0 +1,97 @@
+"""
+반복 실행 결과 집계 (results_cube)
+
+회차 값을 보관하지 않는 WelfordAccumulator가 모든 회차를 담은 ResultsCube와 같은 개수/합계/평균/표준편차/신뢰구간을 내는지,
+나누어 누적한 뒤 merge()한 결과가 한 번에 누적한 결과와 같은지 확인합니다.
+"""
+import random
+import statistics
+
+import numpy as np
+import pytest
+
+from results_cube import ResultsCube, WelfordAccumulator, _z_value
+
+ALGORITHMS = ('FCFS', 'RR(Q=4)', 'RM')
+METRICS = ('avg_turnaround', 'context_switches', 'deadline_misses')
+
+
+def random_results(rng):
+    """회차 하나의 결과 딕셔너리들 (RM은 가끔 없고, deadline_misses는 RM에만 있음)"""
+    normal = {alg: {'avg_turnaround': rng.uniform(50, 150), 'context_switches': rng.randint(5, 40)}
+              for alg in ('FCFS', 'RR(Q=4)')}
+    realtime = {}
+    if rng.random() < 0.7:
+        realtime['RM'] = {'avg_turnaround': rng.uniform(5, 20), 'context_switches': rng.randint(50, 200),
+                          'deadline_misses': rng.randint(0, 5)}
+    return normal, realtime
+
+
+def assert_same_moments(a, b):
+    for x, y in zip(a.moments(), b.moments()):
+        np.testing.assert_allclose(x, y, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(a.confidence_interval(), b.confidence_interval(), rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_welford_matches_cube(seed):
+    rng = random.Random(seed)
+    iterations = [random_results(rng) for _ in range(rng.randint(1, 60))]
+    cube = ResultsCube(len(iterations), ALGORITHMS, METRICS)
+    welford = WelfordAccumulator(ALGORITHMS, METRICS)
+    for results in iterations:
+        cube.add(*results)
+        welford.add(*results)
+    assert len(welford) == len(cube) == len(iterations)
+    assert_same_moments(welford, cube)
+    assert welford.summary().keys() == cube.summary().keys()
+
+    fcfs = [normal['FCFS']['avg_turnaround'] for normal, _ in iterations]
+    assert welford.summary(['FCFS'])['FCFS']['mean']['avg_turnaround'] == pytest.approx(statistics.mean(fcfs))
+    expected_std = statistics.stdev(fcfs) if len(fcfs) > 1 else 0
+    assert welford.summary(['FCFS'])['FCFS']['std']['avg_turnaround'] == pytest.approx(expected_std)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_merge_matches_single_accumulator(seed):
+    rng = random.Random(seed)
+    iterations = [random_results(rng) for _ in range(50)]
+    single = WelfordAccumulator(ALGORITHMS, METRICS)
+    parts = [WelfordAccumulator(ALGORITHMS, METRICS) for _ in range(3)]
+    for results in iterations:
+        single.add(*results)
+        rng.choice(parts).add(*results)
+    merged = WelfordAccumulator(ALGORITHMS, METRICS)
+    for part in parts:
+        merged.merge(part)
+    assert_same_moments(merged, single)
+
+    cube = ResultsCube(len(iterations), ALGORITHMS, METRICS)
+    for results in iterations:
+        cube.add(*results)
+    assert_same_moments(cube.accumulator(), single)
+
+
+def test_cube_does_not_grow():
+    cube = ResultsCube(2, ALGORITHMS, METRICS)
+    rng = random.Random(0)
+    cube.add(*random_results(rng))
+    cube.add(*random_results(rng))
+    with pytest.raises(IndexError):
+        cube.add(*random_results(rng))
+    assert cube.data.shape == (2, len(ALGORITHMS), len(METRICS))
+
+
+def test_welford_memory_is_fixed():
+    welford = WelfordAccumulator(ALGORITHMS, METRICS)
+    rng = random.Random(0)
+    for _ in range(1000):
+        welford.add(*random_results(rng))
+    assert len(welford) == 1000
+    for array in (welford.n, welford.sum, welford._mean, welford.m2):
+        assert array.shape == (len(ALGORITHMS), len(METRICS))
+
+
+@pytest.mark.parametrize('level, z', [(0.90, 1.6448536269514722), (0.95, 1.959963984540054), (0.99, 2.5758293035489004)])
+def test_z_value(level, z):
+    assert _z_value(level) == pytest.approx(z, abs=1e-12)
@@ -0,0 +1,131 @@
+"""
+스케줄러 결과 회귀 테스트
+
+공통 엔진으로 옮긴 뒤의 스케줄링 결과를 고정합니다. README의
+"공통 엔진 도입으로 바뀐 결과" 표에 적힌 의도된 변경 외에는 값이 바뀌면 안 되며,
+결과를 바꾸는 변경은 이 기대값과 README 표를 함께 갱신해야 합니다.
+
+각 항목은 (종료 시각, 문맥 교환 횟수, 오버헤드 합, 완료 프로세스 수,
+반환 시간 합, 대기 시간 합, Ready 대기 합, I/O 대기 합, 간트 차트 요약) 순서입니다.
+간트 차트 요약은 간트 차트 repr의 SHA-1 앞 12자리입니다.
+"""
+import hashlib
+
+import pytest
+
+from workloads import (NORMAL_SIMULATORS, REALTIME_SIMULATORS, SYNC_SCENARIOS, load_workload, random_workload,
+                       periodic_workload, run_normal, run_realtime)
+
+FIELDS = ('end', 'context_switches', 'overhead', 'completed', 'turnaround', 'wait', 'ready_wait', 'io_wait', 'gantt')
+
+NORMAL_WORKLOADS = {
+    'random_input.txt': lambda: load_workload('random_input.txt'),
+    'seed-7': lambda: random_workload(7, 30),
+}
+
+EXPECTED_NORMAL = {
+    'random_input.txt': {
+        'FCFS': (267, 24, 24, 10, 1492, 900, 900, 398, '223e4eba4fcc'),
+        'RR(Q=4)': (281, 51, 51, 10, 2049, 1430, 1430, 398, 'f9ffc746a2c0'),
+        'SJF': (222, 32, 32, 10, 1540, 940, 940, 398, '2e36ae9dd811'),
+        'Priority(Static)': (320, 34, 34, 10, 1395, 793, 793, 398, 'a51247c472af'),
+        'Priority(Aging)': (281, 47, 47, 10, 1722, 1107, 1107, 398, '077468b5950e'),
+        'MLFQ': (256, 55, 55, 10, 1952, 1329, 1329, 398, '87ecac0fbc56'),
+    },
+    'seed-7': {
+        'FCFS': (1120, 71, 71, 30, 16765, 15366, 15366, 323, '0a9da8bc76ea'),
+        'RR(Q=4)': (1325, 276, 276, 30, 22262, 20658, 20658, 323, '91e69f41c70d'),
+        'SJF': (1136, 80, 80, 30, 13863, 12455, 12455, 323, '7d1638f347e9'),
+        'Priority(Static)': (1145, 96, 96, 30, 17125, 15701, 15701, 323, '3b81d542052e'),
+        'Priority(Aging)': (1206, 152, 152, 30, 19771, 18291, 18291, 323, '4645412d6061'),
+        'MLFQ': (1226, 170, 170, 30, 20014, 18516, 18516, 323, '1e2c1d8df2bc'),
+    },
+}
+
+EXPECTED_SYNC = {
+    'producer_consumer.txt': {
+        'FCFS': (26, 2, 2, 3, 50, 26, 26, 0, 'bcc457ed03f9'),
+        'RR(Q=4)': (28, 4, 4, 3, 54, 20, 20, 9, '592f791af084'),
+        'SJF': (29, 5, 5, 3, 58, 16, 16, 17, '2b9d6b6e04e1'),
+        'Priority(Static)': (29, 5, 5, 3, 58, 16, 16, 17, '2b9d6b6e04e1'),
+        'Priority(Aging)': (29, 5, 5, 3, 58, 16, 16, 17, '2b9d6b6e04e1'),
+        'MLFQ': (28, 4, 4, 3, 59, 31, 31, 4, 'c4f30eaa26d8'),
+    },
+    'deadlock_prevention.txt': {
+        'FCFS': (20, 1, 1, 2, 30, 12, 12, 0, 'f6ab3c960e20'),
+        'RR(Q=4)': (22, 3, 3, 2, 37, 12, 12, 6, 'c66ffa8b67b1'),
+        'SJF': (22, 3, 3, 2, 37, 14, 14, 7, '74076d87455a'),
+        'Priority(Static)': (21, 2, 2, 2, 26, 11, 11, 0, 'f52db3ea48b6'),
+        'Priority(Aging)': (21, 2, 2, 2, 26, 11, 11, 0, 'f52db3ea48b6'),
+        'MLFQ': (27, 8, 8, 2, 43, 20, 20, 2, '1fd39c558852'),
+    },
+    'deadlock_avoidance.txt': {
+        'FCFS': (27, 1, 1, 2, 37, 12, 12, 0, '91e985b86461'),
+        'RR(Q=4)': (29, 3, 3, 2, 44, 11, 11, 7, '7c68bbd526af'),
+        'SJF': (29, 3, 3, 2, 44, 15, 15, 8, '2146825a287b'),
+        'Priority(Static)': (28, 2, 2, 2, 40, 20, 20, 0, '3442ca280c6f'),
+        'Priority(Aging)': (28, 2, 2, 2, 40, 20, 20, 0, '3442ca280c6f'),
+        'MLFQ': (31, 5, 5, 2, 48, 14, 14, 11, 'b8dfb2e7c681'),
+    },
+    'deadlock_detection.txt': {
+        'FCFS': (35, 2, 2, 3, 66, 34, 34, 0, 'edff6ddef691'),
+        'RR(Q=4)': (39, 6, 6, 3, 84, 29, 29, 22, 'cdbe778dafb0'),
+        'SJF': (39, 6, 6, 3, 84, 31, 31, 24, '8a9261e1b6bb'),
+        'Priority(Static)': (36, 3, 3, 3, 65, 39, 39, 0, '42378d74817f'),
+        'Priority(Aging)': (38, 5, 5, 3, 71, 39, 39, 4, '5996af1e2af9'),
+        'MLFQ': (36, 10, 10, 3, 80, 43, 43, 9, '773400cf208c'),
+    },
+    'deadlock_recovery.txt': {
+        'FCFS': (35, 2, 2, 3, 66, 34, 34, 0, 'edff6ddef691'),
+        'RR(Q=4)': (39, 6, 6, 3, 84, 29, 29, 22, 'cdbe778dafb0'),
+        'SJF': (39, 6, 6, 3, 84, 31, 31, 24, '8a9261e1b6bb'),
+        'Priority(Static)': (36, 3, 3, 3, 65, 39, 39, 0, '42378d74817f'),
+        'Priority(Aging)': (38, 5, 5, 3, 71, 39, 39, 4, '5996af1e2af9'),
+        'MLFQ': (36, 10, 10, 3, 80, 43, 43, 9, '773400cf208c'),
+    },
+}
+
+# (오버헤드, 기대값, 마감시한 초과 수) - 수평선 200
+EXPECTED_REALTIME = {
+    'RM': [
+        (0, (201, 96, 0, 42, 105, 33, 33, 0, 'ccd5723c8d29'), 0),
+        (1, (279, 101, 101, 104, 4254, 310, 310, 0, 'beb4de13c667'), 53),
+    ],
+    'EDF': [
+        (0, (201, 96, 0, 42, 104, 32, 32, 0, 'd10f16b4e4af'), 0),
+        (1, (272, 94, 94, 104, 3961, 520, 520, 0, '1bf46da3d7bf'), 99),
+    ],
+}
+
+
+def summarize(sim):
+    """시뮬레이터 결과를 FIELDS 순서의 딕셔너리로 요약합니다."""
+    completed = sim.completed_processes
+    values = (sim.current_time, sim.context_switches, sim.total_overhead_time, len(completed),
+              sum(p.turnaround_time for p in completed), sum(p.wait_time for p in completed),
+              sum(p.ready_wait_time for p in completed), sum(p.io_wait_time for p in completed),
+              hashlib.sha1(repr(list(sim.gantt_chart)).encode()).hexdigest()[:12])
+    return dict(zip(FIELDS, values))
+
+
+@pytest.mark.parametrize('workload', NORMAL_WORKLOADS)
+@pytest.mark.parametrize('name', NORMAL_SIMULATORS)
+def test_normal_simulators_pinned(name, workload):
+    sim = run_normal(name, NORMAL_WORKLOADS[workload]())
+    assert summarize(sim) == dict(zip(FIELDS, EXPECTED_NORMAL[workload][name]))
+
+
+@pytest.mark.parametrize('scenario', SYNC_SCENARIOS)
+@pytest.mark.parametrize('name', NORMAL_SIMULATORS)
+def test_sync_scenarios_pinned(name, scenario):
+    sim = run_normal(name, load_workload(scenario), SYNC_SCENARIOS[scenario])
+    assert summarize(sim) == dict(zip(FIELDS, EXPECTED_SYNC[scenario][name]))
+
+
+@pytest.mark.parametrize('name', REALTIME_SIMULATORS)
+def test_realtime_simulators_pinned(name):
+    for overhead, expected, misses in EXPECTED_REALTIME[name]:
+        sim = run_realtime(name, periodic_workload(), max_simulation_time=200,
+                           context_switch_overhead=overhead)
+        assert summarize(sim) == dict(zip(FIELDS, expected))
+        assert sim.deadline_misses == misses
@@ -0,0 +1,43 @@
+"""
+우선순위 역전 대응 프로토콜 (sync.SYNC_PROTOCOLS)
+
+producer_consumer.txt는 낮은 우선순위 P1이 R1을 쥔 사이 높은 우선순위 P2가 R1을 요청하고,
+중간 우선순위 P3가 P1을 밀어내는 우선순위 역전 시나리오입니다.
+정적 우선순위(PriorityHeapPolicy)에서 프로토콜마다 P2의 블로킹 시간이 줄어드는지 확인합니다.
+"""
+import pytest
+
+from simulator_priority_static import SimulatorPriorityStatic
+from sync import ResourceManager, SYNC_PROTOCOLS
+from tracer import NULL_TRACER
+from workloads import SYNC_RESOURCES, load_workload
+
+# 프로토콜 -> ({PID: (작업 수, 블로킹 합계, 작업당 최대)}, 종료 시각)
+EXPECTED = {
+    'none': ({1: (1, 0, 0), 2: (1, 17, 17), 3: (1, 0, 0)}, 29),
+    'inheritance': ({1: (1, 0, 0), 2: (1, 12, 12), 3: (1, 11, 11)}, 29),
+    'ceiling': ({1: (1, 0, 0), 2: (1, 9, 9), 3: (1, 10, 10)}, 26),
+    'srp': ({1: (1, 0, 0), 2: (1, 9, 9), 3: (1, 10, 10)}, 26),
+}
+
+
+def run_protocol(protocol):
+    resources = ResourceManager(SYNC_RESOURCES, protocol=protocol, tracer=NULL_TRACER)
+    sim = SimulatorPriorityStatic(load_workload('producer_consumer.txt').instantiate(realtime=False),
+                                  tracer=NULL_TRACER, resources=resources)
+    sim.run()
+    return sim
+
+
+@pytest.mark.parametrize('protocol', SYNC_PROTOCOLS)
+def test_blocking_times_pinned(protocol):
+    sim = run_protocol(protocol)
+    blocking, end = EXPECTED[protocol]
+    assert sim.blocking_times() == blocking
+    assert sim.current_time == end
+
+
+def test_protocols_reduce_high_priority_blocking():
+    p2 = {protocol: run_protocol(protocol).blocking_times()[2][1] for protocol in SYNC_PROTOCOLS}
+    assert p2['none'] > p2['inheritance'] > p2['ceiling']
+    assert p2['srp'] == p2['ceiling']
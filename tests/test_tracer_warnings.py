@@ -0,0 +1,46 @@
+"""
+경고 출력 경로
+
+설정/입력 경고가 print가 아니라 시뮬레이터의 Tracer로 나가는지 확인합니다.
+(NULL_TRACER로 실행하는 벤치마크/반복 실행 작업자에서는 아무것도 출력되지 않아야 함)
+"""
+from simulator_fcfs import SimulatorFCFS
+from sync import ResourceManager
+from tracer import Tracer, RingBufferSink, NULL_TRACER, WARN
+from workloads import SYNC_RESOURCES, load_workload
+
+
+def events(sink, level=WARN):
+    return [(event, fields) for time, lvl, event, message, fields in sink.records if lvl == level]
+
+
+def test_unknown_smp_queue_mode_warns_through_tracer(capsys):
+    sink = RingBufferSink()
+    tracer = Tracer(sink)
+    sim = SimulatorFCFS(load_workload('random_input.txt').instantiate(realtime=False), tracer=tracer,
+                        resources=ResourceManager(SYNC_RESOURCES, tracer=NULL_TRACER), num_cpus=2,
+                        smp_queues='bogus')
+    sim.run()
+    assert sim.smp.queues == 'global'
+    assert ('unknown_smp_queues', {'queues': 'bogus'}) in events(sink)
+    assert "bogus" not in capsys.readouterr().out
+
+
+def unsorted_stream():
+    """도착 시각 역순으로 흘려보내는 스트림 (정렬되지 않은 입력)"""
+    processes = load_workload('random_input.txt').instantiate(realtime=False)
+    return iter(sorted(processes, key=lambda p: p.arrival_time, reverse=True))
+
+
+def test_unsorted_stream_warns_through_tracer(capsys):
+    sink = RingBufferSink()
+    sim = SimulatorFCFS(unsorted_stream(), tracer=Tracer(sink))
+    sim.run()
+    warnings = events(sink)
+    assert len(warnings) == 1 and warnings[0][0] == 'unsorted_arrivals'
+    assert "정렬" not in capsys.readouterr().out
+
+
+def test_unsorted_stream_silent_under_null_tracer(capsys):
+    SimulatorFCFS(unsorted_stream(), tracer=NULL_TRACER).run()
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,132 @@
+"""
+바이너리 열 형식 워크로드 (workload_binary)
+
+텍스트 입력 -> 바이너리(.npz 파일 / 메모리 매핑 .npy 디렉터리) -> 텍스트로 돌아오는 동안
+버스트 프로그램, 장치 I/O(io_device/io_track), 최대 요구량(claims)이 그대로 유지되는지 확인합니다.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from process import Workload, parse_input_file
+from simulator_fcfs import SimulatorFCFS
+from sync import ResourceManager
+from tracer import NULL_TRACER
+from workload_binary import binary_to_text, load_workload, save_workload, text_to_binary
+from workloads import REPO_DIR, SYNC_RESOURCES, SYNC_SCENARIOS, run_normal, snapshot
+
+# 장치 I/O(트랙 지정/미지정)와 최대 요구량 열이 모두 있는 입력
+DEVICE_INPUT = """\
+# 형식: PID,생성시간,우선순위,실행패턴,[주기,마감시한]
+1,0,2,"CPU:3,IO:disk0:10:57,CPU:2,LOCK:Buffer,LOCK:Buffer,UNLOCK:Buffer,UNLOCK:Buffer",0,0,"Buffer:2"
+2,4,1,"CPU:1,IO:7,CPU:1,IO:disk1:5,CPU:4",0,0
+3,1,3,"LOCK:R1,CPU:2,IO:disk0:3:0,UNLOCK:R1",0,0,"R1:1,Buffer:1"
+"""
+
+LAYOUTS = ['file.npz', 'columns']
+
+
+def text_workload(filename):
+    return Workload.from_processes(parse_input_file(filename))
+
+
+@pytest.fixture
+def device_input(tmp_path):
+    path = tmp_path / 'device_input.txt'
+    path.write_text(DEVICE_INPUT, encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('layout', LAYOUTS)
+@pytest.mark.parametrize('filename', ['random_input.txt'] + list(SYNC_SCENARIOS))
+def test_repo_inputs_round_trip(tmp_path, filename, layout):
+    text = os.path.join(REPO_DIR, filename)
+    path = str(tmp_path / layout)
+    assert text_to_binary(text, path) == len(text_workload(text))
+
+    workload = load_workload(path)
+    assert workload.to_workload() == text_workload(text)
+    # 장치 I/O와 최대 요구량이 없는 입력은 선택 열을 저장하지 않음
+    assert workload.io_device is None and workload.io_track is None and workload.claims is None
+
+    back = str(tmp_path / 'back.txt')
+    assert binary_to_text(path, back) == len(workload)
+    assert text_workload(back) == text_workload(text)
+
+
+@pytest.mark.parametrize('layout', LAYOUTS)
+def test_device_io_and_claims_round_trip(tmp_path, device_input, layout):
+    path = str(tmp_path / layout)
+    save_workload(parse_input_file(device_input), path)
+
+    workload = load_workload(path)
+    assert workload.to_workload() == text_workload(device_input)
+    assert workload.io_device is not None and workload.claims is not None
+    p1, p2, p3 = workload.processes()
+    assert p1.burst_pattern[1][1] == ('disk0', 10, 57)
+    assert p2.burst_pattern[1][1] == 7 and p2.burst_pattern[3][1] == ('disk1', 5, None)
+    assert p3.burst_pattern[2][1] == ('disk0', 3, 0)
+    assert (p1.max_claim, p2.max_claim, p3.max_claim) == ((('Buffer', 2),), None, (('R1', 1), ('Buffer', 1)))
+
+    back = str(tmp_path / 'back.txt')
+    binary_to_text(path, back)
+    assert text_workload(back) == text_workload(device_input)
+
+
+def test_directory_is_memory_mapped(tmp_path, device_input):
+    path = str(tmp_path / 'columns')
+    save_workload(parse_input_file(device_input), path)
+    assert isinstance(load_workload(path).ops, np.memmap)
+    assert not isinstance(load_workload(path, mmap=False).ops, np.memmap)
+    assert load_workload(path).to_workload() == load_workload(path, mmap=False).to_workload()
+
+
+def test_resave_drops_stale_optional_columns(tmp_path, device_input):
+    path = str(tmp_path / 'columns')
+    save_workload(parse_input_file(device_input), path)
+    assert os.path.exists(os.path.join(path, 'io_device.npy'))
+
+    plain = os.path.join(REPO_DIR, 'random_input.txt')
+    save_workload(parse_input_file(plain), path)
+    workload = load_workload(path)
+    assert workload.io_device is None and workload.claims is None
+    assert workload.to_workload() == text_workload(plain)
+
+
+def test_save_binary_workload_keeps_columns(tmp_path, device_input):
+    first = str(tmp_path / 'first.npz')
+    save_workload(parse_input_file(device_input), first)
+    second = str(tmp_path / 'second')
+    assert save_workload(load_workload(first), second) == 3
+    assert load_workload(second).to_workload() == load_workload(first).to_workload()
+
+
+def test_stream_runs_like_list(tmp_path):
+    text = os.path.join(REPO_DIR, 'random_input.txt')
+    path = str(tmp_path / 'columns')
+    text_to_binary(text, path)
+    workload = load_workload(path)
+    # 반복은 도착 순 스트림
+    arrivals = [proc.arrival_time for proc in workload]
+    assert arrivals == sorted(arrivals)
+
+    streamed = SimulatorFCFS(iter(workload), tracer=NULL_TRACER,
+                             resources=ResourceManager(SYNC_RESOURCES, tracer=NULL_TRACER))
+    streamed.run()
+    assert snapshot(streamed) == snapshot(run_normal('FCFS', text_workload(text)))
+
+
+def test_missing_or_unknown_version(tmp_path, capsys):
+    assert load_workload(str(tmp_path / 'missing.npz')) is None
+    assert "찾을 수 없습니다" in capsys.readouterr().out
+
+    path = str(tmp_path / 'old.npz')
+    save_workload(parse_input_file(os.path.join(REPO_DIR, 'random_input.txt')), path)
+    with np.load(path) as archive:
+        columns = {name: archive[name] for name in archive.files}
+    columns['version'] = np.array(0)
+    np.savez(path, **columns)
+    assert load_workload(path) is None
+    assert "버전" in capsys.readouterr().out
+    assert binary_to_text(path, str(tmp_path / 'back.txt')) == 0
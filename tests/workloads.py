@@ -0,0 +1,113 @@
+"""
+테스트용 워크로드와 시뮬레이터 생성 함수
+
+- 일반 시뮬레이터 6개는 main.py/monte_carlo.py와 같은 설정(RR Q=4, Aging 10)으로 만듭니다.
+- 모든 시뮬레이터는 NULL_TRACER와 테스트마다 새 ResourceManager로 실행합니다. (전역 자원 상태를 공유하지 않음)
+"""
+import os
+import random
+
+from process import Process, Workload, parse_input_file
+from simulator_fcfs import SimulatorFCFS
+from simulator_rr import SimulatorRR
+from simulator_sjf import SimulatorSJF
+from simulator_priority_static import SimulatorPriorityStatic
+from simulator_priority_dynamic import SimulatorPriorityDynamic
+from simulator_mlfq import SimulatorMLFQ
+from simulator_rm import SimulatorRM
+from simulator_edf import SimulatorEDF
+from sync import ResourceManager
+from tracer import NULL_TRACER
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SYNC_RESOURCES = ["R1", "R2", "Buffer", "Printer", "File"]
+
+# 시나리오 파일 -> 교착상태 전략 (main.py의 SYNC 하위 메뉴와 같음)
+SYNC_SCENARIOS = {
+    'producer_consumer.txt': 'prevention',
+    'deadlock_prevention.txt': 'prevention',
+    'deadlock_avoidance.txt': 'avoidance',
+    'deadlock_detection.txt': 'detection',
+    'deadlock_recovery.txt': 'detection',
+}
+
+NORMAL_SIMULATORS = {
+    'FCFS': lambda procs, **kw: SimulatorFCFS(procs, **kw),
+    'RR(Q=4)': lambda procs, **kw: SimulatorRR(procs, time_quantum=4, **kw),
+    'SJF': lambda procs, **kw: SimulatorSJF(procs, **kw),
+    'Priority(Static)': lambda procs, **kw: SimulatorPriorityStatic(procs, **kw),
+    'Priority(Aging)': lambda procs, **kw: SimulatorPriorityDynamic(procs, aging_factor=10, **kw),
+    'MLFQ': lambda procs, **kw: SimulatorMLFQ(procs, **kw),
+}
+
+REALTIME_SIMULATORS = {
+    'RM': SimulatorRM,
+    'EDF': SimulatorEDF,
+}
+
+
+def load_workload(filename):
+    """저장소의 입력 파일을 Workload로 읽습니다."""
+    processes = parse_input_file(os.path.join(REPO_DIR, filename))
+    assert processes, f"'{filename}'을(를) 읽을 수 없음"
+    return Workload.from_processes(processes)
+
+
+def random_workload(seed, num_processes=12):
+    """시드를 고정한 일반 프로세스 워크로드 (CPU/I-O 버스트 1~4회, 도착 간격 0~6ms)"""
+    rng = random.Random(seed)
+    processes = []
+    arrival = 0
+    for pid in range(1, num_processes + 1):
+        arrival += rng.randint(0, 6)
+        bursts = []
+        for i in range(rng.randint(1, 4)):
+            if i:
+                bursts.append(f"IO:{rng.randint(1, 15)}")
+            bursts.append(f"CPU:{rng.randint(1, 30)}")
+        processes.append(Process(pid, arrival, rng.randint(1, 10), ",".join(bursts)))
+    return Workload.from_processes(processes)
+
+
+def periodic_workload():
+    """주기 4, 6, 10 (하이퍼피리어드 60)의 실시간 작업 집합"""
+    return Workload.from_processes([
+        Process(1, 0, 0, "CPU:1", 4, 4),
+        Process(2, 1, 0, "CPU:2", 6, 6),
+        Process(3, 2, 0, "CPU:3", 10, 10),
+    ])
+
+
+def run_normal(name, workload, strategy='prevention', **kwargs):
+    """일반 시뮬레이터 name을 workload의 새 Process로 실행합니다."""
+    resources = ResourceManager(SYNC_RESOURCES, strategy=strategy, tracer=NULL_TRACER)
+    sim = NORMAL_SIMULATORS[name](workload.instantiate(realtime=False), tracer=NULL_TRACER, resources=resources,
+                                  **kwargs)
+    sim.run()
+    return sim
+
+
+def run_realtime(name, workload, **kwargs):
+    """실시간 시뮬레이터 name을 workload의 새 Process로 실행합니다."""
+    sim = REALTIME_SIMULATORS[name](workload.instantiate(), tracer=NULL_TRACER,
+                                    resources=ResourceManager(tracer=NULL_TRACER), **kwargs)
+    sim.run()
+    return sim
+
+
+def snapshot(sim):
+    """비교용 시뮬레이션 결과 (간트 차트, 완료 프로세스별 시각/대기/타임라인, 통계)"""
+    completed = sorted(
+        (p.pid, p.arrival_time, p.completion_time, p.turnaround_time, p.wait_time,
+         p.ready_wait_time, p.io_wait_time, tuple(p.timeline))
+        for p in sim.completed_processes)
+    return {
+        'gantt_chart': list(sim.gantt_chart),
+        'completed': completed,
+        'current_time': sim.current_time,
+        'context_switches': sim.context_switches,
+        'total_overhead_time': sim.total_overhead_time,
+        'total_cpu_idle_time': sim.total_cpu_idle_time,
+        'stats': sim.stats(),
+    }
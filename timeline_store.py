@@ -0,0 +1,95 @@
+"""
+프로세스 상태 타임라인 저장소 (struct-of-arrays)
+
+프로세스마다 (start, end, state) 튜플 리스트를 두는 대신,
+한 시뮬레이션의 모든 상태 구간을 공유 배열에 한 행씩 저장합니다.
+
+    starts : 시작 시각
+    ends   : 종료 시각 (진행 중이면 OPEN)
+    states : 상태 코드 (process.State: READY / RUNNING / WAITING)
+    prevs  : 같은 프로세스의 직전 구간 행 번호 (없으면 -1)
+
+구간을 닫을 때는 ends[row]만 덮어쓰므로 새 객체를 만들지 않습니다.
+슬롯은 Process 인스턴스마다 발급됩니다. (RM/EDF의 주기 재생성 작업은 PID가 같아도 슬롯이 다름)
+"""
+from array import array
+
+from process import READY, RUNNING, WAITING
+
+OPEN = -1  # 아직 닫히지 않은 구간의 종료 시각
+
+# 상태 코드 -> 상태 이름 ('Ready', 'Running', 'Waiting')
+STATE_NAMES = tuple(state.label for state in (READY, RUNNING, WAITING))
+
+
+class TimelineStore:
+    """
+    한 시뮬레이션의 모든 프로세스 상태 구간
+    """
+    def __init__(self):
+        self.starts = array('i')
+        self.ends = array('i')
+        self.states = array('b')
+        self.prevs = array('i')
+
+        # 슬롯별 마지막 구간 행 번호 (-1: 구간 없음)
+        self.last_rows = array('i')
+
+    def __len__(self):
+        return len(self.starts)
+
+    def register(self):
+        """새 프로세스 슬롯을 발급합니다."""
+        self.last_rows.append(-1)
+        return len(self.last_rows) - 1
+
+    def open(self, slot, time, state):
+        """slot의 새 상태 구간을 time부터 시작합니다."""
+        self.starts.append(time)
+        self.ends.append(OPEN)
+        self.states.append(state)
+        self.prevs.append(self.last_rows[slot])
+        self.last_rows[slot] = len(self.starts) - 1
+
+    def close(self, slot, time):
+        """
+        slot의 진행 중인 구간을 time에 닫습니다.
+
+        :return: 닫힌 구간의 행 번호 (starts/states로 조회). 진행 중인 구간이 없으면 -1
+        """
+        row = self.last_rows[slot]
+        if row < 0 or self.ends[row] != OPEN:
+            return -1
+        self.ends[row] = time
+        return row
+
+    def close_all(self, time):
+        """모든 진행 중인 구간을 time에 닫습니다."""
+        ends = self.ends
+        for row in self.last_rows:
+            if row >= 0 and ends[row] == OPEN:
+                ends[row] = time
+
+    def shift(self, slot, delta):
+        """slot의 모든 구간을 delta만큼 뒤로 옮깁니다. (실시간 정상 상태 외삽용)"""
+        ends = self.ends
+        row = self.last_rows[slot]
+        while row >= 0:
+            self.starts[row] += delta
+            if ends[row] != OPEN:
+                ends[row] += delta
+            row = self.prevs[row]
+
+    def intervals(self, slot):
+        """
+        slot의 상태 구간을 시간순 [(start, end, state)] 리스트로 반환합니다.
+        (진행 중인 구간의 end는 None, state는 'Ready' 등의 상태 이름)
+        """
+        result = []
+        row = self.last_rows[slot]
+        while row >= 0:
+            end = self.ends[row]
+            result.append((self.starts[row], None if end == OPEN else end, STATE_NAMES[self.states[row]]))
+            row = self.prevs[row]
+        result.reverse()
+        return result
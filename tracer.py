@@ -0,0 +1,141 @@
+"""
+시뮬레이션 이벤트 추적 (Trace)
+
+시뮬레이터와 자원(sync.Resource)은 print() 대신 Tracer.emit()으로 이벤트를 남깁니다.
+emit()에는 '메시지 템플릿(상수 문자열)'과 필드 값만 전달되고,
+실제 문자열 포맷팅은 싱크(Sink)가 기록할 때만 수행됩니다.
+(추적 레벨보다 상세한 이벤트나 NullSink에서는 어떤 문자열도 만들지 않습니다.)
+
+싱크 종류:
+    NullSink       : 아무것도 기록하지 않음 (반복 실행용)
+    RingBufferSink : 최근 N개의 이벤트만 메모리에 보관
+    JsonlSink      : 이벤트를 JSON Lines 파일로 기록
+    ConsoleSink    : 기존과 같은 '[Time   t] ...' 형식으로 콘솔에 출력 (기본값)
+"""
+import collections
+import json
+
+# --- 추적 레벨 (값이 클수록 상세) ---
+OFF = 0
+WARN = 1    # 오류, 교착상태, 마감시한 초과
+INFO = 2    # 도착, 선택, 선점, 종료, I/O 등 상태 전이
+DEBUG = 3   # CPU 작업 시작, Lock 시도, 자원 내부 동작
+
+LEVEL_NAMES = {OFF: 'OFF', WARN: 'WARN', INFO: 'INFO', DEBUG: 'DEBUG'}
+
+
+def format_event(time, level, message, fields):
+    """
+    이벤트 하나를 기존 콘솔 출력 형식의 문자열로 변환합니다.
+    """
+    text = message.format(**fields) if fields else message
+    if time is not None:
+        text = f"[Time {time:3d}] {text}"
+    if level == WARN:
+        text = f"!!! {text}"
+    return text
+
+
+class NullSink:
+    """모든 이벤트를 버립니다."""
+    def emit(self, time, level, event, message, fields):
+        pass
+
+    def close(self):
+        pass
+
+
+class RingBufferSink:
+    """
+    최근 capacity개의 이벤트를 (time, level, event, message, fields) 튜플로 보관합니다.
+    """
+    def __init__(self, capacity=1000):
+        self.records = collections.deque(maxlen=capacity)
+
+    def emit(self, time, level, event, message, fields):
+        self.records.append((time, level, event, message, fields))
+
+    def lines(self):
+        """보관 중인 이벤트를 콘솔 형식 문자열 리스트로 반환합니다."""
+        return [format_event(time, level, message, fields)
+                for time, level, event, message, fields in self.records]
+
+    def close(self):
+        pass
+
+
+class JsonlSink:
+    """
+    이벤트를 한 줄에 하나씩 JSON 객체로 기록합니다.
+    e.g., {"time": 3, "level": "INFO", "event": "dispatch", "pid": 1, "wait": 0}
+    """
+    def __init__(self, path):
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def emit(self, time, level, event, message, fields):
+        record = {'time': time, 'level': LEVEL_NAMES[level], 'event': event}
+        record.update(fields)
+        self.file.write(json.dumps(record, ensure_ascii=False))
+        self.file.write("\n")
+
+    def close(self):
+        self.file.close()
+
+
+class ConsoleSink:
+    """이벤트를 콘솔에 출력합니다."""
+    def emit(self, time, level, event, message, fields):
+        print(format_event(time, level, message, fields))
+
+    def close(self):
+        pass
+
+
+class Tracer:
+    """
+    레벨 필터 + 싱크
+
+    :param sink: 이벤트를 받을 싱크 (기본: ConsoleSink)
+    :param level: 기록할 최대 상세 레벨 (기본: DEBUG = 전부 기록)
+    """
+    def __init__(self, sink=None, level=DEBUG):
+        self.sink = sink if sink is not None else ConsoleSink()
+        # NullSink면 레벨 검사 단계에서 바로 걸러지도록 OFF로 고정
+        self.level = OFF if isinstance(self.sink, NullSink) else level
+
+    def enabled(self, level):
+        return level <= self.level
+
+    def emit(self, _level, _time, _event, _message, **fields):
+        """
+        앞의 네 인자는 위치로만 넘깁니다. (밑줄 이름이므로 time, event 같은 이름도 필드로 쓸 수 있음)
+
+        :param _level: WARN / INFO / DEBUG
+        :param _time: 이벤트 시각 (없으면 None)
+        :param _event: 이벤트 종류 (e.g., 'arrival', 'dispatch', 'lock_fail')
+        :param _message: str.format() 템플릿 (필드 이름으로 참조)
+        """
+        if _level <= self.level:
+            self.sink.emit(_time, _level, _event, _message, fields)
+
+    def close(self):
+        self.sink.close()
+
+
+NULL_TRACER = Tracer(NullSink(), OFF)
+
+# --- 시뮬레이터가 별도로 지정하지 않으면 사용할 기본 Tracer ---
+DEFAULT_TRACER = Tracer()
+
+def set_tracer(tracer):
+    """
+    기본 Tracer를 설정합니다. (None이면 추적 끄기)
+    """
+    global DEFAULT_TRACER
+    DEFAULT_TRACER = tracer if tracer is not None else NULL_TRACER
+
+def get_tracer():
+    """
+    현재 기본 Tracer를 반환합니다.
+    """
+    return DEFAULT_TRACER
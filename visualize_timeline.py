@@ -13,7 +13,7 @@ from simulator_mlfq import SimulatorMLFQ
 from simulator_rm import SimulatorRM
 from simulator_edf import SimulatorEDF
 from generator import generate_random_processes
-import copy
+from process import Process, Workload
 
 print("=" * 70)
 print("프로세스 상태 타임라인 시각화")
@@ -32,13 +32,13 @@ general_processes = generate_random_processes(
 )
 
 # 실시간 프로세스 생성 (수동으로 생성)
-from process import Process
 realtime_processes = [
     Process(101, 0, 0, "CPU:5,IO:3,CPU:4", period=23, deadline=20),
     Process(102, 0, 0, "CPU:8,IO:5,CPU:2", period=31, deadline=28)
 ]
 
 processes = general_processes + realtime_processes
+workload = Workload.from_processes(processes)
 print(f"✓ 총 {len(processes)}개 프로세스 생성 완료 (일반: {len(general_processes)}개, 실시간: {len(realtime_processes)}개)")
 
 # Visualizer 초기화
@@ -52,8 +52,8 @@ algorithms = [
     ("Priority (Static)", SimulatorPriorityStatic, {}, False),
     ("Priority (Aging)", SimulatorPriorityDynamic, {"aging_factor": 10}, False),
     ("MLFQ", SimulatorMLFQ, {}, False),
-    ("RM (Rate Monotonic)", SimulatorRM, {}, True),
-    ("EDF (Earliest Deadline First)", SimulatorEDF, {}, True)
+    ("RM (Rate Monotonic)", SimulatorRM, {"max_simulation_time": 200}, True),
+    ("EDF (Earliest Deadline First)", SimulatorEDF, {"max_simulation_time": 200}, True)
 ]
 
 print("\n" + "=" * 70)
@@ -64,10 +64,7 @@ for i, (name, SimulatorClass, kwargs, is_realtime) in enumerate(algorithms, 1):
     print(f"\n[{i}/{len(algorithms)}] {name}...")
     
     # 실시간 알고리즘은 실시간 프로세스만, 일반 알고리즘은 일반 프로세스만 필터링
-    if is_realtime:
-        procs = [p for p in copy.deepcopy(processes) if p.period > 0]
-    else:
-        procs = [p for p in copy.deepcopy(processes) if p.period == 0]
+    procs = workload.instantiate(realtime=is_realtime)
     
     if not procs:
         print(f"   ⚠️ {name}에 적합한 프로세스가 없습니다. 건너뜁니다.")
@@ -1,5 +1,7 @@
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+import matplotlib.colors as mcolors
+from matplotlib.collections import PolyCollection
 import numpy as np
 from matplotlib import font_manager
 import pandas as pd
@@ -51,7 +53,120 @@ class SchedulingVisualizer:
         except:
             # tkinter 실패 시 기본값 (Full HD)
             return 1920, 1080
-    
+
+    # --- 간트 구간 일괄 그리기 ---
+    # 구간마다 barh/text를 호출하면 구간 수만큼 아티스트가 생겨 긴 스케줄(수만 구간)은 그리는 데 몇 분이 걸림.
+    # 모든 구간을 PolyCollection 하나로 그리고, 색상은 PID 배열에서 한 번에 찾으며,
+    # 라벨은 글자가 들어갈 만큼 넓은 구간에만 붙임. (화면 너비가 유한하므로 라벨 수도 유한)
+
+    def _gantt_arrays(self, gantt_chart):
+        """[(pid, start, end), ...] 또는 (n, 3) 배열 -> (pids, starts, ends) NumPy 배열"""
+        if len(gantt_chart) == 0:
+            return np.empty(0, dtype=int), np.empty(0), np.empty(0)
+        segments = np.asarray(gantt_chart, dtype=float).reshape(-1, 3)
+        return segments[:, 0].astype(int), segments[:, 1], segments[:, 2]
+
+    def _pid_colors(self, pids):
+        """PID 배열 -> RGBA 배열 (고유 PID마다 한 번만 self.colors를 찾고, 없으면 회색)"""
+        unique, inverse = np.unique(pids, return_inverse=True)
+        palette = np.array([mcolors.to_rgba(self.colors.get(pid, '#CCCCCC')) for pid in unique.tolist()]).reshape(-1, 4)
+        return palette[inverse.reshape(-1)]
+
+    def _draw_segments(self, ax, starts, ends, rows, height, facecolors, **kwargs):
+        """
+        [start, end] 구간들을 y 좌표 rows 위의 막대로 한 번에 그립니다. (barh를 구간마다 호출한 것과 같은 모양)
+
+        :param rows: 구간별 y 좌표 배열 또는 모든 구간에 공통인 값
+        :param facecolors: 구간별 색상 배열 또는 공통 색상
+        """
+        rows = np.broadcast_to(np.asarray(rows, dtype=float), np.shape(starts))
+        bottom, top = rows - height / 2, rows + height / 2
+        verts = np.stack([
+            np.column_stack([starts, bottom]), np.column_stack([starts, top]),
+            np.column_stack([ends, top]), np.column_stack([ends, bottom]),
+        ], axis=1)
+        kwargs.setdefault('edgecolors', 'black')
+        kwargs.setdefault('linewidths', 0.5)
+        collection = PolyCollection(verts, facecolors=facecolors, **kwargs)
+        if len(starts):
+            collection.sticky_edges.x.append(np.min(starts))  # barh처럼 왼쪽 끝에 여백을 두지 않음
+        ax.add_collection(collection)
+        ax.autoscale_view()
+        return collection
+
+    def _coalesce_segments(self, ax, pids, starts, ends, rows):
+        """
+        화면에서 1픽셀보다 좁은 구간들을 행마다 픽셀 열 하나당 구간 하나로 합칩니다.
+
+        합친 구간은 그 열에서 가장 오래 실행된 PID의 색으로 그립니다. (1픽셀 이상인 구간은 그대로)
+        그려지는 다각형 수가 구간 수가 아니라 축의 픽셀 너비에 비례하게 됩니다.
+        """
+        rows = np.broadcast_to(np.asarray(rows, dtype=float), np.shape(starts))
+        if len(starts) < 2:
+            return pids, starts, ends, rows
+        x_min, x_max = starts.min(), ends.max()
+        axis_px = ax.get_window_extent().width
+        if x_max <= x_min or axis_px <= 0:
+            return pids, starts, ends, rows
+        ms_per_px = (x_max - x_min) / axis_px
+        narrow = (ends - starts) < ms_per_px
+        if np.count_nonzero(narrow) < 2:
+            return pids, starts, ends, rows
+
+        # 좁은 구간을 (행, 픽셀 열) 그룹으로 정렬
+        n_pids, n_starts, n_ends, n_rows = pids[narrow], starts[narrow], ends[narrow], rows[narrow]
+        columns = np.floor((n_starts - x_min) / ms_per_px)
+        order = np.lexsort((n_starts, columns, n_rows))
+        n_pids, n_starts, n_ends, n_rows, columns = (a[order] for a in (n_pids, n_starts, n_ends, n_rows, columns))
+        first = np.flatnonzero(np.r_[True, (np.diff(n_rows) != 0) | (np.diff(columns) != 0)])
+        group = np.repeat(np.arange(len(first)), np.diff(np.r_[first, len(n_pids)]))
+
+        # 그룹별로 실행 시간 합이 가장 큰 PID
+        by_pid = np.lexsort((n_pids, group))
+        key_first = np.flatnonzero(np.r_[True, (np.diff(group[by_pid]) != 0) | (np.diff(n_pids[by_pid]) != 0)])
+        totals = np.add.reduceat((n_ends - n_starts)[by_pid], key_first)
+        key_group, key_pid = group[by_pid][key_first], n_pids[by_pid][key_first]
+        best = np.lexsort((-totals, key_group))
+        winner = best[np.r_[True, np.diff(key_group[best]) != 0]]
+
+        wide = ~narrow
+        return (np.concatenate([pids[wide], key_pid[winner]]),
+                np.concatenate([starts[wide], np.minimum.reduceat(n_starts, first)]),
+                np.concatenate([ends[wide], np.maximum.reduceat(n_ends, first)]),
+                np.concatenate([rows[wide], n_rows[first]]))
+
+    def _draw_gantt(self, ax, pids, starts, ends, rows, height):
+        """간트 구간을 PID 색상으로 그립니다. (1픽셀보다 좁은 구간은 합쳐서)"""
+        pids, starts, ends, rows = self._coalesce_segments(ax, pids, starts, ends, rows)
+        return self._draw_segments(ax, starts, ends, rows, height, self._pid_colors(pids))
+
+    def _label_segments(self, ax, pids, starts, ends, row, fontsize, min_duration=2):
+        """
+        라벨(P<pid>)이 들어갈 만큼 넓은 구간에만 라벨을 붙입니다.
+
+        기존 기준(길이 > min_duration ms)에 더해, 현재 x축 범위에서 구간의 화면 너비가 라벨 글자 너비 이상이어야 합니다.
+        (figure 배치와 x축 범위가 정해진 뒤 호출)
+        """
+        if len(pids) == 0:
+            return
+        x_min, x_max = ax.get_xlim()
+        axis_px = ax.get_window_extent().width
+        if x_max <= x_min or axis_px <= 0:
+            return
+        px_per_ms = axis_px / (x_max - x_min)
+        chars = 2 + np.floor(np.log10(np.maximum(pids, 1)))  # 'P' + 자릿수
+        label_px = chars * fontsize * 0.7 * ax.figure.dpi / 72  # 굵은 글꼴의 대략적인 글자 너비
+        durations = ends - starts
+        visible = (durations > min_duration) & (durations * px_per_ms >= label_px) & (ends > x_min) & (starts < x_max)
+        centers = (starts + ends) / 2
+        for pid, center in zip(pids[visible].tolist(), centers[visible].tolist()):
+            ax.text(center, row, f'P{pid}', ha='center', va='center', fontsize=fontsize, fontweight='bold')
+
+    def _pid_legend(self, pids):
+        """PID별 색상 범례 항목"""
+        return [mpatches.Patch(facecolor=self.colors.get(pid, '#CCCCCC'), edgecolor='black', label=f'P{pid}')
+                for pid in np.unique(pids).tolist()]
+
     def visualize_gantt_chart(self, gantt_chart, algorithm_name, save_path=None):
         """
         Visualize Gantt chart
@@ -63,20 +178,12 @@ class SchedulingVisualizer:
         """
         # Auto-adjust figure size based on screen
         fig, ax = plt.subplots(figsize=(self.fig_width * 0.95, self.fig_height * 0.6))
-        
-        # Show execution segments per process
+
+        # Show execution segments per process (one collection for all segments)
         y_pos = 0
-        for pid, start, end in gantt_chart:
-            color = self.colors.get(pid, '#CCCCCC')
-            ax.barh(y_pos, end - start, left=start, height=0.6, 
-                   color=color, edgecolor='black', linewidth=0.5)
-            
-            # Show process ID
-            duration = end - start
-            if duration > 2:  # Show inside if wide enough
-                ax.text(start + duration/2, y_pos, f'P{pid}', 
-                       ha='center', va='center', fontsize=9, fontweight='bold')
-        
+        pids, starts, ends = self._gantt_arrays(gantt_chart)
+        self._draw_gantt(ax, pids, starts, ends, y_pos, 0.6)
+
         # Set axes with larger fonts
         ax.set_xlabel('시간 (ms)', fontsize=13)
         ax.set_ylabel('CPU', fontsize=13)
@@ -89,14 +196,14 @@ class SchedulingVisualizer:
         ax.grid(axis='x', alpha=0.3, linestyle='--')
         
         # Add legend
-        legend_elements = [mpatches.Patch(facecolor=self.colors.get(i, '#CCCCCC'), 
-                                         edgecolor='black', label=f'P{i}') 
-                          for i in sorted(set(pid for pid, _, _ in gantt_chart))]
-        ax.legend(handles=legend_elements, loc='upper right', ncol=6, fontsize=10)
-        
+        ax.legend(handles=self._pid_legend(pids), loc='upper right', ncol=6, fontsize=10)
+
         # Better layout spacing
         plt.subplots_adjust(left=0.05, right=0.98, top=0.93, bottom=0.08)
-        
+
+        # Show process ID inside segments wide enough to read
+        self._label_segments(ax, pids, starts, ends, y_pos, fontsize=9)
+
         if save_path:
             plt.savefig(save_path, dpi=300, bbox_inches='tight', pad_inches=0.3)
         else:
@@ -353,7 +460,8 @@ class SchedulingVisualizer:
                     'avg_turnaround': float,
                     'avg_waiting': float,
                     'cpu_utilization': float,
-                    'context_switches': int
+                    'context_switches': int,
+                    'tails': {'waiting': {'p50', 'p95', 'p99'}, 'response': {...}}  # (선택) 꼬리 지연
                 }
             }
             save_path: Save path
@@ -364,8 +472,12 @@ class SchedulingVisualizer:
         cpu_util = [results_dict[alg]['cpu_utilization'] for alg in algorithms]
         ctx_sw = [results_dict[alg]['context_switches'] for alg in algorithms]
         
+        # 모든 알고리즘에 꼬리 지연(tails)이 있으면 대기/응답 시간 백분위 그래프 2개를 추가 (2x3)
+        tails = [results_dict[alg].get('tails') for alg in algorithms]
+        show_tails = all(tails)
+        
         # Auto-adjust figure size based on screen (2x2 grid)
-        fig, axes = plt.subplots(2, 2, figsize=(self.fig_width * 0.95, self.fig_height * 0.85))
+        fig, axes = plt.subplots(2, 3 if show_tails else 2, figsize=(self.fig_width * 0.95, self.fig_height * 0.85))
         axes = axes.flatten()
         
         # Average turnaround time
@@ -404,6 +516,21 @@ class SchedulingVisualizer:
         for i, v in enumerate(ctx_sw):
             axes[3].text(i, v + max(ctx_sw)*0.02 if max(ctx_sw) > 0 else 0.5, f'{v}', ha='center', fontsize=10)
         
+        # Tail latency (p50 / p95 / p99)
+        if show_tails:
+            x = np.arange(len(algorithms))
+            width = 0.25
+            for ax, metric, title in ((axes[4], 'waiting', '대기시간 백분위'), (axes[5], 'response', '응답시간 백분위')):
+                for k, (p, color) in enumerate((('p50', '#4ECDC4'), ('p95', '#FFA07A'), ('p99', '#FF6B6B'))):
+                    ax.bar(x + (k - 1) * width, [t[metric][p] for t in tails], width,
+                           label=p, color=color, edgecolor='black')
+                ax.set_xticks(x)
+                ax.set_xticklabels(algorithms)
+                ax.set_ylabel('시간 (ms)', fontsize=13)
+                ax.set_title(title, fontsize=15, fontweight='bold', pad=20)
+                ax.grid(axis='y', alpha=0.3)
+                ax.legend(fontsize=10)
+        
         # Rotate x-axis labels for better visibility
         for ax in axes:
             ax.tick_params(axis='x', rotation=15, labelsize=11)
@@ -604,22 +731,14 @@ class SchedulingVisualizer:
         if n_algorithms == 1:
             axes = [axes]
         
-        for idx, (algo_name, gantt_chart) in enumerate(gantt_data_dict.items()):
+        segments = {algo_name: self._gantt_arrays(gantt_chart) for algo_name, gantt_chart in gantt_data_dict.items()}
+        for idx, (algo_name, (pids, starts, ends)) in enumerate(segments.items()):
             ax = axes[idx]
-            
-            # Show execution segments per process
+
+            # Show execution segments per process (one collection for all segments)
             y_pos = 0
-            for pid, start, end in gantt_chart:
-                color = self.colors.get(pid, '#CCCCCC')
-                ax.barh(y_pos, end - start, left=start, height=0.6, 
-                       color=color, edgecolor='black', linewidth=0.5)
-                
-                # Show process ID
-                duration = end - start
-                if duration > 2:  # Show inside if wide enough
-                    ax.text(start + duration/2, y_pos, f'P{pid}', 
-                           ha='center', va='center', fontsize=8, fontweight='bold')
-            
+            self._draw_gantt(ax, pids, starts, ends, y_pos, 0.6)
+
             # Set axes
             ax.set_ylabel(algo_name, fontsize=11, fontweight='bold', rotation=0, 
                          ha='right', va='center')
@@ -634,21 +753,19 @@ class SchedulingVisualizer:
             
             # Add legend only on first chart
             if idx == 0:
-                all_pids = set()
-                for algo_data in gantt_data_dict.values():
-                    all_pids.update(pid for pid, _, _ in algo_data)
-                
-                legend_elements = [mpatches.Patch(facecolor=self.colors.get(i, '#CCCCCC'), 
-                                                 edgecolor='black', label=f'P{i}') 
-                                  for i in sorted(all_pids)]
-                ax.legend(handles=legend_elements, loc='upper right', ncol=8, fontsize=9)
-        
+                all_pids = np.concatenate([pids for pids, _, _ in segments.values()])
+                ax.legend(handles=self._pid_legend(all_pids), loc='upper right', ncol=8, fontsize=9)
+
         # Main title
         fig.suptitle('전체 알고리즘 간트 차트 비교', fontsize=16, fontweight='bold')
-        
+
         # Better layout spacing
         plt.subplots_adjust(left=0.12, right=0.96, top=0.94, bottom=0.06, hspace=0.4)
-        
+
+        # Show process ID inside segments wide enough to read
+        for ax, (pids, starts, ends) in zip(axes, segments.values()):
+            self._label_segments(ax, pids, starts, ends, 0, fontsize=8)
+
         if save_path:
             plt.savefig(save_path, dpi=300, bbox_inches='tight', pad_inches=0.5)
         else:
@@ -675,29 +792,24 @@ class SchedulingVisualizer:
         """
         # 실시간 스케줄링인 경우 간트 차트를 100ms로 제한
         is_realtime = algorithm_name in ['Rate Monotonic', 'EDF']
+        all_pids, all_starts, all_ends = self._gantt_arrays(gantt_chart)
         if is_realtime:
-            gantt_chart_display = [(pid, start, end) for pid, start, end in gantt_chart if start < 100]
+            shown = all_starts < 100
+            pids, starts, ends = all_pids[shown], all_starts[shown], all_ends[shown]
             max_time = 100
         else:
-            gantt_chart_display = gantt_chart
-            max_time = max(end for _, _, end in gantt_chart) if gantt_chart else 0
-        
+            pids, starts, ends = all_pids, all_starts, all_ends
+            max_time = ends.max() if len(ends) else 0
+
         # Create figure with 3 rows - optimized heights
         fig = plt.figure(figsize=(self.fig_width * 0.95, self.fig_height * 0.80))
         gs = fig.add_gridspec(3, 1, height_ratios=[0.5, 1, 1.1], hspace=0.35)
-        
-        # 1. Gantt Chart (top) - much smaller
+
+        # 1. Gantt Chart (top) - much smaller (one collection for all segments)
         ax1 = fig.add_subplot(gs[0])
         y_pos = 0
-        for pid, start, end in gantt_chart_display:
-            color = self.colors.get(pid, '#CCCCCC')
-            ax1.barh(y_pos, end - start, left=start, height=0.4, 
-                   color=color, edgecolor='black', linewidth=0.5)
-            duration = end - start
-            if duration > 2:
-                ax1.text(start + duration/2, y_pos, f'P{pid}', 
-                       ha='center', va='center', fontsize=7, fontweight='bold')
-        
+        self._draw_gantt(ax1, pids, starts, ends, y_pos, 0.4)
+
         ax1.set_xlabel('시간 (ms)', fontsize=10)
         ax1.set_ylabel('CPU', fontsize=9)
         title_suffix = ' (처음 100ms)' if is_realtime else ''
@@ -709,59 +821,55 @@ class SchedulingVisualizer:
         if is_realtime:
             ax1.set_xlim(0, max_time)
         
-        legend_elements = [mpatches.Patch(facecolor=self.colors.get(i, '#CCCCCC'), 
-                                         edgecolor='black', label=f'P{i}') 
-                          for i in sorted(set(pid for pid, _, _ in gantt_chart))]
-        ax1.legend(handles=legend_elements, loc='upper right', ncol=8, fontsize=7)
-        
+        ax1.legend(handles=self._pid_legend(all_pids), loc='upper right', ncol=8, fontsize=7)
+
         # 2. Process Timeline (middle)
         ax2 = fig.add_subplot(gs[1])
-        
+
         # 실시간 스케줄링인 경우 고유 PID만 표시
         if is_realtime:
-            unique_pids = sorted(set(p.pid for p in completed_processes))
-            processes_display = [next(p for p in completed_processes if p.pid == pid) for pid in unique_pids]
+            first_instance = {}
+            for p in completed_processes:
+                first_instance.setdefault(p.pid, p)
+            processes_display = [first_instance[pid] for pid in sorted(first_instance)]
         else:
             processes_display = sorted(completed_processes, key=lambda p: p.pid)
-        
-        for i, proc in enumerate(processes_display):
-            y_pos = i
-            
-            # 실시간인 경우 100ms 이내만 표시
-            if is_realtime:
-                proc_executions = [(start, end) for pid, start, end in gantt_chart if pid == proc.pid and start < 100]
-                
-                # 실시간 프로세스: 각 주기의 도착점과 종료점 표시
-                if proc.period > 0:
-                    # completed_processes에서 해당 PID의 모든 주기 정보 가져오기
-                    pid_instances = [p for p in completed_processes if p.pid == proc.pid and p.arrival_time < 100]
-                    
-                    for idx, instance in enumerate(pid_instances):
-                        # 도착점 (초록색)
-                        ax2.plot(instance.arrival_time, y_pos, 'go', markersize=6, 
-                               label='도착' if i == 0 and idx == 0 else '')
-                        
-                        # 종료점 (빨간색) - 100ms 이내인 경우만
-                        if instance.completion_time <= 100:
-                            ax2.plot(instance.completion_time, y_pos, 'ro', markersize=6, 
-                                   label='종료' if i == 0 and idx == 0 else '')
-                else:
-                    # 비실시간 프로세스
-                    ax2.plot(proc.arrival_time, y_pos, 'go', markersize=6, label='도착' if i == 0 else '')
-            else:
-                proc_executions = [(start, end) for pid, start, end in gantt_chart if pid == proc.pid]
-                ax2.plot(proc.arrival_time, y_pos, 'go', markersize=6, label='도착' if i == 0 else '')
-            
-            for start, end in proc_executions:
-                ax2.barh(y_pos, end - start, left=start, height=0.25, 
-                       color=self.colors.get(proc.pid, '#CCCCCC'), 
-                       edgecolor='black', linewidth=0.5)
-            
-            if not is_realtime:
-                ax2.plot(proc.completion_time, y_pos, 'ro', markersize=6, label='종료' if i == 0 else '')
-                ax2.barh(y_pos, proc.turnaround_time, left=proc.arrival_time, height=0.5, 
-                       color='lightgray', alpha=0.25, edgecolor='gray', linestyle='--', linewidth=0.8)
-        
+        display_pids = np.array([proc.pid for proc in processes_display], dtype=int)
+        row_of = {pid: i for i, pid in reversed(list(enumerate(display_pids.tolist())))}
+
+        # 도착점(초록색)과 종료점(빨간색)을 각각 한 번에 그림
+        arrivals, completions = [], []
+        if is_realtime:
+            # 실시간 프로세스: 각 주기의 도착점과 100ms 이내의 종료점, 비주기 프로세스는 도착점만
+            periodic = {proc.pid for proc in processes_display if proc.period > 0}
+            for proc in processes_display:
+                if proc.pid not in periodic:
+                    arrivals.append((proc.arrival_time, row_of[proc.pid]))
+            for instance in completed_processes:
+                if instance.pid in periodic and instance.arrival_time < 100:
+                    arrivals.append((instance.arrival_time, row_of[instance.pid]))
+                    if instance.completion_time <= 100:
+                        completions.append((instance.completion_time, row_of[instance.pid]))
+        else:
+            arrivals = [(proc.arrival_time, i) for i, proc in enumerate(processes_display)]
+            completions = [(proc.completion_time, i) for i, proc in enumerate(processes_display)]
+
+        # 프로세스별 실행 구간 (표시하는 프로세스의 구간만, 행 번호는 정렬된 PID 배열에서 이진 탐색)
+        rows = np.searchsorted(display_pids, pids)
+        on_row = rows < len(display_pids)
+        on_row[on_row] = display_pids[rows[on_row]] == pids[on_row]
+        self._draw_gantt(ax2, pids[on_row], starts[on_row], ends[on_row], rows[on_row], 0.25)
+        if not is_realtime:
+            # 도착~종료 구간 (반환 시간) 배경
+            self._draw_segments(ax2, np.array([proc.arrival_time for proc in processes_display], dtype=float),
+                                np.array([proc.completion_time for proc in processes_display], dtype=float),
+                                np.arange(len(processes_display)), 0.5, 'lightgray',
+                                alpha=0.25, edgecolors='gray', linestyles='--', linewidths=0.8)
+        if arrivals:
+            ax2.plot(*zip(*arrivals), 'go', markersize=6, label='도착')
+        if completions:
+            ax2.plot(*zip(*completions), 'ro', markersize=6, label='종료')
+
         ax2.set_xlabel('시간 (ms)', fontsize=10)
         ax2.set_ylabel('프로세스', fontsize=10)
         title_suffix = ' (처음 100ms)' if is_realtime else ''
@@ -843,6 +951,9 @@ class SchedulingVisualizer:
         # NO main title - removed!
         # Adjust layout with more bottom space
         plt.subplots_adjust(left=0.05, right=0.97, top=0.96, bottom=0.06)
+
+        # 글자가 들어갈 만큼 넓은 구간에만 PID 표시 (x축 범위와 배치가 정해진 뒤)
+        self._label_segments(ax1, pids, starts, ends, 0, fontsize=7)
         
         if save_path:
             plt.savefig(save_path, dpi=300, bbox_inches='tight', pad_inches=0.4)
@@ -976,9 +1087,13 @@ class SchedulingVisualizer:
         
         for i, proc in enumerate(processes):
             y_pos = i
+            timeline = proc.timeline  # TimelineStore에서 한 번만 읽어 옴
+            seen_states = set()
             
             # 타임라인의 각 상태 구간을 그림
-            for start_time, end_time, state in proc.timeline:
+            for start_time, end_time, state in timeline:
+                first_of_state = state not in seen_states
+                seen_states.add(state)
                 if end_time is None:
                     continue  # 종료되지 않은 상태는 건너뜀
                 
@@ -990,7 +1105,7 @@ class SchedulingVisualizer:
                 
                 ax.barh(y_pos, duration, left=start_time, height=0.6,
                        color=color, edgecolor='black', linewidth=0.5,
-                       label=state if i == 0 and state not in [s for _, _, s in proc.timeline[:proc.timeline.index((start_time, end_time, state))]] else '')
+                       label=state if i == 0 and first_of_state else '')
             
             # 도착 시간 표시
             ax.plot(proc.arrival_time, y_pos, 'go', markersize=6, zorder=5)
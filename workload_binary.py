@@ -0,0 +1,241 @@
+"""
+바이너리 열(column) 형식 워크로드
+
+텍스트 입력 파일('1,0,3,"CPU:5,IO:10",0,0')은 줄마다 정규식 매칭과 버스트 문자열 분리가 필요합니다.
+이 형식은 같은 내용을 NumPy 배열 열로 저장하므로, 읽을 때 파싱이 없습니다.
+
+    프로세스 열 (길이 N) : pid, arrival, priority, period, deadline (int64)
+    offsets (길이 N+1)   : 프로세스 i의 버스트 구간 [offsets[i], offsets[i+1])
+    버스트 열 (길이 B)   : ops (int8, process.Op)
+                           operands (int64, CPU/IO: 시간, LOCK/UNLOCK: names 인덱스)
+                           io_device, io_track (int32, 장치 I/O가 있을 때만, -1: 없음)
+    names                : 자원/장치 이름 표
+    claims               : 프로세스별 max_claim 문자열 ("R1:1,R2:1", 없으면 "", 지정된 프로세스가 있을 때만)
+
+저장 위치:
+    'xxx.npz'   : 열들을 묶은 파일 하나 (np.savez, 읽을 때 각 열을 메모리로 읽음)
+    그 밖의 경로 : 열마다 .npy 파일을 둔 디렉터리 (np.load(mmap_mode='r')로 메모리 매핑하므로
+                  버스트 수와 관계없이 바로 열리고, 실제 데이터는 접근할 때 페이지 단위로 읽힘)
+
+BinaryWorkload는 Process를 한꺼번에 만들지 않습니다.
+반복하면 도착 순으로 Process를 하나씩 만들어 주므로 시뮬레이터에 그대로 넘길 수 있습니다. (-> arrival_queue.ArrivalQueue)
+"""
+import os
+
+import numpy as np
+
+from process import (Process, ProcessSpec, Workload, IORequest, Op, LOCK, UNLOCK,
+                     parse_claims, format_input_line, iter_input_file)
+
+FORMAT_VERSION = 1
+
+PROCESS_COLUMNS = ('pid', 'arrival', 'priority', 'period', 'deadline')
+OPTIONAL_COLUMNS = ('io_device', 'io_track', 'claims')
+
+OPS = tuple(Op)  # 정수 코드 -> Op
+
+
+def to_columns(processes):
+    """
+    Process 반복자(리스트, 제너레이터, Workload)를 열 딕셔너리로 변환합니다.
+    """
+    if isinstance(processes, Workload):
+        processes = processes.instantiate()
+
+    rows = {name: [] for name in PROCESS_COLUMNS}
+    offsets = [0]
+    ops, operands, devices, tracks, claims = [], [], [], [], []
+    names = {}  # 이름 -> names 인덱스
+
+    for proc in processes:
+        rows['pid'].append(proc.pid)
+        rows['arrival'].append(proc.arrival_time)
+        rows['priority'].append(proc.static_priority)
+        rows['period'].append(proc.period)
+        rows['deadline'].append(proc.deadline)
+        claims.append(",".join(f"{name}:{count}" for name, count in proc.max_claim) if proc.max_claim else "")
+
+        for op, value in proc.burst_pattern:
+            ops.append(op)
+            device = track = -1
+            if op is LOCK or op is UNLOCK:
+                value = names.setdefault(value, len(names))
+            elif isinstance(value, IORequest):
+                device = names.setdefault(value.device, len(names))
+                track = -1 if value.track is None else value.track
+                value = value.duration
+            operands.append(value)
+            devices.append(device)
+            tracks.append(track)
+        offsets.append(len(ops))
+
+    columns = {name: np.array(values, dtype=np.int64) for name, values in rows.items()}
+    columns['offsets'] = np.array(offsets, dtype=np.int64)
+    columns['ops'] = np.array(ops, dtype=np.int8)
+    columns['operands'] = np.array(operands, dtype=np.int64)
+    columns['names'] = np.array(list(names), dtype=str) if names else np.array([], dtype='<U1')
+    if any(device >= 0 for device in devices):
+        columns['io_device'] = np.array(devices, dtype=np.int32)
+        columns['io_track'] = np.array(tracks, dtype=np.int32)
+    if any(claims):
+        columns['claims'] = np.array(claims, dtype=str)
+    columns['version'] = np.array(FORMAT_VERSION)
+    return columns
+
+
+def save_workload(processes, path):
+    """
+    워크로드를 바이너리 형식으로 저장합니다.
+
+    :param processes: Process 반복자, Workload 또는 BinaryWorkload (열을 그대로 저장)
+    :param path: 'xxx.npz'이면 파일 하나, 그 밖에는 열별 .npy 파일을 담을 디렉터리
+    :return: 저장한 프로세스 수
+    """
+    if isinstance(processes, BinaryWorkload):
+        columns = processes.columns
+    else:
+        columns = to_columns(processes)
+    if path.endswith('.npz'):
+        np.savez(path, **columns)
+    else:
+        os.makedirs(path, exist_ok=True)
+        for name in OPTIONAL_COLUMNS:  # 이전에 저장된 선택 열이 남지 않도록
+            stale = os.path.join(path, f"{name}.npy")
+            if name not in columns and os.path.exists(stale):
+                os.remove(stale)
+        for name, array in columns.items():
+            np.save(os.path.join(path, f"{name}.npy"), array)
+    return len(columns['pid'])
+
+
+def load_workload(path, mmap=True):
+    """
+    바이너리 형식 워크로드를 엽니다. (프로세스는 아직 만들지 않음)
+
+    :param path: save_workload로 저장한 .npz 파일 또는 디렉터리
+    :param mmap: 디렉터리 형식일 때 메모리 매핑 여부 (False면 전부 메모리로 읽음)
+    :return: BinaryWorkload (파일이 없거나 형식이 다르면 오류 메시지 후 None)
+    """
+    try:
+        if os.path.isdir(path):
+            columns = {}
+            for name in PROCESS_COLUMNS + ('offsets', 'ops', 'operands', 'names', 'version') + OPTIONAL_COLUMNS:
+                file = os.path.join(path, f"{name}.npy")
+                if name in OPTIONAL_COLUMNS and not os.path.exists(file):
+                    continue
+                columns[name] = np.load(file, mmap_mode='r' if mmap else None)
+        else:
+            with np.load(path) as archive:
+                columns = {name: archive[name] for name in archive.files}
+    except FileNotFoundError:
+        print(f"오류: '{path}' 워크로드를 찾을 수 없습니다!")
+        return None
+    except (OSError, ValueError) as e:
+        print(f"오류: '{path}' 워크로드를 읽을 수 없습니다. ({e})")
+        return None
+
+    if int(columns.get('version', -1)) != FORMAT_VERSION:
+        print(f"오류: '{path}'은(는) 지원하지 않는 워크로드 형식 버전입니다.")
+        return None
+    return BinaryWorkload(columns)
+
+
+class BinaryWorkload:
+    """
+    열 형식으로 읽은 워크로드 (필요할 때 Process를 만듦)
+    """
+    def __init__(self, columns):
+        self.columns = columns
+        self.pid = columns['pid']
+        self.arrival = columns['arrival']
+        self.priority = columns['priority']
+        self.period = columns['period']
+        self.deadline = columns['deadline']
+        self.offsets = columns['offsets']
+        self.ops = columns['ops']
+        self.operands = columns['operands']
+        self.io_device = columns.get('io_device')
+        self.io_track = columns.get('io_track')
+        self.claims = columns.get('claims')
+        self.names = [str(name) for name in columns['names']]
+
+    def __len__(self):
+        return len(self.pid)
+
+    @property
+    def num_bursts(self):
+        return len(self.ops)
+
+    def bursts(self, i):
+        """i번째 프로세스의 버스트 튜플 ((Op, 값), ...)"""
+        start, end = int(self.offsets[i]), int(self.offsets[i + 1])
+        ops = self.ops[start:end].tolist()
+        operands = self.operands[start:end].tolist()
+        devices = self.io_device[start:end].tolist() if self.io_device is not None else None
+        names = self.names
+
+        bursts = []
+        for k, code in enumerate(ops):
+            op, value = OPS[code], operands[k]
+            if op is LOCK or op is UNLOCK:
+                value = names[value]
+            elif devices is not None and devices[k] >= 0:
+                track = int(self.io_track[start + k])
+                value = IORequest(names[devices[k]], value, None if track < 0 else track)
+            bursts.append((op, value))
+        return tuple(bursts)
+
+    def max_claim(self, i):
+        if self.claims is None or not self.claims[i]:
+            return None
+        return parse_claims(int(self.pid[i]), str(self.claims[i]))
+
+    def process(self, i):
+        """i번째(저장 순서) 프로세스를 새 Process로 만듭니다."""
+        return Process(int(self.pid[i]), int(self.arrival[i]), int(self.priority[i]), self.bursts(i),
+                       int(self.period[i]), int(self.deadline[i]), self.max_claim(i))
+
+    def arrival_order(self):
+        """도착 시각(같으면 PID) 순서의 프로세스 인덱스"""
+        return np.lexsort((self.pid, self.arrival))
+
+    def __iter__(self):
+        """도착 순으로 Process를 하나씩 만듭니다. (시뮬레이터에 스트림으로 넘길 수 있음)"""
+        for i in self.arrival_order().tolist():
+            yield self.process(i)
+
+    def processes(self):
+        """저장 순서의 Process 리스트"""
+        return [self.process(i) for i in range(len(self))]
+
+    def to_workload(self):
+        """불변 Workload로 변환합니다. (저장 순서)"""
+        return Workload(tuple(ProcessSpec(int(self.pid[i]), int(self.arrival[i]), int(self.priority[i]), self.bursts(i),
+                                          int(self.period[i]), int(self.deadline[i]), self.max_claim(i))
+                              for i in range(len(self))))
+
+
+def text_to_binary(text_filename, path):
+    """
+    텍스트 입력 파일을 바이너리 형식으로 변환합니다.
+    :return: 변환한 프로세스 수
+    """
+    count = save_workload(iter_input_file(text_filename), path)
+    print(f"[워크로드 변환] '{text_filename}' -> '{path}' (프로세스 {count}개)")
+    return count
+
+
+def binary_to_text(path, text_filename):
+    """
+    바이너리 형식 워크로드를 텍스트 입력 파일로 변환합니다. (저장 순서 유지)
+    :return: 변환한 프로세스 수 (읽기 실패 시 0)
+    """
+    workload = load_workload(path)
+    if workload is None:
+        return 0
+    with open(text_filename, 'w', encoding='utf-8') as f:
+        f.write("# 형식: PID,생성시간,우선순위,실행패턴,[주기,마감시한]\n")
+        for i in range(len(workload)):
+            f.write(format_input_line(workload.process(i)) + "\n")
+    print(f"[워크로드 변환] '{path}' -> '{text_filename}' (프로세스 {len(workload)}개)")
+    return len(workload)